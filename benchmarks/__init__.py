@@ -0,0 +1 @@
+# Benchmarks for query generation and upload paths. Run with: python -m benchmarks.run
@@ -0,0 +1,374 @@
+"""Benchmark runner for the neo4j_uploader query generation and upload paths.
+
+Usage:
+    python -m benchmarks.run                      # Run and compare against stored baselines
+    python -m benchmarks.run --update-baseline    # Run and overwrite stored baselines
+    python -m benchmarks.run --filter deduped     # Only run cases whose name contains 'deduped'
+
+Each case is timed over several repeats (best run is kept) and then run once more under
+tracemalloc to capture peak memory. Results are compared with benchmarks/baselines.json and
+the process exits with status 1 if throughput dropped or peak memory grew by more than the
+allowed tolerance.
+"""
+
+from neo4j_uploader.fake_driver import FakeNeo4j
+from neo4j_uploader._queries import (
+    properties,
+    node_elements,
+    relationship_elements,
+    deduped,
+    chunked_query,
+)
+from neo4j_uploader.models import GraphData, Neo4jConfig, Nodes, NullPolicy, TargetNode
+from neo4j_uploader.synthetic import (
+    SyntheticGraphConfig,
+    iter_node_records,
+    iter_relationship_records,
+    iter_specifications,
+)
+from typing import Callable
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+# Benchmark matrix
+RECORD_COUNTS = [1_000, 10_000]
+PROPERTY_WIDTHS = [5, 25]
+DUPLICATE_RATIOS = [0.0, 0.5]
+
+# Batch sizes of the element assembly scaling cases, and the allowed growth of per record time between the smallest and largest
+SCALING_COUNTS = [1_000, 10_000, 100_000]
+SCALING_TOLERANCE = 2.0
+
+CONFIG = Neo4jConfig(
+    neo4j_uri="bolt://localhost:7687",
+    neo4j_password="password",
+    max_batch_size=500,
+)
+
+# Default sentinels plus common placeholders, and string checks switched off
+CUSTOM_NULL_POLICY = NullPolicy(sentinels=["none", "null", "empty", "", "n/a", "-"])
+DISABLED_NULL_POLICY = NullPolicy(enabled=False)
+
+FROM_NODE = TargetNode(record_key="_from_uid", node_key="uid", node_label="Label0")
+TO_NODE = TargetNode(record_key="_to_uid", node_key="uid", node_label="Label0")
+
+
+class Case:
+    """A single benchmark case.
+
+    Args:
+        name (str): Unique, stable identifier used to look up baselines.
+        records (int): Number of records processed per run, used for throughput.
+        setup (Callable): Returns the argument passed to run. Excluded from timing.
+        run (Callable): The code being measured.
+    """
+
+    def __init__(self, name: str, records: int, setup: Callable, run: Callable):
+        self.name = name
+        self.records = records
+        self.setup = setup
+        self.run = run
+
+
+def _run_properties(records: list[dict]):
+    for idx, record in enumerate(records):
+        properties(str(idx), record)
+
+
+def _run_properties_null_policy(records: list[dict]):
+    for idx, record in enumerate(records):
+        properties(str(idx), record, null_policy=CUSTOM_NULL_POLICY)
+
+
+def _run_properties_nulls_disabled(records: list[dict]):
+    for idx, record in enumerate(records):
+        properties(str(idx), record, null_policy=DISABLED_NULL_POLICY)
+
+
+def _run_node_elements(records: list[dict]):
+    node_elements("b0n", records, "uid")
+
+
+def _run_relationship_elements(records: list[dict]):
+    relationship_elements(
+        "b0r",
+        records,
+        FROM_NODE,
+        TO_NODE,
+        exclude_keys=["_from_uid", "_to_uid"],
+    )
+
+
+def _run_chunked_query(spec: Nodes):
+    chunked_query(spec, CONFIG)
+
+
+def _run_model_validate(data: dict):
+    GraphData.model_validate(data)
+
+
+def _run_batch_upload(data: dict):
+    from neo4j_uploader import batch_upload_generator
+
+    # Stand in for the Neo4j driver, without latency, so only client side work is measured
+    with FakeNeo4j(sleep=None).patch():
+        for _ in batch_upload_generator(CONFIG, data):
+            pass
+
+
+def _synthetic(count: int, width: int, ratio: float) -> SyntheticGraphConfig:
+    return SyntheticGraphConfig(
+        node_count=count,
+        fan_out=1.0,
+        property_width=width,
+        duplicate_ratio=ratio,
+    )
+
+
+def _graph_data(config: SyntheticGraphConfig) -> dict:
+    # Plain dict so GraphData.model_validate cost is included where measured
+    result = {"nodes": [], "relationships": []}
+    for _, kind, spec, records in iter_specifications(config):
+        result[kind].append({**spec, "records": list(records)})
+    return result
+
+
+def cases() -> list[Case]:
+    """Returns all benchmark cases across the record count, property width and duplicate ratio matrix."""
+    result = []
+    for count, width, ratio in itertools.product(
+        RECORD_COUNTS, PROPERTY_WIDTHS, DUPLICATE_RATIOS
+    ):
+        suffix = f"[records={count},width={width},dupes={ratio}]"
+        config = _synthetic(count, width, ratio)
+
+        def nodes(config=config):
+            return list(iter_node_records(config))
+
+        def rels(config=config):
+            return list(iter_relationship_records(config))
+
+        def spec(config=config):
+            return Nodes(
+                labels=[config.label(0)],
+                key=config.key,
+                records=list(iter_node_records(config)),
+            )
+
+        def graph(config=config):
+            return _graph_data(config)
+
+        # Duplicates are generated in addition to count unique records
+        node_total = sum(1 for _ in iter_node_records(config))
+        rel_total = sum(1 for _ in iter_relationship_records(config))
+
+        result.extend(
+            [
+                Case(f"properties{suffix}", node_total, nodes, _run_properties),
+                Case(
+                    f"properties_null_policy{suffix}",
+                    node_total,
+                    nodes,
+                    _run_properties_null_policy,
+                ),
+                Case(
+                    f"properties_nulls_disabled{suffix}",
+                    node_total,
+                    nodes,
+                    _run_properties_nulls_disabled,
+                ),
+                Case(f"node_elements{suffix}", node_total, nodes, _run_node_elements),
+                Case(
+                    f"relationship_elements{suffix}",
+                    rel_total,
+                    rels,
+                    _run_relationship_elements,
+                ),
+                Case(f"deduped{suffix}", node_total, nodes, deduped),
+                Case(f"chunked_query{suffix}", node_total, spec, _run_chunked_query),
+                Case(
+                    f"GraphData.model_validate{suffix}",
+                    node_total + rel_total,
+                    graph,
+                    _run_model_validate,
+                ),
+                Case(
+                    f"batch_upload_generator{suffix}",
+                    node_total + rel_total,
+                    graph,
+                    _run_batch_upload,
+                ),
+            ]
+        )
+
+    # Single batches of growing size, to check assembly stays linear
+    for count in SCALING_COUNTS:
+        config = _synthetic(count, 5, 0.0)
+
+        def nodes(config=config):
+            return list(iter_node_records(config))
+
+        def rels(config=config):
+            return list(iter_relationship_records(config))
+
+        result.extend(
+            [
+                Case(
+                    f"node_elements_scaling[records={count}]",
+                    count,
+                    nodes,
+                    _run_node_elements,
+                ),
+                Case(
+                    f"relationship_elements_scaling[records={count}]",
+                    count,
+                    rels,
+                    _run_relationship_elements,
+                ),
+            ]
+        )
+    return result
+
+
+def scaling_regressions(results: dict, tolerance: float = SCALING_TOLERANCE) -> list[str]:
+    """Returns descriptions of scaling cases whose per record time grew by more than tolerance from the smallest to the largest batch."""
+    regressions = []
+    for family in ("node_elements_scaling", "relationship_elements_scaling"):
+        measured = [
+            (count, results[name])
+            for count in SCALING_COUNTS
+            if (name := f"{family}[records={count}]") in results
+        ]
+        if len(measured) < 2:
+            continue
+        (smallest, first), (largest, last) = measured[0], measured[-1]
+        growth = first["records_per_second"] / last["records_per_second"] - 1.0
+        if growth > tolerance:
+            regressions.append(
+                f"{family}: per record time grew {growth:.0%} from {smallest} to {largest} records"
+            )
+    return regressions
+
+
+def measure(case: Case, repeat: int) -> dict:
+    """Times a case and captures its peak memory.
+
+    Args:
+        case (Case): Case to measure.
+        repeat (int): Number of timed runs. The fastest is reported.
+
+    Returns:
+        dict: Measurement with seconds, records_per_second and peak_bytes keys.
+    """
+    best = None
+    for _ in range(repeat):
+        arg = case.setup()
+        start = time.perf_counter()
+        case.run(arg)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+
+    # Separate run for memory as tracemalloc slows down execution
+    arg = case.setup()
+    tracemalloc.start()
+    try:
+        case.run(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds": best,
+        "records_per_second": case.records / best if best > 0 else 0.0,
+        "peak_bytes": peak,
+    }
+
+
+def compare(name: str, result: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Returns descriptions of any regressions of result against baseline."""
+    regressions = []
+    if baseline is None:
+        return regressions
+    min_rate = baseline["records_per_second"] * (1.0 - tolerance)
+    if result["records_per_second"] < min_rate:
+        regressions.append(
+            f"{name}: throughput {result['records_per_second']:.0f} rec/s below baseline {baseline['records_per_second']:.0f} rec/s"
+        )
+    max_peak = baseline["peak_bytes"] * (1.0 + tolerance)
+    if result["peak_bytes"] > max_peak:
+        regressions.append(
+            f"{name}: peak memory {result['peak_bytes']} bytes above baseline {baseline['peak_bytes']} bytes"
+        )
+    return regressions
+
+
+def load_baselines(path: str = BASELINES_PATH) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run neo4j_uploader benchmarks")
+    parser.add_argument("--filter", default="", help="Only run matching case names")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed fractional regression before failing. Default 0.25",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Overwrite stored baselines with this run's results",
+    )
+    parser.add_argument("--baselines", default=BASELINES_PATH)
+    args = parser.parse_args(argv)
+
+    baselines = load_baselines(args.baselines)
+    results = {}
+    regressions = []
+
+    for case in cases():
+        if args.filter not in case.name:
+            continue
+        result = measure(case, args.repeat)
+        results[case.name] = result
+        case_regressions = compare(
+            case.name, result, baselines.get(case.name), args.tolerance
+        )
+        regressions.extend(case_regressions)
+        status = "REGRESSED" if case_regressions else "ok"
+        print(
+            f"{case.name:<75} {result['records_per_second']:>12.0f} rec/s {result['peak_bytes'] / 1024:>10.0f} KiB  {status}"
+        )
+
+    regressions.extend(scaling_regressions(results))
+
+    if args.update_baseline:
+        baselines.update(results)
+        with open(args.baselines, "w") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+        print(f"Baselines written to {args.baselines}")
+        return 0
+
+    if regressions:
+        print("\nRegressions:")
+        for r in regressions:
+            print(f"  {r}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,77 @@
 from neo4j_uploader._logger import logger, stream_handler, logging
-from neo4j_uploader._queries import specification_queries
-from neo4j_uploader._n4j import reset, upload_query, validate_credentials
+from neo4j_uploader._queries import (
+    specification_queries,
+    iter_chunked_query,
+    nodes_query,
+    query_records,
+    spec_null_policy,
+    spec_schema,
+)
+from neo4j_uploader._prefetch import (
+    KeyExistenceCache,
+    compiled_nodes,
+    compiled_relationships,
+    prefetched_nodes_queries,
+    prefetched_relationships_queries,
+)
+from neo4j_uploader._n4j import (
+    reset,
+    reset_generator,
+    upload_query,
+    validate_credentials,
+)
+from neo4j_uploader._profiling import MemoryProfiler
+from neo4j_uploader._vectors import iter_vector_queries
+from neo4j_uploader._property_types import property_converters
+from neo4j_uploader._planning import plan_spec_chunks, plan_specifications
+from neo4j_uploader._validation import graph_data
+from neo4j_uploader._spool import write_spool_file, read_spool_index, iter_spool
+from neo4j_uploader._sources import iter_source_spec_chunks
+from neo4j_uploader._columnar import iter_frame_spec_chunks
+from neo4j_uploader._streaming import (
+    is_ndjson,
+    iter_json_spec_chunks,
+    iter_ndjson_spec_chunks,
+)
+from neo4j_uploader._fingerprints import (
+    DeferredFingerprints,
+    FingerprintStore,
+    SQLiteFingerprintStore,
+    filter_unchanged,
+    commit_fingerprints,
+)
 from neo4j_uploader.models import (
     UploadResult,
     Neo4jConfig,
+    NullPolicy,
+    VectorProperty,
     GraphData,
+    Nodes,
+    Relationships,
+    ThroughputModel,
+    UploadPlan,
+    SpecPlan,
+    SourceData,
+    NodesSource,
+    RelationshipsSource,
+    FrameData,
+    NodesFrame,
+    RelationshipsFrame,
+    SpecProgress,
+    ResetProgress,
+    PhaseMemory,
+    AllocationSite,
 )
 from neo4j_uploader.errors import InvalidCredentialsError, InvalidPayloadError
 from neo4j_uploader._conversions import (
     convert_legacy_node_records,
     convert_legacy_relationship_records,
 )
-from typing import Callable, Optional, Union, Tuple
+from typing import Callable, Iterable, Optional, Union, Tuple
 from collections.abc import Generator
 from datetime import datetime
+from functools import partial
+import itertools
 import warnings
 import json
 
@@ -63,6 +121,7 @@ def stop_logging():
 def batch_upload_generator(
     config: dict | Neo4jConfig,
     data: dict | GraphData,
+    fingerprint_store: Optional[FingerprintStore] = None,
 ) -> Generator[UploadResult, None, None]:
     """
     Uploads a dictionary containing nodes, relationships, and target Neo4j database information as a generator.
@@ -72,6 +131,8 @@ def batch_upload_generator(
 
         data (dict or GraphData): A GraphData object or a dict that can be converted to a GraphData object.
 
+        fingerprint_store (FingerprintStore): Optional digests of previously committed records. Used when config skip_unchanged is True to avoid sending unchanged records, and updated as batches commit. Defaults to a SQLiteFingerprintStore at config fingerprint_store_path, if set.
+
     Returns:
         A generator of UploadResult objects
 
@@ -86,56 +147,279 @@ def batch_upload_generator(
     except Exception as e:
         raise InvalidCredentialsError(e)
 
-    validate_credentials((cdata.neo4j_uri, cdata.neo4j_user, cdata.neo4j_password))
+    # Store opened from the config is owned, and closed, by this upload
+    owned_store = _config_fingerprint_store(cdata, fingerprint_store)
+    fingerprint_store = fingerprint_store or owned_store
 
-    # Convert data if necessary
+    profiler = MemoryProfiler(cdata.profile_memory)
     try:
-        gdata = GraphData.model_validate(data)
-    except Exception as e:
-        raise InvalidPayloadError(e)
+        yield from _batch_upload(cdata, data, profiler, fingerprint_store)
+    finally:
+        profiler.stop()
+        if owned_store is not None:
+            owned_store.close()
 
-    neo4j_creds = (cdata.neo4j_uri, cdata.neo4j_user, cdata.neo4j_password)
-    neo4j_database = cdata.neo4j_database
 
-    # Optionally reset target db
-    if cdata.overwrite:
-        reset(neo4j_creds, neo4j_database)
+def _batch_upload(
+    cdata: Neo4jConfig,
+    data: dict | GraphData,
+    profiler: MemoryProfiler,
+    fingerprint_store: Optional[FingerprintStore] = None,
+) -> Generator[UploadResult, None, None]:
+
+    with profiler.phase("validation"):
+        validate_credentials(
+            (cdata.neo4j_uri, cdata.neo4j_user, cdata.neo4j_password)
+        )
+
+        # Convert data if necessary
+        try:
+            gdata = graph_data(data, cdata.validation)
+        except Exception as e:
+            raise InvalidPayloadError(e)
 
     # Create batched queries for upload
-    query_params = specification_queries(gdata.nodes, cdata)
-    query_params.extend(specification_queries(gdata.relationships, cdata))
+    with profiler.phase("query_generation"):
+        # Target holds none of the uploaded nodes, so new keys can skip the MERGE lookup
+        create_only = cdata.overwrite or cdata.assume_empty
+        key_cache = KeyExistenceCache()
+        created_keys = {}
+        specs = []
+        records_unchanged = 0
+        fingerprint_store = _active_fingerprint_store(cdata, fingerprint_store)
+
+        batches = []
+        for spec in gdata.nodes + gdata.relationships:
+            spec_batches, unchanged = _spec_batches(
+                spec,
+                len(specs),
+                cdata,
+                create_only,
+                created_keys,
+                key_cache,
+                fingerprint_store,
+            )
+            batches.extend(spec_batches)
+            records_unchanged += unchanged
+            specs.append(
+                SpecProgress(
+                    name=spec.name(),
+                    element_type="nodes" if isinstance(spec, Nodes) else "relationships",
+                    batches_total=len(spec_batches),
+                    records_total=sum(b[1] for b in spec_batches),
+                )
+            )
+
+        # Release key sets before uploading
+        created_keys = None
 
     # Init result / status object
     overall_result = UploadResult(
         started_at=datetime.now(),
-        records_total=len(query_params),
+        records_total=len(batches),
+        records_unchanged=records_unchanged,
+        specs=specs,
     )
+    overall_result.memory_profile = profiler.phases
+
+    # Optionally reset target db
+    if cdata.overwrite:
+        yield from _reset(cdata, overall_result, profiler)
 
     # Run batched queries
-    for index, qp in enumerate(query_params):
-        try:
-            summary = upload_query(
-                creds=neo4j_creds,
-                query=qp[0],
-                params=qp[1],
-                database=neo4j_database,
+    yield from _upload_batches(cdata, batches, overall_result, profiler)
+
+
+def _config_fingerprint_store(
+    cdata: Neo4jConfig, fingerprint_store: Optional[FingerprintStore]
+) -> Optional[SQLiteFingerprintStore]:
+    # Opens the store at fingerprint_store_path when none was passed
+    if (
+        fingerprint_store is None
+        and cdata.skip_unchanged
+        and cdata.fingerprint_store_path is not None
+    ):
+        return SQLiteFingerprintStore(cdata.fingerprint_store_path)
+    return None
+
+
+def _active_fingerprint_store(
+    cdata: Neo4jConfig, fingerprint_store: Optional[FingerprintStore]
+) -> Optional[FingerprintStore]:
+    # Digests are only recorded, and compared, when skipping unchanged records. A reset target starts without any
+    if not cdata.skip_unchanged:
+        return None
+    if fingerprint_store is not None and cdata.overwrite:
+        fingerprint_store.clear(cdata.neo4j_database)
+    return fingerprint_store
+
+
+def _spec_batches(
+    spec: Nodes | Relationships,
+    spec_index: int,
+    cdata: Neo4jConfig,
+    create_only: bool,
+    created_keys: dict,
+    key_cache: KeyExistenceCache,
+    fingerprint_store: Optional[FingerprintStore],
+) -> tuple[list[tuple], int]:
+    # Batches as (spec index, record count, list of (query, params), commit callback taking the returned rows), and the number of unchanged records skipped. With prefetch the list is built by a callable just before upload, once earlier batches are committed
+    neo4j_creds = (cdata.neo4j_uri, cdata.neo4j_user, cdata.neo4j_password)
+    neo4j_database = cdata.neo4j_database
+
+    unchanged = 0
+    if fingerprint_store is not None:
+        records = filter_unchanged(spec, fingerprint_store, neo4j_database)
+        unchanged = len(spec.records) - len(records)
+        spec = spec.model_copy(update={"records": records})
+
+    if cdata.prefetch_existing_keys and not create_only:
+        chunks = _prefetched_batches(
+            spec, cdata, neo4j_creds, neo4j_database, key_cache
+        )
+    else:
+        chunks = [
+            (chunk, [(query, params)], None)
+            for chunk, query, params, _ in iter_chunked_query(
+                spec, cdata, create_only, created_keys
             )
+        ]
 
-            props = getattr(summary.counters, "properties_set", 0)
-            nodes = getattr(summary.counters, "nodes_created", 0)
-            relationships = getattr(summary.counters, "relationships_created", 0)
+    # Digests of records with embeddings wait for their embedding batches too
+    deferred = None
+    if (
+        fingerprint_store is not None
+        and isinstance(spec, Nodes)
+        and spec.vector_properties
+    ):
+        deferred = DeferredFingerprints(spec, fingerprint_store, neo4j_database)
 
-            overall_result.properties_set += props
-            overall_result.nodes_created += nodes
-            overall_result.relationships_created += relationships
-            overall_result.records_completed += 1
+    batches = []
+    for chunk, queries, keys_committed in chunks:
+        on_commit = None
+        if keys_committed is not None or fingerprint_store is not None:
+            # Records whose digests are stored with the batch, and deferred identities it writes
+            committed, identities = chunk, set()
+            if deferred is not None:
+                written = chunk
+                if len(chunk) == 0:
+                    # Embedding batch, with rows of [key value, embedding]
+                    written = [
+                        {spec.key: row[0]}
+                        for _, params in queries
+                        for row in params.get("rows", ())
+                    ]
+                identities = deferred.add_batch(written)
+                committed = [r for r in chunk if not deferred.holds(r)]
+            on_commit = partial(
+                _commit_batch,
+                spec,
+                committed,
+                keys_committed,
+                fingerprint_store,
+                neo4j_database,
+                deferred,
+                identities,
+            )
+        batches.append((spec_index, len(chunk), queries, on_commit))
+    return batches, unchanged
 
-        except Exception as e:
-            error_message = (
-                f"Error processing batch {index} of {len(query_params)}: {e}."
+
+def _commit_batch(
+    spec: Nodes | Relationships,
+    chunk: list[dict],
+    keys_committed: Optional[Callable],
+    fingerprint_store: Optional[FingerprintStore],
+    database: str,
+    deferred: Optional[DeferredFingerprints],
+    identities: set[str],
+    rows: list,
+):
+    # Runs once all of a batch's queries committed, with the rows they returned
+    if keys_committed is not None:
+        keys_committed()
+    commit_fingerprints(spec, chunk, fingerprint_store, database, rows)
+    if deferred is not None:
+        deferred.commit(identities)
+
+
+def _reset(
+    cdata: Neo4jConfig,
+    overall_result: UploadResult,
+    profiler: MemoryProfiler,
+) -> Generator[UploadResult, None, None]:
+    # Clears the target database, yielding deletion progress
+    with profiler.phase("reset"):
+        for progress in reset_generator(
+            (cdata.neo4j_uri, cdata.neo4j_user, cdata.neo4j_password),
+            cdata.neo4j_database,
+            batch_size=cdata.reset_batch_size,
+            strategy=cdata.reset_strategy,
+            recreate_timeout_seconds=cdata.recreate_timeout_seconds,
+        ):
+            overall_result.nodes_deleted = progress.nodes_deleted
+            overall_result.relationships_deleted = progress.relationships_deleted
+            yield overall_result
+
+
+def _upload_batches(
+    cdata: Neo4jConfig,
+    batches: Iterable[
+        tuple[int, int, list[tuple[str, dict]] | Callable, Optional[Callable]]
+    ],
+    overall_result: UploadResult,
+    profiler: MemoryProfiler,
+) -> Generator[UploadResult, None, None]:
+    # Runs each batch's queries, yielding progress after each batch and the final result last
+    neo4j_creds = (cdata.neo4j_uri, cdata.neo4j_user, cdata.neo4j_password)
+    neo4j_database = cdata.neo4j_database
+
+    with profiler.phase("upload"):
+        for index, (spec_index, records, queries, on_commit) in enumerate(batches):
+            batch_start = datetime.now()
+            succeeded = False
+            try:
+                if callable(queries):
+                    queries = queries()
+
+                rows = []
+                for query, params in queries:
+                    returned, summary = upload_query(
+                        creds=neo4j_creds,
+                        query=query,
+                        params=params,
+                        database=neo4j_database,
+                    )
+                    rows.extend(returned)
+
+                    props = getattr(summary.counters, "properties_set", 0)
+                    nodes = getattr(summary.counters, "nodes_created", 0)
+                    relationships = getattr(
+                        summary.counters, "relationships_created", 0
+                    )
+
+                    overall_result.properties_set += props
+                    overall_result.nodes_created += nodes
+                    overall_result.relationships_created += relationships
+
+                overall_result.records_completed += 1
+                succeeded = True
+                if on_commit is not None:
+                    on_commit(rows)
+
+            except Exception as e:
+                error_message = f"Error processing batch {index} of {overall_result.records_total}: {e}."
+                overall_result.error_message += error_message
+
+            finished_at = datetime.now()
+            overall_result.record_batch(
+                spec_index,
+                records,
+                (finished_at - batch_start).total_seconds(),
+                succeeded=succeeded,
+                finished_at=finished_at,
             )
-            overall_result.error_message += error_message
-        yield overall_result
+            yield overall_result
 
     # Return overall/final result
     overall_result.finished_at = datetime.now()
@@ -147,9 +431,563 @@ def batch_upload_generator(
     yield overall_result
 
 
+def _prefetched_batches(
+    spec: Nodes | Relationships,
+    cdata: Neo4jConfig,
+    creds: Tuple[str, str, str],
+    database: str,
+    cache: KeyExistenceCache,
+) -> list[
+    tuple[list[dict], Callable[[], list[tuple[str, dict]]], Optional[Callable]]
+]:
+    # Chunks paired with a deferred query builder that checks existing keys first, and the callback marking the keys it created once committed
+    b = cdata.max_batch_size
+    fingerprint_property = cdata.fingerprint_property if cdata.skip_unchanged else None
+    null_policy = spec_null_policy(spec, cdata)
+    vector_names = (
+        {v.name for v in spec.vector_properties} if isinstance(spec, Nodes) else set()
+    )
+    converters = property_converters(spec, null_policy)
+
+    # Query parts are compiled once for every chunk
+    schema = spec_schema(spec, vector_names)
+    if isinstance(spec, Nodes):
+        create = compiled_nodes(
+            spec, "CREATE", fingerprint_property, null_policy, schema
+        )
+        update = compiled_nodes(spec, "MATCH", fingerprint_property, null_policy, schema)
+    else:
+        compiled = compiled_relationships(
+            spec, fingerprint_property, null_policy, schema
+        )
+
+    result = []
+    for idx, start in enumerate(range(0, len(spec.records), b)):
+        chunk = spec.records[start : start + b]
+        # Embeddings are set by the vector batches below
+        query_chunk = query_records(chunk, vector_names, converters)
+        on_commit = None
+        if isinstance(spec, Nodes):
+            if not spec.dedupe:
+                # Always CREATE, nothing to look up
+                queries = [
+                    nodes_query(
+                        f"b{idx}n",
+                        query_chunk,
+                        spec.key,
+                        spec.labels,
+                        compiled=create,
+                    )
+                ]
+            else:
+                queries = partial(
+                    prefetched_nodes_queries,
+                    creds,
+                    database,
+                    f"b{idx}n",
+                    query_chunk,
+                    spec,
+                    cache,
+                    create,
+                    update,
+                )
+                on_commit = cache.commit_staged
+        else:
+            queries = partial(
+                prefetched_relationships_queries,
+                creds,
+                database,
+                f"b{idx}r",
+                query_chunk,
+                spec,
+                cache,
+                compiled,
+            )
+        result.append((chunk, queries, on_commit))
+
+    if vector_names:
+        for query, params in iter_vector_queries(spec, cdata.vector_batch_size):
+            result.append(([], [(query, params)], None))
+    return result
+
+
+def plan_upload(
+    config: dict | Neo4jConfig,
+    data: dict | GraphData,
+    throughput: Optional[dict | ThroughputModel] = None,
+) -> UploadPlan:
+    """Dry run of batch_upload. Validates the config and data and generates every query without connecting to Neo4j.
+
+    Args:
+        config (dict or Neo4jConfig): A Neo4jConfig object or dict that can be converted to a Neo4jConfig object.
+
+        data (dict or GraphData): A GraphData object or a dict that can be converted to a GraphData object.
+
+        throughput (dict or ThroughputModel): Assumed server performance for the duration estimate. Defaults to ThroughputModel().
+
+    Returns:
+        UploadPlan: Per specification batch and record counts, payload sizes, distinct query templates and estimated duration.
+
+    Raises:
+        InvalidCredentialsError: If the config is missing or malformed.
+        InvalidPayloadError: If payload schema is missing or unsupported.
+    """
+    try:
+        cdata = Neo4jConfig.model_validate(config)
+    except Exception as e:
+        raise InvalidCredentialsError(e)
+
+    try:
+        gdata = graph_data(data, cdata.validation)
+    except Exception as e:
+        raise InvalidPayloadError(e)
+
+    if throughput is None:
+        throughput = ThroughputModel()
+    else:
+        throughput = ThroughputModel.model_validate(throughput)
+
+    return plan_specifications(gdata.nodes + gdata.relationships, cdata, throughput)
+
+
+def plan_upload_file(
+    config: dict | Neo4jConfig,
+    path: str,
+    throughput: Optional[dict | ThroughputModel] = None,
+) -> UploadPlan:
+    """Dry run of batch_upload_file. Streams the payload file in chunks of max_batch_size and generates every query without connecting to Neo4j, so memory stays flat regardless of file size.
+
+    Args:
+        config (dict or Neo4jConfig): A Neo4jConfig object or dict that can be converted to a Neo4jConfig object.
+
+        path (str): Payload file, in a format accepted by batch_upload_file.
+
+        throughput (dict or ThroughputModel): Assumed server performance for the duration estimate. Defaults to ThroughputModel().
+
+    Returns:
+        UploadPlan: Per specification batch and record counts, payload sizes, distinct query templates and estimated duration.
+
+    Raises:
+        InvalidCredentialsError: If the config is missing or malformed.
+        InvalidPayloadError: If the file is not valid or its schema is unsupported.
+    """
+    try:
+        cdata = Neo4jConfig.model_validate(config)
+    except Exception as e:
+        raise InvalidCredentialsError(e)
+
+    if throughput is None:
+        throughput = ThroughputModel()
+    else:
+        throughput = ThroughputModel.model_validate(throughput)
+
+    if is_ndjson(path):
+        spec_chunks = iter_ndjson_spec_chunks(path, cdata.max_batch_size)
+    else:
+        spec_chunks = iter_json_spec_chunks(path, cdata.max_batch_size)
+
+    return plan_spec_chunks(spec_chunks, cdata, throughput)
+
+
+def batch_upload_file_generator(
+    config: dict | Neo4jConfig,
+    path: str,
+    fingerprint_store: Optional[FingerprintStore] = None,
+) -> Generator[UploadResult, None, None]:
+    """
+    Uploads a payload file as a generator, parsing records incrementally so memory stays flat regardless of file size.
+
+    Files ending in .ndjson or .jsonl use the NDJSON format of neo4j_uploader.synthetic, one specification or record per line. Other files use the batch_upload .json schema, as in samples/batch_upload_data.json, and should list each specification's 'records' after its other fields. Either may be gzip compressed with a trailing .gz.
+
+    Records are parsed and uploaded in chunks of max_batch_size, so batch and record totals in each UploadResult grow as the file is read. Specifications are uploaded in file order.
+
+    Args:
+        config (dict or Neo4jConfig): A Neo4jConfig object or dict that can be converted to a Neo4jConfig object.
+
+        path (str): Payload file.
+
+        fingerprint_store (FingerprintStore): Optional digests of previously committed records, as for batch_upload_generator.
+
+    Returns:
+        A generator of UploadResult objects
+
+    Raises:
+        neo4j.exceptions: A Neo4j exception if credentials are invalid or database can not be accessed.
+        InvalidCredentialsError: If credentials are missing or malformed.
+        InvalidPayloadError: If the file is not valid or its schema is unsupported. Batches parsed before the error are already uploaded. With overwrite, the first chunk of records is parsed before the database is reset, so a file that can not be read at all leaves it unchanged.
+    """
+    try:
+        cdata = Neo4jConfig.model_validate(config)
+    except Exception as e:
+        raise InvalidCredentialsError(e)
+
+    if is_ndjson(path):
+        spec_chunks = iter_ndjson_spec_chunks(path, cdata.max_batch_size)
+    else:
+        spec_chunks = iter_json_spec_chunks(path, cdata.max_batch_size)
+
+    yield from _streamed_upload(cdata, spec_chunks, fingerprint_store)
+
+
+def batch_upload_sources_generator(
+    config: dict | Neo4jConfig,
+    sources: dict | SourceData,
+    fingerprint_store: Optional[FingerprintStore] = None,
+) -> Generator[UploadResult, None, None]:
+    """
+    Uploads CSV and Parquet files as a generator. Each file is mapped to Nodes or Relationships by a NodesSource or RelationshipsSource and read in chunks of max_batch_size, so only one chunk of records is held in memory.
+
+    Args:
+        config (dict or Neo4jConfig): A Neo4jConfig object or dict that can be converted to a Neo4jConfig object.
+
+        sources (dict or SourceData): A SourceData object or a dict that can be converted to a SourceData object.
+
+        fingerprint_store (FingerprintStore): Optional digests of previously committed records, as for batch_upload_generator.
+
+    Returns:
+        A generator of UploadResult objects
+
+    Raises:
+        neo4j.exceptions: A Neo4j exception if credentials are invalid or database can not be accessed.
+        InvalidCredentialsError: If credentials are missing or malformed.
+        InvalidPayloadError: If the source mapping is missing or unsupported.
+        ImportError: If a Parquet source is read without pyarrow installed.
+    """
+    try:
+        cdata = Neo4jConfig.model_validate(config)
+    except Exception as e:
+        raise InvalidCredentialsError(e)
+
+    try:
+        sdata = SourceData.model_validate(sources)
+    except Exception as e:
+        raise InvalidPayloadError(e)
+
+    spec_chunks = iter_source_spec_chunks(sdata, cdata.max_batch_size)
+    yield from _streamed_upload(cdata, spec_chunks, fingerprint_store)
+
+
+def batch_upload_sources(
+    config: dict | Neo4jConfig,
+    sources: dict | SourceData,
+    fingerprint_store: Optional[FingerprintStore] = None,
+) -> UploadResult:
+    """Uploads CSV and Parquet files mapped to Nodes and Relationships. See batch_upload_sources_generator.
+
+    Args:
+        config (dict or Neo4jConfig): A Neo4jConfig object or dict that can be converted to a Neo4jConfig object.
+
+        sources (dict or SourceData): A SourceData object or a dict that can be converted to a SourceData object.
+
+        fingerprint_store (FingerprintStore): Optional digests of previously committed records, as for batch_upload.
+
+    Returns:
+        UploadResult: Final result of the upload.
+    """
+    final_result = None
+    for result in batch_upload_sources_generator(config, sources, fingerprint_store):
+        final_result = result
+    return final_result
+
+
+def batch_upload_frames_generator(
+    config: dict | Neo4jConfig,
+    frames: dict | FrameData,
+    fingerprint_store: Optional[FingerprintStore] = None,
+) -> Generator[UploadResult, None, None]:
+    """
+    Uploads pandas DataFrames, Arrow tables or dicts of NumPy arrays as a generator. Each frame is mapped to Nodes or Relationships by a NodesFrame or RelationshipsFrame.
+
+    Excluded columns, null sentinel strings and type normalization are handled once per column with Arrow compute functions, and row dicts are only built for the batch being uploaded.
+
+    Args:
+        config (dict or Neo4jConfig): A Neo4jConfig object or dict that can be converted to a Neo4jConfig object.
+
+        frames (dict or FrameData): A FrameData object or a dict that can be converted to a FrameData object.
+
+        fingerprint_store (FingerprintStore): Optional digests of previously committed records, as for batch_upload_generator.
+
+    Returns:
+        A generator of UploadResult objects
+
+    Raises:
+        neo4j.exceptions: A Neo4j exception if credentials are invalid or database can not be accessed.
+        InvalidCredentialsError: If credentials are missing or malformed.
+        InvalidPayloadError: If the frame mapping is missing or unsupported.
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        cdata = Neo4jConfig.model_validate(config)
+    except Exception as e:
+        raise InvalidCredentialsError(e)
+
+    try:
+        fdata = FrameData.model_validate(frames)
+    except Exception as e:
+        raise InvalidPayloadError(e)
+
+    spec_chunks = iter_frame_spec_chunks(
+        fdata, cdata.max_batch_size, cdata.null_policy
+    )
+    yield from _streamed_upload(cdata, spec_chunks, fingerprint_store)
+
+
+def batch_upload_frames(
+    config: dict | Neo4jConfig,
+    frames: dict | FrameData,
+    fingerprint_store: Optional[FingerprintStore] = None,
+) -> UploadResult:
+    """Uploads pandas DataFrames, Arrow tables or dicts of NumPy arrays mapped to Nodes and Relationships. See batch_upload_frames_generator.
+
+    Args:
+        config (dict or Neo4jConfig): A Neo4jConfig object or dict that can be converted to a Neo4jConfig object.
+
+        frames (dict or FrameData): A FrameData object or a dict that can be converted to a FrameData object.
+
+        fingerprint_store (FingerprintStore): Optional digests of previously committed records, as for batch_upload.
+
+    Returns:
+        UploadResult: Final result of the upload.
+    """
+    final_result = None
+    for result in batch_upload_frames_generator(config, frames, fingerprint_store):
+        final_result = result
+    return final_result
+
+
+def _streamed_upload(
+    cdata: Neo4jConfig,
+    spec_chunks: Iterable[tuple[object, Nodes | Relationships]],
+    fingerprint_store: Optional[FingerprintStore],
+) -> Generator[UploadResult, None, None]:
+    # Uploads specification chunks as they are read, after validating credentials and an optional reset
+
+    # Store opened from the config is owned, and closed, by this upload
+    owned_store = _config_fingerprint_store(cdata, fingerprint_store)
+    fingerprint_store = fingerprint_store or owned_store
+
+    profiler = MemoryProfiler(cdata.profile_memory)
+    try:
+        with profiler.phase("validation"):
+            validate_credentials(
+                (cdata.neo4j_uri, cdata.neo4j_user, cdata.neo4j_password)
+            )
+
+        overall_result = UploadResult(started_at=datetime.now(), records_total=0)
+        overall_result.memory_profile = profiler.phases
+
+        if cdata.overwrite:
+            # The first chunk is parsed before the reset, so a source that can not be read or mapped leaves the database as it was
+            spec_chunks = iter(spec_chunks)
+            first = next(spec_chunks, None)
+            if first is not None:
+                spec_chunks = itertools.chain([first], spec_chunks)
+            yield from _reset(cdata, overall_result, profiler)
+
+        batches = _streamed_batches(
+            cdata,
+            spec_chunks,
+            overall_result,
+            _active_fingerprint_store(cdata, fingerprint_store),
+        )
+        yield from _upload_batches(cdata, batches, overall_result, profiler)
+    finally:
+        profiler.stop()
+        if owned_store is not None:
+            owned_store.close()
+
+
+def _streamed_batches(
+    cdata: Neo4jConfig,
+    spec_chunks: Iterable[tuple[object, Nodes | Relationships]],
+    overall_result: UploadResult,
+    fingerprint_store: Optional[FingerprintStore],
+) -> Generator[tuple, None, None]:
+    # Lazily converts chunks of parsed specifications to batches, growing progress totals as they are discovered
+    create_only = cdata.overwrite or cdata.assume_empty
+    key_cache = KeyExistenceCache()
+    created_keys = {}
+    spec_indexes = {}
+
+    for spec_id, spec in spec_chunks:
+        spec_index = spec_indexes.get(spec_id)
+        if spec_index is None:
+            spec_index = len(overall_result.specs)
+            spec_indexes[spec_id] = spec_index
+            overall_result.specs.append(
+                SpecProgress(
+                    name=spec.name(),
+                    element_type="nodes" if isinstance(spec, Nodes) else "relationships",
+                    batches_total=0,
+                    records_total=0,
+                )
+            )
+
+        spec_batches, unchanged = _spec_batches(
+            spec,
+            spec_index,
+            cdata,
+            create_only,
+            created_keys,
+            key_cache,
+            fingerprint_store,
+        )
+        progress = overall_result.specs[spec_index]
+        progress.batches_total += len(spec_batches)
+        progress.records_total += sum(b[1] for b in spec_batches)
+        overall_result.records_total += len(spec_batches)
+        overall_result.records_unchanged += unchanged
+        yield from spec_batches
+
+
+def batch_upload_file(
+    config: dict | Neo4jConfig,
+    path: str,
+    fingerprint_store: Optional[FingerprintStore] = None,
+) -> UploadResult:
+    """Uploads a .json, .ndjson or .jsonl payload file, parsing records incrementally. See batch_upload_file_generator.
+
+    Args:
+        config (dict or Neo4jConfig): A Neo4jConfig object or dict that can be converted to a Neo4jConfig object.
+
+        path (str): Payload file, optionally gzip compressed.
+
+        fingerprint_store (FingerprintStore): Optional digests of previously committed records, as for batch_upload.
+
+    Returns:
+        UploadResult: Final result of the upload.
+
+    Raises:
+        neo4j.exceptions: A Neo4j exception if credentials are invalid or database can not be accessed.
+        InvalidCredentialsError: If credentials are missing or malformed.
+        InvalidPayloadError: If the file is not valid or its schema is unsupported.
+    """
+    final_result = None
+    for result in batch_upload_file_generator(config, path, fingerprint_store):
+        final_result = result
+    return final_result
+
+
+def write_spool(
+    config: dict | Neo4jConfig,
+    data: dict | GraphData,
+    path: str,
+) -> list[SpecProgress]:
+    """Generates the batch queries for a payload and streams them to a compressed spool file, without connecting to Neo4j. Upload the file later, or on another machine, with upload_spool.
+
+    Args:
+        config (dict or Neo4jConfig): A Neo4jConfig object or dict that can be converted to a Neo4jConfig object. Only query generation options are used.
+
+        data (dict or GraphData): A GraphData object or a dict that can be converted to a GraphData object.
+
+        path (str): Spool file to create.
+
+    Returns:
+        list[SpecProgress]: Batch and record totals of each specification.
+
+    Raises:
+        InvalidCredentialsError: If the config is missing or malformed.
+        InvalidPayloadError: If payload schema is missing or unsupported.
+    """
+    try:
+        cdata = Neo4jConfig.model_validate(config)
+    except Exception as e:
+        raise InvalidCredentialsError(e)
+
+    try:
+        gdata = graph_data(data, cdata.validation)
+    except Exception as e:
+        raise InvalidPayloadError(e)
+
+    return write_spool_file(gdata.nodes + gdata.relationships, cdata, path)
+
+
+def upload_spool_generator(
+    config: dict | Neo4jConfig,
+    path: str,
+) -> Generator[UploadResult, None, None]:
+    """
+    Uploads the batches of a spool file written by write_spool as a generator. Batches are read and decompressed one at a time.
+
+    Args:
+        config (dict or Neo4jConfig): A Neo4jConfig object or dict that can be converted to a Neo4jConfig object. Set overwrite to True if the spool was written with overwrite or assume_empty and the target is not empty.
+
+        path (str): Spool file to upload.
+
+    Returns:
+        A generator of UploadResult objects
+
+    Raises:
+        neo4j.exceptions: A Neo4j exception if credentials are invalid or database can not be accessed.
+        InvalidCredentialsError: If credentials are missing or malformed.
+        ValueError: If the file is not a complete spool file.
+    """
+    try:
+        cdata = Neo4jConfig.model_validate(config)
+    except Exception as e:
+        raise InvalidCredentialsError(e)
+
+    profiler = MemoryProfiler(cdata.profile_memory)
+    try:
+        with profiler.phase("validation"):
+            validate_credentials(
+                (cdata.neo4j_uri, cdata.neo4j_user, cdata.neo4j_password)
+            )
+            specs, create_only = read_spool_index(path)
+
+        if create_only and not (cdata.overwrite or cdata.assume_empty):
+            logger.warning(
+                f"Spool {path} uses CREATE for new nodes and expects an empty target database. Existing nodes will be duplicated unless overwrite is set."
+            )
+
+        overall_result = UploadResult(
+            started_at=datetime.now(),
+            records_total=sum(s.batches_total for s in specs),
+            specs=specs,
+        )
+        overall_result.memory_profile = profiler.phases
+
+        if cdata.overwrite:
+            yield from _reset(cdata, overall_result, profiler)
+
+        batches = (
+            (spec_index, records, [(query, params)], None)
+            for spec_index, records, query, params in iter_spool(path)
+        )
+        yield from _upload_batches(cdata, batches, overall_result, profiler)
+    finally:
+        profiler.stop()
+
+
+def upload_spool(
+    config: dict | Neo4jConfig,
+    path: str,
+) -> UploadResult:
+    """Uploads the batches of a spool file written by write_spool.
+
+    Args:
+        config (dict or Neo4jConfig): A Neo4jConfig object or dict that can be converted to a Neo4jConfig object.
+
+        path (str): Spool file to upload.
+
+    Returns:
+        UploadResult: Final result of the upload.
+
+    Raises:
+        neo4j.exceptions: A Neo4j exception if credentials are invalid or database can not be accessed.
+        InvalidCredentialsError: If credentials are missing or malformed.
+        ValueError: If the file is not a complete spool file.
+    """
+    final_result = None
+    for result in upload_spool_generator(config, path):
+        final_result = result
+    return final_result
+
+
 def batch_upload(
     config: dict | Neo4jConfig,
     data: dict | GraphData,
+    fingerprint_store: Optional[FingerprintStore] = None,
 ) -> UploadResult:
     """Uploads a dictionary containing nodes, relationships, and target Neo4j database information.
     Automatically detects whether it's being used as an iterator or a normal function.
@@ -159,6 +997,8 @@ def batch_upload(
 
         data (dict or GraphData): A GraphData object or a dict that can be converted to a GraphData object.
 
+        fingerprint_store (FingerprintStore): Optional digests of previously committed records. Used when config skip_unchanged is True to avoid sending unchanged records, and updated as batches commit.
+
     Returns:
         Union[Generator[UploadResult, None, UploadResult], UploadResult]: A generator of UploadResult objects or a single UploadResult object.
 
@@ -172,6 +1012,7 @@ def batch_upload(
     gen = batch_upload_generator(
         config=config,
         data=data,
+        fingerprint_store=fingerprint_store,
     )
 
     # Consume the generator to get the final result
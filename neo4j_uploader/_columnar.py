@@ -0,0 +1,134 @@
+from neo4j_uploader.models import (
+    FrameData,
+    FrameSpec,
+    Nodes,
+    NullPolicy,
+    Relationships,
+    RelationshipsFrame,
+)
+from neo4j_uploader._queries import DEFAULT_NULL_POLICY
+from typing import Iterator, Optional
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError as e:
+        raise ImportError(
+            "Uploading DataFrames and columnar data requires pyarrow. Install it with 'pip install pyarrow'."
+        ) from e
+    return pa, pc
+
+
+def to_arrow_table(frame):
+    """Returns a pandas DataFrame, Arrow RecordBatch or dict of NumPy arrays as a pyarrow Table. Tables are returned as is.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    pa, _ = _import_pyarrow()
+    if isinstance(frame, pa.Table):
+        return frame
+    if isinstance(frame, pa.RecordBatch):
+        return pa.Table.from_batches([frame])
+    if type(frame).__module__.startswith("pandas"):
+        # Missing values, including NaN, become Arrow nulls. The index is not a property
+        return pa.Table.from_pandas(frame, preserve_index=False)
+    return pa.table(frame)
+
+
+def _exclude_columns(spec: FrameSpec) -> set[str]:
+    # Same exclusions as iter_chunked_query applies to the specification's records
+    if isinstance(spec, RelationshipsFrame) and spec.auto_exclude_keys:
+        excluded = spec.required_columns()
+    else:
+        excluded = set(spec.exclude_keys or [])
+    return excluded - spec.required_columns()
+
+
+def _column_sentinels(policy: NullPolicy, name: str) -> list[str]:
+    # Sentinels compared against the column, lowercased unless the policy is case sensitive
+    if not policy.enabled:
+        return []
+    sentinels = policy.column_sentinels.get(name, policy.sentinels)
+    if policy.case_sensitive:
+        return sentinels
+    return sorted({s.lower() for s in sentinels})
+
+
+def _normalized_column(column, policy: NullPolicy, name: str, pa, pc):
+    # Types that row conversion would otherwise leave for the driver or properties() to handle value by value
+    if pa.types.is_dictionary(column.type):
+        column = pc.cast(column, column.type.value_type)
+    if pa.types.is_decimal(column.type):
+        column = pc.cast(column, pa.float64())
+    sentinels = _column_sentinels(policy, name)
+    if len(sentinels) > 0 and (
+        pa.types.is_string(column.type) or pa.types.is_large_string(column.type)
+    ):
+        compared = column if policy.case_sensitive else pc.utf8_lower(column)
+        matches = pc.is_in(compared, value_set=pa.array(sentinels, column.type))
+        column = pc.if_else(matches, pa.scalar(None, column.type), column)
+    return column
+
+
+def cleaned_table(spec: FrameSpec, null_policy: Optional[NullPolicy] = None):
+    """Returns the spec's frame as a pyarrow Table prepared for upload with whole column operations.
+
+    Excluded columns are dropped, dictionary columns decoded and decimals converted to floats. List and struct columns are left to the spec's map_mode. Null sentinel strings of the spec's null policy, or else null_policy, become nulls, which are not uploaded. Key and node reference columns are left untouched, as they are read from each record directly.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    pa, pc = _import_pyarrow()
+    policy = spec.null_policy or null_policy or DEFAULT_NULL_POLICY
+    table = to_arrow_table(spec.frame)
+    excluded = _exclude_columns(spec)
+    required = spec.required_columns()
+
+    names = []
+    columns = []
+    for name, column in zip(table.column_names, table.columns):
+        if name in excluded:
+            continue
+        if name not in required:
+            column = _normalized_column(column, policy, name, pa, pc)
+        names.append(name)
+        columns.append(column)
+    return pa.table(columns, names=names)
+
+
+def iter_frame_records(
+    spec: FrameSpec, chunk_size: int, null_policy: Optional[NullPolicy] = None
+) -> Iterator[list[dict]]:
+    """Cleans a frame once, then converts it to row dicts in chunks of at most chunk_size, so only one chunk of rows exists at a time.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    table = cleaned_table(spec, null_policy)
+    for start in range(0, table.num_rows, chunk_size):
+        yield table.slice(start, chunk_size).to_pylist()
+
+
+def iter_frame_spec_chunks(
+    frames: FrameData, chunk_size: int, null_policy: Optional[NullPolicy] = None
+) -> Iterator[tuple[tuple[str, int], Nodes | Relationships]]:
+    """Streams node frames, then relationship frames, as specifications holding at most chunk_size records each.
+
+    Args:
+        frames (FrameData): Frames to stream.
+        chunk_size (int): Maximum records per yielded specification.
+        null_policy (NullPolicy): Sentinels cleaned from frames without their own null_policy. Default None for the default NullPolicy.
+
+    Returns:
+        Iterator: (kind, index) identifying the frame, and a specification with a chunk of its rows.
+    """
+    for kind, kind_frames in (
+        ("nodes", frames.nodes),
+        ("relationships", frames.relationships),
+    ):
+        for index, spec in enumerate(kind_frames):
+            for records in iter_frame_records(spec, chunk_size, null_policy):
+                yield (kind, index), spec.specification(records)
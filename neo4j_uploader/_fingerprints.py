@@ -0,0 +1,249 @@
+from neo4j_uploader.models import Nodes, Relationships
+from typing import Iterable, Optional
+import hashlib
+import json
+import sqlite3
+
+# Identities per lookup query, below SQLite's default bound parameter limit
+_SQLITE_LOOKUP_CHUNK = 500
+
+
+def _json_default(value):
+    # NumPy arrays and scalars by value, anything else by its string form
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+def record_digest(record: dict, exclude_keys: list[str] = []) -> str:
+    """Returns a stable content hash of a record's uploaded properties.
+
+    Args:
+        record (dict): Node or relationship record.
+        exclude_keys (list[str]): Keys not uploaded as properties.
+
+    Returns:
+        str: Hex digest, independent of key order.
+    """
+    props = {k: v for k, v in record.items() if k not in exclude_keys}
+    encoded = json.dumps(
+        props, sort_keys=True, default=_json_default, separators=(",", ":")
+    ).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def spec_exclude_keys(spec: Nodes | Relationships) -> list[str]:
+    """Returns the record keys of a specification that are not uploaded as properties."""
+    if isinstance(spec, Relationships) and spec.auto_exclude_keys is True:
+        return [spec.from_node.record_key, spec.to_node.record_key]
+    return spec.exclude_keys
+
+
+def record_identity(spec: Nodes | Relationships, record: dict) -> str:
+    """Returns a string identifying the node or relationship a record writes to within its specification."""
+    if isinstance(spec, Nodes):
+        parts = record.get(spec.key)
+    else:
+        parts = [
+            spec.from_node.node_label,
+            record.get(spec.from_node.record_key),
+            spec.to_node.node_label,
+            record.get(spec.to_node.record_key),
+        ]
+    return json.dumps(parts, sort_keys=True, default=str)
+
+
+class FingerprintStore:
+    """Digests of the last committed version of each record, by (database, label/type, identity).
+
+    This base class keeps digests in memory, so unchanged records are only skipped while the same store object is reused. Subclass and override get_many, put_many and clear to persist digests between processes.
+    """
+
+    def __init__(self):
+        self._digests: dict[tuple[str, str], dict[str, str]] = {}
+
+    def get_many(
+        self, database: str, name: str, identities: Iterable[str]
+    ) -> dict[str, str]:
+        """Returns the stored digest of each identity that has one."""
+        known = self._digests.get((database, name), {})
+        return {i: known[i] for i in identities if i in known}
+
+    def put_many(self, database: str, name: str, items: Iterable[tuple[str, str]]):
+        """Stores (identity, digest) pairs of committed records."""
+        self._digests.setdefault((database, name), {}).update(items)
+
+    def clear(self, database: str):
+        """Removes all digests for a database, for example after it was reset."""
+        for scope in [s for s in self._digests if s[0] == database]:
+            del self._digests[scope]
+
+
+class SQLiteFingerprintStore(FingerprintStore):
+    """FingerprintStore persisted to a local SQLite file, so unchanged records are skipped across processes and runs.
+
+    Args:
+        path (str): SQLite database file. Created if missing. ':memory:' for a temporary store.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            "database TEXT NOT NULL, name TEXT NOT NULL, identity TEXT NOT NULL, digest TEXT NOT NULL, "
+            "PRIMARY KEY (database, name, identity)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def get_many(
+        self, database: str, name: str, identities: Iterable[str]
+    ) -> dict[str, str]:
+        identities = list(identities)
+        result = {}
+        for start in range(0, len(identities), _SQLITE_LOOKUP_CHUNK):
+            chunk = identities[start : start + _SQLITE_LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT identity, digest FROM fingerprints WHERE database = ? AND name = ? AND identity IN ({placeholders})",
+                [database, name, *chunk],
+            )
+            result.update(rows)
+        return result
+
+    def put_many(self, database: str, name: str, items: Iterable[tuple[str, str]]):
+        # One transaction per committed batch
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO fingerprints (database, name, identity, digest) VALUES (?, ?, ?, ?)",
+                ((database, name, identity, digest) for identity, digest in items),
+            )
+
+    def clear(self, database: str):
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM fingerprints WHERE database = ?", (database,)
+            )
+
+    def close(self):
+        """Closes the SQLite connection."""
+        self._conn.close()
+
+
+def filter_unchanged(
+    spec: Nodes | Relationships, store: FingerprintStore, database: str
+) -> list[dict]:
+    """Returns the records of a specification whose digest differs from, or is missing in, the store.
+
+    Args:
+        spec (Nodes | Relationships): Specification to filter.
+        store (FingerprintStore): Digests from previous uploads.
+        database (str): Target Neo4j database.
+
+    Returns:
+        list[dict]: Records that need uploading, in their original order.
+    """
+    exclude_keys = spec_exclude_keys(spec)
+    identities = [record_identity(spec, r) for r in spec.records]
+    known = store.get_many(database, spec.name(), identities)
+    if len(known) == 0:
+        return spec.records
+    # All records sharing an identity are kept if any changed, so they are still applied in order
+    changed = {
+        identity
+        for identity, record in zip(identities, spec.records)
+        if known.get(identity) != record_digest(record, exclude_keys)
+    }
+    return [
+        record
+        for identity, record in zip(identities, spec.records)
+        if identity in changed
+    ]
+
+
+def commit_fingerprints(
+    spec: Nodes | Relationships,
+    records: list[dict],
+    store: Optional[FingerprintStore],
+    database: str,
+    written: Optional[list] = None,
+):
+    """Stores the digests of records from a successfully committed batch.
+
+    Args:
+        spec (Nodes | Relationships): Specification of the batch.
+        records (list[dict]): Records of the batch.
+        store (FingerprintStore): Store to update. Nothing is stored when None.
+        database (str): Target Neo4j database.
+        written (list): Rows returned by a relationships batch, with the from_key and to_key of each relationship matched. Records without a row, dropped before sending or missing a node, are not stored. Default None to store every record.
+    """
+    if store is None:
+        return
+    matched = None
+    if written is not None and isinstance(spec, Relationships):
+        from_key, to_key = spec.from_node.record_key, spec.to_node.record_key
+        matched = {
+            record_identity(spec, {from_key: r["from_key"], to_key: r["to_key"]})
+            for r in written
+        }
+    exclude_keys = spec_exclude_keys(spec)
+    identities = ((record_identity(spec, r), r) for r in records)
+    store.put_many(
+        database,
+        spec.name(),
+        (
+            (identity, record_digest(r, exclude_keys))
+            for identity, r in identities
+            if matched is None or identity in matched
+        ),
+    )
+
+
+class DeferredFingerprints:
+    """Digests of node records with embeddings, stored only once every batch writing them committed.
+
+    Embeddings are set by their own batches after the property batches of a specification, and a record's digest covers its embedding. Storing it with the property batch would skip the record on later runs even if its embedding batch failed.
+
+    Args:
+        spec (Nodes): Specification with vector_properties, after unchanged records were filtered.
+        store (FingerprintStore): Store to update.
+        database (str): Target Neo4j database.
+    """
+
+    def __init__(self, spec: Nodes, store: FingerprintStore, database: str):
+        self.spec = spec
+        self.store = store
+        self.database = database
+        names = [v.name for v in spec.vector_properties]
+        # Last record of each identity, as commit_fingerprints stores, for identities with any embedding
+        latest = {}
+        embedded = set()
+        for record in spec.records:
+            identity = record_identity(spec, record)
+            latest[identity] = record
+            if any(record.get(n) is not None for n in names):
+                embedded.add(identity)
+        self._records = {i: latest[i] for i in embedded}
+        self._pending: dict[str, int] = {}
+
+    def holds(self, record: dict) -> bool:
+        """Returns True if the digest of record's identity is deferred."""
+        return record_identity(self.spec, record) in self._records
+
+    def add_batch(self, records: list[dict]) -> set[str]:
+        """Registers a batch writing records, returning the deferred identities it writes."""
+        identities = {record_identity(self.spec, r) for r in records}
+        identities &= self._records.keys()
+        for identity in identities:
+            self._pending[identity] = self._pending.get(identity, 0) + 1
+        return identities
+
+    def commit(self, identities: set[str]):
+        """Marks a batch as committed, storing the digests of identities with no batch left."""
+        ready = []
+        for identity in identities:
+            self._pending[identity] -= 1
+            if self._pending[identity] == 0:
+                ready.append(self._records[identity])
+        commit_fingerprints(self.spec, ready, self.store, self.database)
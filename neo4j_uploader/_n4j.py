@@ -1,6 +1,10 @@
 from neo4j import GraphDatabase
+from neo4j.exceptions import ClientError
 from neo4j_uploader._logger import logger
+from neo4j_uploader.models import ResetProgress
 from typing import Tuple
+from collections.abc import Generator
+import time
 
 
 def validate_credentials(creds: Tuple[str, str, str]):
@@ -15,10 +19,15 @@ def upload_query(
     params={},
     database: str = "neo4j",
 ):
+    """Runs a batch upload query.
+
+    Returns:
+        tuple(list[neo4j.Record], neo4j.ResultSummary): Rows returned by the query, and its summary.
+    """
     host, user, password = creds
     with GraphDatabase.driver(host, auth=(user, password)) as driver:
-        _, summary, _ = driver.execute_query(query, params, database=database)
-        return summary
+        records, summary, _ = driver.execute_query(query, params, database_=database)
+        return records, summary
 
 
 def execute_query(
@@ -31,7 +40,7 @@ def execute_query(
     logger.debug(f"Using host: {host}, user: {user} to execute query: {query}")
     # Returns a tuple of records, summary, keys
     with GraphDatabase.driver(host, auth=(user, password)) as driver:
-        return driver.execute_query(query, params, database=database)
+        return driver.execute_query(query, params, database_=database)
 
 
 def run_query(
@@ -43,52 +52,257 @@ def run_query(
     database: str = "neo4j",
 ):
     with GraphDatabase.driver(uri, auth=(username, password)) as driver:
-        return driver.execute_query(query, params, database=database)
+        return driver.execute_query(query, params, database_=database)
+
+
+def run_auto_commit(
+    creds: Tuple[str, str, str],
+    query: str,
+    params: dict = {},
+    database: str = "neo4j",
+):
+    """Runs a query in an implicit (auto-commit) transaction. Required for CALL { } IN TRANSACTIONS queries, which can not run inside the managed transactions used by execute_query.
+
+    Returns:
+        tuple(list[dict], neo4j.ResultSummary): Records and summary of the query.
+    """
+    host, user, password = creds
+    with GraphDatabase.driver(host, auth=(user, password)) as driver:
+        with driver.session(database=database) as session:
+            result = session.run(query, params)
+            records = result.data()
+            return records, result.consume()
+
+
+def drop_schema(
+    creds: Tuple[str, str, str],
+    database: str = "neo4j",
+) -> int:
+    """Drops all constraints and indexes, except the built-in token lookup indexes, using a single session and transaction.
+
+    Returns:
+        int: Number of constraints and indexes dropped.
+    """
+    host, user, password = creds
+    with GraphDatabase.driver(host, auth=(user, password)) as driver:
+        with driver.session(database=database) as session:
+            constraints = [
+                r["name"] for r in session.run("SHOW CONSTRAINTS YIELD name").data()
+            ]
+            # Indexes backing a constraint are removed with their constraint
+            indexes = [
+                r["name"]
+                for r in session.run(
+                    "SHOW INDEXES YIELD name, type, owningConstraint WHERE owningConstraint IS NULL AND type <> 'LOOKUP' RETURN name"
+                ).data()
+            ]
+            if len(constraints) + len(indexes) == 0:
+                return 0
+
+            with session.begin_transaction() as tx:
+                for name in constraints:
+                    tx.run(f"DROP CONSTRAINT `{name}` IF EXISTS")
+                for name in indexes:
+                    tx.run(f"DROP INDEX `{name}` IF EXISTS")
+                tx.commit()
+
+    logger.info(
+        f"Dropped {len(constraints)} constraints and {len(indexes)} indexes from {database}"
+    )
+    return len(constraints) + len(indexes)
 
 
 def drop_constraints(
     creds: Tuple[str, str, str],
     database: str = "neo4j",
 ):
-    query = "SHOW CONSTRAINTS"
-    result = execute_query(creds, query, database=database)
+    drop_schema(creds, database)
+    return execute_query(creds, "SHOW CONSTRAINTS", database=database)
 
-    logger.info(f"Drop constraints results: {result}")
 
-    # Have to make a drop constraint request for each individually!
-    for record in result.records:
-        constraint_name = record.get("name", None)
-        if constraint_name is not None:
-            drop_query = f"DROP CONSTRAINT {constraint_name}"
-            drop_result = execute_query(creds, drop_query, database=database)
+DELETE_RELATIONSHIPS_QUERY = """MATCH ()-[r]->()
+WITH r LIMIT $limit
+CALL { WITH r DELETE r } IN TRANSACTIONS OF $batch_size ROWS
+RETURN count(*) AS deleted"""
 
-        logger.info(f"Drop constraint {constraint_name} results: {drop_result}")
+DELETE_NODES_QUERY = """MATCH (n)
+WITH n LIMIT $limit
+CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF $batch_size ROWS
+RETURN count(*) AS deleted"""
 
-    # This should now show empty
-    result = execute_query(creds, query, database=database)
 
-    return result
+DETACH_DELETE_QUERY = """MATCH (n)
+WITH n LIMIT $limit
+DETACH DELETE n
+RETURN count(*) AS deleted"""
+
+RESET_STRATEGIES = ("delete", "batched_delete", "recreate")
+
+
+def _batched_delete(
+    creds: Tuple[str, str, str],
+    database: str,
+    batch_size: int,
+    round_size: int,
+    progress: ResetProgress,
+):
+    # Relationships first so node deletes never expand supernodes
+    params = {"limit": round_size, "batch_size": batch_size}
+    summary = None
+    for phase, query in (
+        ("relationships", DELETE_RELATIONSHIPS_QUERY),
+        ("nodes", DELETE_NODES_QUERY),
+    ):
+        progress.phase = phase
+        deleted = -1
+        while deleted != 0:
+            records, summary = run_auto_commit(creds, query, params, database)
+            deleted = records[0]["deleted"] if records else 0
+            if phase == "relationships":
+                progress.relationships_deleted += deleted
+            else:
+                progress.nodes_deleted += deleted
+            logger.debug(f"Reset {database}: {progress}")
+            yield progress
+    return summary
+
+
+def _delete(
+    creds: Tuple[str, str, str],
+    database: str,
+    batch_size: int,
+    progress: ResetProgress,
+):
+    # Single managed transaction per round. Works on servers without CALL { } IN TRANSACTIONS support
+    progress.phase = "nodes"
+    summary = None
+    deleted = -1
+    while deleted != 0:
+        records, summary, _ = execute_query(
+            creds, DETACH_DELETE_QUERY, {"limit": batch_size}, database=database
+        )
+        deleted = records[0]["deleted"] if records else 0
+        progress.nodes_deleted += deleted
+        progress.relationships_deleted += getattr(
+            summary.counters, "relationships_deleted", 0
+        )
+        yield progress
+    return summary
+
+
+def _recreate(
+    creds: Tuple[str, str, str],
+    database: str,
+    timeout_seconds: int,
+    progress: ResetProgress,
+):
+    progress.phase = "recreate"
+    _, summary = run_auto_commit(
+        creds,
+        f"CREATE OR REPLACE DATABASE $name WAIT {int(timeout_seconds)} SECONDS",
+        {"name": database},
+        "system",
+    )
+    yield progress
+
+    # WAIT can return before every cluster member reports the database as online
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        records, _, _ = execute_query(
+            creds,
+            "SHOW DATABASE $name YIELD currentStatus",
+            {"name": database},
+            database="system",
+        )
+        if records and all(r["currentStatus"] == "online" for r in records):
+            break
+        if time.monotonic() > deadline:
+            raise TimeoutError(
+                f"Database {database} not online {timeout_seconds} seconds after being recreated"
+            )
+        time.sleep(0.5)
+    return summary
+
+
+def reset_generator(
+    creds: Tuple[str, str, str],
+    database: str = "neo4j",
+    batch_size: int = 10_000,
+    round_size: int = 1_000_000,
+    strategy: str = "batched_delete",
+    recreate_timeout_seconds: int = 300,
+) -> Generator[ResetProgress, None, object]:
+    """Deletes all data, constraints and indexes from a database, yielding progress.
+
+    Strategies:
+        batched_delete: Drops all constraints and indexes, then deletes relationships and then nodes. Each round deletes up to round_size elements, committed in inner CALL { } IN TRANSACTIONS of batch_size, and yields a progress update.
+
+        delete: Drops all constraints and indexes, then runs DETACH DELETE of batch_size nodes per managed transaction. For servers that do not support CALL { } IN TRANSACTIONS.
+
+        recreate: Runs CREATE OR REPLACE DATABASE from the system database and waits for it to come online. Falls back to batched_delete if the server or user does not permit it.
+
+    Args:
+        creds (str, str, str): Neo4j URI, username, and password.
+        database (str): Target Neo4j database.
+        batch_size (int): Elements deleted per transaction. Default 10,000.
+        round_size (int): Elements deleted per round trip by batched_delete. Default 1,000,000.
+        strategy (str): One of 'batched_delete', 'delete' or 'recreate'. Default 'batched_delete'.
+        recreate_timeout_seconds (int): Maximum time to wait for a recreated database to come online. Default 300.
+
+    Returns:
+        Generator[ResetProgress, None, neo4j.ResultSummary]: Progress updates. The generator's return value is the summary of the final reset query.
+    """
+    if strategy not in RESET_STRATEGIES:
+        raise ValueError(
+            f"Unknown reset strategy {strategy}. Expected one of {RESET_STRATEGIES}"
+        )
+
+    progress = ResetProgress(phase="schema", strategy=strategy)
+    summary = None
+
+    if strategy == "recreate":
+        try:
+            summary = yield from _recreate(
+                creds, database, recreate_timeout_seconds, progress
+            )
+        except ClientError as e:
+            logger.warning(
+                f"Unable to recreate database {database}, falling back to batched_delete: {e}"
+            )
+            progress.strategy = "batched_delete"
+
+    if progress.strategy != "recreate":
+        progress.phase = "schema"
+        progress.schema_dropped = drop_schema(creds, database)
+        yield progress
+
+        if progress.strategy == "delete":
+            summary = yield from _delete(creds, database, batch_size, progress)
+        else:
+            summary = yield from _batched_delete(
+                creds, database, batch_size, round_size, progress
+            )
+
+    progress.phase = "complete"
+    yield progress
+    return summary
 
 
 def reset(
     creds: Tuple[str, str, str],
     database: str = "neo4j",
 ):
-    drop_constraints(creds, database)
-
-    deleted_nodes_count = -1
-    while deleted_nodes_count != 0:
-        query = """
-        MATCH (n)
-        OPTIONAL MATCH (n)-[r]-()
-        WITH n, r LIMIT 50000
-        DELETE n, r
-        RETURN count(n) as deletedNodesCount
-        """
-        records, summary, keys = execute_query(creds, query, database=database)
-        deleted_nodes_count = records[0]["deletedNodesCount"]
+    """Deletes all data, constraints and indexes from a database.
 
-    return summary
+    Returns:
+        neo4j.ResultSummary: Summary of the final delete query.
+    """
+    gen = reset_generator(creds, database)
+    while True:
+        try:
+            next(gen)
+        except StopIteration as stop:
+            return stop.value
 
 
 def create_new_node_constraints(
@@ -0,0 +1,93 @@
+from neo4j_uploader.models import (
+    Neo4jConfig,
+    Nodes,
+    Relationships,
+    SpecPlan,
+    ThroughputModel,
+    UploadPlan,
+)
+from neo4j_uploader._queries import iter_chunked_query
+from typing import Iterable
+import json
+import re
+
+# Inline row list at the start of every generated upload query
+_ROW_LIST = re.compile(r"^WITH \[.*\] AS (\w+)$", re.MULTILINE)
+
+
+def query_template(query: str) -> str:
+    """Returns the shape of an upload query, with its inline row list replaced by '$rows'."""
+    return _ROW_LIST.sub(r"WITH $rows AS \1", query, count=1)
+
+
+def plan_specifications(
+    specifications: list[Nodes | Relationships],
+    config: Neo4jConfig,
+    throughput: ThroughputModel,
+) -> UploadPlan:
+    """Generates every batch query without running it, and summarises them.
+
+    Queries are consumed one at a time, so only a single batch is held in memory in addition to the records.
+
+    Args:
+        specifications (list[Nodes | Relationships]): Specifications in upload order.
+        config (Neo4jConfig): Upload configuration.
+        throughput (ThroughputModel): Assumed server performance.
+
+    Returns:
+        UploadPlan: Per specification totals, distinct query templates and estimates.
+    """
+    return plan_spec_chunks(enumerate(specifications), config, throughput)
+
+
+def plan_spec_chunks(
+    spec_chunks: Iterable[tuple[object, Nodes | Relationships]],
+    config: Neo4jConfig,
+    throughput: ThroughputModel,
+) -> UploadPlan:
+    """Summarises the batch queries of specifications arriving in chunks, as streamed from a payload file, without running them.
+
+    Args:
+        spec_chunks (Iterable[tuple[object, Nodes | Relationships]]): Specification identifier and a specification holding a chunk of its records. Chunks sharing an identifier are planned as one specification.
+        config (Neo4jConfig): Upload configuration.
+        throughput (ThroughputModel): Assumed server performance.
+
+    Returns:
+        UploadPlan: Per specification totals, distinct query templates and estimates.
+    """
+    plans = {}
+    templates = {}
+
+    create_only = config.overwrite or config.assume_empty
+    created_keys = {}
+    for spec_id, spec in spec_chunks:
+        plan = plans.get(spec_id)
+        if plan is None:
+            plan = plans[spec_id] = SpecPlan(
+                name=spec.name(),
+                element_type="nodes" if isinstance(spec, Nodes) else "relationships",
+                records=0,
+            )
+        plan.records += len(spec.records)
+
+        for _, query, params, rows in iter_chunked_query(
+            spec, config, create_only, created_keys
+        ):
+            query_bytes = len(query.encode())
+            parameter_bytes = len(json.dumps(params, default=str).encode())
+
+            plan.batches += 1
+            plan.records_after_dedupe += rows
+            plan.query_bytes += query_bytes
+            plan.parameter_bytes += parameter_bytes
+            plan.estimated_seconds += throughput.batch_seconds(
+                plan.element_type, rows, query_bytes + parameter_bytes
+            )
+            templates.setdefault(query_template(query), None)
+
+    return UploadPlan(
+        specs=list(plans.values()),
+        query_templates=list(templates),
+        throughput=throughput,
+        will_reset=config.overwrite,
+    )
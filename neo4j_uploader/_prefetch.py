@@ -0,0 +1,248 @@
+from neo4j_uploader.models import Nodes, NullPolicy, Relationships
+from neo4j_uploader._fingerprints import spec_exclude_keys
+from neo4j_uploader._queries import (
+    CompiledNodes,
+    CompiledRelationships,
+    RecordSchema,
+    convert_to_hashable,
+    escaped,
+    merged_by_key,
+    nodes_query,
+    relationships_query,
+)
+from neo4j_uploader._n4j import execute_query
+from neo4j_uploader._logger import logger
+from typing import Optional, Tuple
+
+
+class KeyExistenceCache:
+    """Known existence of node key values, by (label, key property). Shared between the node and relationship phases of an upload."""
+
+    def __init__(self):
+        self._known: dict[tuple[str, str], dict] = {}
+        self._staged: Optional[tuple[str, str, list]] = None
+
+    def scope(self, label: str, key: str) -> dict:
+        """Returns the {key value: exists} mapping for a label and key property."""
+        return self._known.setdefault((label, key), {})
+
+    def mark(self, label: str, key: str, values, exists: bool = True):
+        """Records whether hashable key values exist."""
+        known = self.scope(label, key)
+        for value in values:
+            known[value] = exists
+
+    def stage(self, label: str, key: str, values):
+        """Holds the hashable key values a pending batch creates, replacing those of an earlier batch that never committed. They are unknown until commit_staged, so a failed batch leaves them to be looked up again."""
+        values = list(values)
+        known = self.scope(label, key)
+        for value in values:
+            known.pop(value, None)
+        self._staged = (label, key, values)
+
+    def commit_staged(self):
+        """Records the staged key values as existing, once their batch committed."""
+        if self._staged is not None:
+            self.mark(*self._staged)
+            self._staged = None
+
+    def exists(self, label: str, key: str, value) -> Optional[bool]:
+        """Returns True or False if a hashable key value is known to exist or not, None if unknown."""
+        return self._known.get((label, key), {}).get(value)
+
+    def prefetch(
+        self,
+        creds: Tuple[str, str, str],
+        database: str,
+        label: str,
+        key: str,
+        values: list,
+    ):
+        """Queries, with a single indexed UNWIND, which of the values not yet known exist and caches the result.
+
+        Args:
+            creds (str, str, str): Neo4j URI, username, and password.
+            database (str): Target Neo4j database.
+            label (str): Node label to look up.
+            key (str): Node key property.
+            values (list): Raw key values to check.
+        """
+        known = self.scope(label, key)
+        unknown = {}
+        for value in values:
+            hashable = convert_to_hashable(value)
+            if hashable not in known:
+                unknown[hashable] = value
+        if len(unknown) == 0:
+            return
+
+        query = f"UNWIND $keys AS k\nMATCH (n:{escaped(label)} {{{escaped(key)}:k}})\nRETURN n.{escaped(key)} AS key"
+        records, _, _ = execute_query(
+            creds, query, {"keys": list(unknown.values())}, database=database
+        )
+        found = {convert_to_hashable(r["key"]) for r in records}
+        for hashable in unknown:
+            known[hashable] = hashable in found
+        logger.debug(
+            f"Prefetched {len(unknown)} {label}.{key} keys, {len(found)} exist"
+        )
+
+
+def compiled_nodes(
+    spec: Nodes,
+    operation: str,
+    fingerprint_property: Optional[str] = None,
+    null_policy: Optional[NullPolicy] = None,
+    schema: Optional[RecordSchema] = None,
+) -> CompiledNodes:
+    """Returns the query parts of a Nodes specification for one operation, 'CREATE' or 'MATCH', shared by all of its prefetched batches."""
+    return CompiledNodes(
+        spec.key,
+        spec.labels,
+        spec_exclude_keys(spec),
+        operation=operation,
+        fingerprint_property=fingerprint_property,
+        null_policy=null_policy,
+        map_mode=spec.map_mode,
+        schema=schema,
+    )
+
+
+def compiled_relationships(
+    spec: Relationships,
+    fingerprint_property: Optional[str] = None,
+    null_policy: Optional[NullPolicy] = None,
+    schema: Optional[RecordSchema] = None,
+) -> CompiledRelationships:
+    """Returns the query parts of a Relationships specification, shared by all of its prefetched batches."""
+    return CompiledRelationships(
+        spec.from_node,
+        spec.to_node,
+        spec.type,
+        spec_exclude_keys(spec),
+        spec.dedupe,
+        fingerprint_property,
+        null_policy,
+        spec.map_mode,
+        schema,
+    )
+
+
+def prefetched_nodes_queries(
+    creds: Tuple[str, str, str],
+    database: str,
+    batch: str,
+    records: list[dict],
+    spec: Nodes,
+    cache: KeyExistenceCache,
+    create: Optional[CompiledNodes] = None,
+    update: Optional[CompiledNodes] = None,
+) -> list[tuple[str, dict]]:
+    """Splits a chunk of node records into a CREATE batch for new keys and a MATCH ... SET batch for existing keys.
+
+    The new keys are staged in cache, to be marked as existing by KeyExistenceCache.commit_staged once the batch commits.
+
+    Args:
+        create (CompiledNodes): CREATE query parts of spec. Default None, compiled by compiled_nodes for this chunk.
+        update (CompiledNodes): MATCH query parts of spec. Default None, compiled by compiled_nodes for this chunk.
+
+    Returns:
+        list[tuple[str, dict]]: Up to two queries and params.
+    """
+    if create is None:
+        create = compiled_nodes(spec, "CREATE")
+    if update is None:
+        update = compiled_nodes(
+            spec, "MATCH", create.fingerprint_property, create.null_policy
+        )
+
+    label = spec.labels[0]
+    records = merged_by_key(records, spec.key, create.null_policy)
+    cache.prefetch(creds, database, label, spec.key, [r.get(spec.key) for r in records])
+
+    create_records = []
+    update_records = []
+    for record in records:
+        value = convert_to_hashable(record.get(spec.key))
+        if cache.exists(label, spec.key, value):
+            update_records.append(record)
+        else:
+            create_records.append(record)
+
+    # Later chunks and relationships will find these once this batch commits
+    cache.stage(
+        label,
+        spec.key,
+        [convert_to_hashable(r.get(spec.key)) for r in create_records],
+    )
+
+    result = []
+    if create_records:
+        result.append(
+            nodes_query(
+                f"{batch}c", create_records, spec.key, spec.labels, compiled=create
+            )
+        )
+    if update_records:
+        result.append(
+            nodes_query(
+                f"{batch}u", update_records, spec.key, spec.labels, compiled=update
+            )
+        )
+    return result
+
+
+def prefetched_relationships_queries(
+    creds: Tuple[str, str, str],
+    database: str,
+    batch: str,
+    records: list[dict],
+    spec: Relationships,
+    cache: KeyExistenceCache,
+    compiled: Optional[CompiledRelationships] = None,
+) -> list[tuple[str, dict]]:
+    """Drops relationship records whose labelled from or to node is known not to exist, as they could never be matched.
+
+    Args:
+        compiled (CompiledRelationships): Query parts of spec. Default None, compiled by compiled_relationships for this chunk.
+
+    Returns:
+        list[tuple[str, dict]]: Zero or one queries and params.
+    """
+    if compiled is None:
+        compiled = compiled_relationships(spec)
+
+    for target in (spec.from_node, spec.to_node):
+        if target.node_label is None:
+            continue
+        cache.prefetch(
+            creds,
+            database,
+            target.node_label,
+            target.node_key,
+            [r.get(target.record_key) for r in records],
+        )
+
+    def missing(target, record) -> bool:
+        if target.node_label is None:
+            return False
+        value = convert_to_hashable(record.get(target.record_key))
+        return cache.exists(target.node_label, target.node_key, value) is False
+
+    kept = [
+        r
+        for r in records
+        if not missing(spec.from_node, r) and not missing(spec.to_node, r)
+    ]
+    if len(kept) < len(records):
+        logger.debug(
+            f"Skipping {len(records) - len(kept)} {spec.type} relationships with missing nodes"
+        )
+    if len(kept) == 0:
+        return []
+
+    return [
+        relationships_query(
+            batch, kept, spec.from_node, spec.to_node, spec.type, compiled=compiled
+        )
+    ]
@@ -0,0 +1,76 @@
+from neo4j_uploader.models import AllocationSite, PhaseMemory
+from neo4j_uploader._logger import logger
+from contextlib import contextmanager
+import tracemalloc
+
+# Frames from these modules are excluded from allocation site reports
+_IGNORED_FILES = (tracemalloc.__file__, __file__)
+
+
+class MemoryProfiler:
+    """Collects peak memory and top allocation sites per upload phase using tracemalloc.
+
+    Args:
+        enabled (bool): When False all methods are no-ops.
+        top (int): Number of allocation sites to report per phase. Default 10.
+    """
+
+    def __init__(self, enabled: bool, top: int = 10):
+        self.enabled = enabled
+        self.top = top
+        self.phases: list[PhaseMemory] = []
+        self._started_tracing = False
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        snapshot = tracemalloc.take_snapshot()
+        return snapshot.filter_traces(
+            [tracemalloc.Filter(False, f) for f in _IGNORED_FILES]
+        )
+
+    @contextmanager
+    def phase(self, name: str):
+        """Context manager measuring memory for the enclosed phase of work.
+
+        Args:
+            name (str): Name of the phase, ie 'validation' or 'upload'.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = self._snapshot()
+        start_current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            stats = self._snapshot().compare_to(start, "lineno")
+            sites = [
+                AllocationSite(
+                    file=stat.traceback[0].filename,
+                    line=stat.traceback[0].lineno,
+                    size_bytes=stat.size_diff,
+                    count=stat.count_diff,
+                )
+                for stat in [s for s in stats if s.size_diff > 0][: self.top]
+            ]
+            result = PhaseMemory(
+                phase=name,
+                peak_bytes=peak,
+                allocated_bytes=current - start_current,
+                top_allocations=sites,
+            )
+            self.phases.append(result)
+            logger.info(
+                f"Memory phase {name}: peak {peak / 1_048_576:.1f} MiB, net {result.allocated_bytes / 1_048_576:.1f} MiB"
+            )
+
+    def stop(self):
+        """Stops tracemalloc if this profiler started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
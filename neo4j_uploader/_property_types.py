@@ -0,0 +1,163 @@
+from neo4j_uploader.models import Nodes, NullPolicy, Relationships
+from neo4j.spatial import WGS84Point
+from neo4j.time import Date, DateTime, Duration
+from typing import Any, Callable, Optional
+import re
+
+# Records sampled per specification when inferring property types
+INFERENCE_SAMPLE_SIZE = 100
+
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_DATETIME = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}(:?\d{2})?)?"
+)
+# UTC offset without a colon, ie +0100 or +01, which DateTime.from_iso_format requires as +01:00
+_COMPACT_OFFSET = re.compile(r"([+-]\d{2})(\d{2})?$")
+_DURATION = re.compile(
+    r"P(?=\d|T\d)(\d+Y)?(\d+M)?(\d+W)?(\d+D)?(T(?=\d)(\d+H)?(\d+M)?(\d+(\.\d+)?S)?)?"
+)
+
+# Map keys accepted for a point, as (latitude, longitude)
+_POINT_KEYS = (("latitude", "longitude"), ("lat", "lon"), ("lat", "lng"))
+
+
+def _point_keys(value) -> Optional[tuple[str, str]]:
+    if isinstance(value, dict) and len(value) == 2:
+        for keys in _POINT_KEYS:
+            if keys[0] in value and keys[1] in value:
+                return keys
+    return None
+
+
+def _is_point(value) -> bool:
+    keys = _point_keys(value)
+    return keys is not None and all(
+        isinstance(value[k], (int, float)) and not isinstance(value[k], bool)
+        for k in keys
+    )
+
+
+def _to_date(value):
+    return Date.from_iso_format(value)
+
+
+def _to_datetime(value):
+    value = value.replace(" ", "T", 1)
+    # The offset follows the time, so the date's hyphens are never matched
+    offset = _COMPACT_OFFSET.search(value, 11)
+    if offset is not None:
+        value = f"{value[:offset.start()]}{offset[1]}:{offset[2] or '00'}"
+    return DateTime.from_iso_format(value)
+
+
+def _to_duration(value):
+    return Duration.from_iso_format(value)
+
+
+def _to_point(value):
+    lat_key, lon_key = _point_keys(value)
+    return WGS84Point((float(value[lon_key]), float(value[lat_key])))
+
+
+# Detector of values each type converts, and the conversion
+_TYPES: dict[str, tuple[Callable[[Any], bool], Callable[[Any], Any]]] = {
+    "date": (
+        lambda v: isinstance(v, str) and _DATE.fullmatch(v) is not None,
+        _to_date,
+    ),
+    "datetime": (
+        lambda v: isinstance(v, str) and _DATETIME.fullmatch(v) is not None,
+        _to_datetime,
+    ),
+    "duration": (
+        lambda v: isinstance(v, str) and _DURATION.fullmatch(v) is not None,
+        _to_duration,
+    ),
+    "point": (_is_point, _to_point),
+}
+
+
+def _converts(convert: Callable[[Any], Any], value) -> bool:
+    try:
+        convert(value)
+    except (ValueError, TypeError, KeyError, AttributeError):
+        return False
+    return True
+
+
+def _infer_type(values: list) -> Optional[str]:
+    # First type matching and converting every sampled value, so a value like 2024-02-30 leaves its property untyped
+    for name, (detect, convert) in _TYPES.items():
+        if all(detect(v) for v in values) and all(_converts(convert, v) for v in values):
+            return name
+    return None
+
+
+def _reference_keys(spec: Nodes | Relationships) -> set[str]:
+    # Keys matched against existing node keys, never converted by inference
+    if isinstance(spec, Nodes):
+        return {spec.key}
+    return {spec.from_node.record_key, spec.to_node.record_key}
+
+
+def infer_property_types(
+    spec: Nodes | Relationships,
+    null_policy: NullPolicy,
+    sample_size: int = INFERENCE_SAMPLE_SIZE,
+) -> dict[str, str]:
+    """Detects ISO dates, datetimes, durations and latitude/longitude maps from the first sample_size records of a specification.
+
+    A property gets a type only if all of its sampled non null values match and convert to it. Key and node reference properties are not inferred, so they keep matching existing nodes.
+
+    Returns:
+        dict[str, str]: Inferred type by property.
+    """
+    skipped = _reference_keys(spec) | set(spec.exclude_keys or [])
+    samples: dict[str, list] = {}
+    for record in spec.records[:sample_size]:
+        for k, v in record.items():
+            if k in skipped or null_policy.is_null(v, k):
+                continue
+            samples.setdefault(k, []).append(v)
+
+    result = {}
+    for k, values in samples.items():
+        inferred = _infer_type(values)
+        if inferred is not None:
+            result[k] = inferred
+    return result
+
+
+def _safe(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    # Values that do not convert are uploaded unchanged
+    def converted(value):
+        try:
+            return convert(value)
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return value
+
+    return converted
+
+
+def property_converters(
+    spec: Nodes | Relationships, null_policy: NullPolicy
+) -> dict[str, Callable[[Any], Any]]:
+    """Returns the conversion of each typed property of a specification: inferred types when infer_types is set, overridden by property_types. 'string' keeps values unchanged."""
+    types = {}
+    if spec.infer_types:
+        types.update(infer_property_types(spec, null_policy))
+    types.update(spec.property_types)
+    return {k: _safe(_TYPES[t][1]) for k, t in types.items() if t in _TYPES}
+
+
+def converted_records(
+    records: list[dict], converters: dict[str, Callable[[Any], Any]]
+) -> list[dict]:
+    """Returns copies of records with typed properties converted, one column at a time. Null values are left for the null policy."""
+    result = [dict(r) for r in records]
+    for k, convert in converters.items():
+        for record in result:
+            value = record.get(k)
+            if value is not None:
+                record[k] = convert(value)
+    return result
@@ -4,11 +4,17 @@ from neo4j_uploader.models import (
     Relationships,
     TargetNode,
     Neo4jConfig,
+    NullPolicy,
 )
 from neo4j_uploader._logger import logger
+from neo4j_uploader._fingerprints import record_digest, spec_exclude_keys
+from neo4j_uploader._vectors import iter_vector_queries, without_vectors
+from neo4j_uploader._property_types import converted_records, property_converters
 from enum import Enum
+from typing import Iterable, Iterator, Optional, Sequence
 from copy import deepcopy
 import json
+import re
 
 
 class ElementType(Enum):
@@ -47,7 +53,188 @@ def deduped(data: list[any]) -> list[any]:
     return unique
 
 
-def properties(suffix: str, record: dict, exclude_keys: list[str] = []) -> (str, dict):
+# Policy used when none is passed
+DEFAULT_NULL_POLICY = NullPolicy()
+
+
+def is_null(value) -> bool:
+    """Returns True for values that are not uploaded as properties by the default NullPolicy: None and the strings 'none', 'null', 'empty' and '' in any case."""
+    return DEFAULT_NULL_POLICY.is_null(value)
+
+
+def spec_null_policy(spec: Nodes | Relationships, config: Neo4jConfig) -> NullPolicy:
+    """Returns the null policy of a specification, or the config's when it has none."""
+    return config.null_policy if spec.null_policy is None else spec.null_policy
+
+
+def query_records(
+    records: list[dict], vector_names: set[str], converters: dict
+) -> list[dict]:
+    """Returns a chunk of records as uploaded by property queries: without embeddings, which have their own batches, and with typed properties converted."""
+    if vector_names:
+        records = without_vectors(records, vector_names)
+    if converters:
+        records = converted_records(records, converters)
+    return records
+
+
+def merged_by_key(
+    records: list[dict], key: str, null_policy: Optional[NullPolicy] = None
+) -> list[dict]:
+    """Combines records sharing the same key value into a single record, in first seen order.
+
+    Later records override earlier property values, except with null values, matching the result of consecutive MERGE and SET += statements for the same node.
+
+    Args:
+        records (list[dict]): Node records.
+        key (str): Property that uniquely identifies a node.
+        null_policy (NullPolicy): Values that do not override earlier ones. Default None for the default NullPolicy.
+
+    Returns:
+        list[dict]: One record per distinct key value.
+    """
+    policy = DEFAULT_NULL_POLICY if null_policy is None else null_policy
+    merged = {}
+    copied = set()
+    for record in records:
+        value = convert_to_hashable(record.get(key))
+        existing = merged.get(value)
+        if existing is None:
+            merged[value] = record
+            continue
+        if value not in copied:
+            # Copy before the first update to avoid modifying the caller's record
+            existing = dict(existing)
+            merged[value] = existing
+            copied.add(value)
+        for k, v in record.items():
+            if not policy.is_null(v, k):
+                existing[k] = v
+    return list(merged.values())
+
+
+# Classes Neo4j stores natively as list elements
+_LIST_ELEMENT_TYPES = frozenset((str, int, float, bool))
+
+# Characters not allowed in parameter names
+_NON_PARAM_CHARS = re.compile(r"\W")
+
+
+def _list_element_type(value: list) -> Optional[type]:
+    # Shared element class of a homogeneous list of primitives, else None
+    element_type = value[0].__class__
+    if element_type not in _LIST_ELEMENT_TYPES:
+        return None
+    for v in value:
+        if v.__class__ is not element_type:
+            return None
+    return element_type
+
+
+class PropertyValues:
+    """Converts list and map values of records into property values.
+
+    Lists of a single primitive type (str, int, float or bool) are kept as native lists. The element type found for each property is cached, so later lists of that property are confirmed with a single pass. Maps, and lists Neo4j cannot store, are handled by map_mode:
+    'str' stores their Python string form, 'json' stores them serialized once as compact JSON and 'flatten' stores each map entry as its own property named with dotted keys, ie `address.city`.
+
+    Args:
+        map_mode (str): 'str', 'json' or 'flatten'. Default 'str'.
+    """
+
+    def __init__(self, map_mode: str = "str"):
+        self.map_mode = map_mode
+        self._list_types: dict[str, type] = {}
+
+    def _serialized(self, value) -> str:
+        if self.map_mode == "str":
+            return str(value)
+        return json.dumps(value, separators=(",", ":"), default=str)
+
+    def list_value(self, key: str, value: list):
+        """Returns value unchanged if Neo4j can store it as a list, else its serialized form."""
+        if len(value) == 0:
+            return value
+        cached = self._list_types.get(key)
+        if cached is not None and all(v.__class__ is cached for v in value):
+            return value
+        element_type = _list_element_type(value)
+        if element_type is None:
+            return self._serialized(value)
+        self._list_types[key] = element_type
+        return value
+
+    def _flatten(self, prefix: str, value: dict, result: list[tuple[str, object]]):
+        for k in sorted(value):
+            name = f"{prefix}.{k}"
+            v = value[k]
+            if isinstance(v, dict):
+                self._flatten(name, v, result)
+            elif isinstance(v, list):
+                result.append((name, self.list_value(name, v)))
+            else:
+                result.append((name, v))
+
+    def items(self, key: str, value: list | dict) -> list[tuple[str, object]]:
+        """Returns the properties stored for a list or dict value of key, as (name, value) pairs."""
+        if isinstance(value, list):
+            return [(key, self.list_value(key, value))]
+        if self.map_mode != "flatten":
+            return [(key, self._serialized(value))]
+        result = []
+        self._flatten(key, value, result)
+        return result
+
+
+class RecordSchema:
+    """Property layout of records sharing one set of keys, computed once per specification.
+
+    Records with exactly these keys reuse the sorted, filtered property columns instead of filtering and sorting their own keys. Records of any other shape fall back to doing so.
+
+    Args:
+        keys (Iterable[str]): Keys of the expected record shape, ie the first record of a specification.
+        exclude_keys (Iterable[str]): Keys not uploaded as properties.
+    """
+
+    def __init__(self, keys: Iterable[str], exclude_keys: Iterable[str] = ()):
+        self.keys = frozenset(keys)
+        self.excluded = frozenset(exclude_keys)
+        self.columns = tuple(sorted(self.keys - self.excluded))
+
+    def record_columns(self, record: dict) -> Sequence[str]:
+        """Returns the sorted property keys of a record."""
+        # Set comparison of the dict's key view, without copying it
+        if record.keys() == self.keys:
+            return self.columns
+        return sorted(k for k in record if k not in self.excluded)
+
+
+def record_schema(
+    records: list[dict], exclude_keys: Optional[list[str]] = None
+) -> Optional[RecordSchema]:
+    """Returns the RecordSchema of the first of records, or None if there are none."""
+    if len(records) == 0:
+        return None
+    return RecordSchema(records[0], exclude_keys or ())
+
+
+def spec_schema(
+    spec: Nodes | Relationships, vector_names: Iterable[str] = ()
+) -> Optional[RecordSchema]:
+    """Returns the RecordSchema of a specification's first record, without its vector properties, or None if it has no records."""
+    if len(spec.records) == 0:
+        return None
+    return RecordSchema(spec.records[0].keys() - set(vector_names), spec_exclude_keys(spec))
+
+
+def properties(
+    suffix: str,
+    record: dict,
+    exclude_keys: list[str] = [],
+    null_policy: Optional[NullPolicy] = None,
+    values: Optional[PropertyValues] = None,
+    schema: Optional[RecordSchema] = None,
+    params: Optional[dict] = None,
+) -> (str, dict):
 
     # Sample string output
     # " {`age`:$age_test_0, `name`:$name_test_0}"
@@ -58,47 +245,62 @@ def properties(suffix: str, record: dict, exclude_keys: list[str] = []) -> (str,
     #   "name_test_0": "John Wick"
     # }
 
-    # Convert each batch of records
-    result_params = {}
+    # Params of a whole batch are written to one dict when given
+    result_params = {} if params is None else params
 
-    # Filter out unwanted keys
-    filtered_keys = [key for key in record.keys() if key not in exclude_keys]
+    if schema is not None:
+        # Sorted once per record shape
+        sorted_keys = schema.record_columns(record)
+    else:
+        # Filter out unwanted keys
+        filtered_keys = [key for key in record.keys() if key not in exclude_keys]
 
-    # Sort keys for consistent testing
-    sorted_keys = sorted(list(filtered_keys))
+        # Sort keys for consistent testing
+        sorted_keys = sorted(filtered_keys)
 
+    policy = DEFAULT_NULL_POLICY if null_policy is None else null_policy
+    default_null = policy.null_check()
+    overrides = policy.column_sentinels
+
+    # Extended in place, without holding a list of fragments
     query = " {"
-    for k_idx, a_key in enumerate(sorted_keys):
+    separator = ""
+    for a_key in sorted_keys:
 
         value = record[a_key]
 
         # Do not set properties with a None/Null/Empty value
-        if value is None:
+        value_is_null = (
+            policy.null_check(a_key) if a_key in overrides else default_null
+        )
+        if value_is_null(value):
             continue
-        if isinstance(value, str):
-            if value.lower() == "none":
-                continue
-            if value.lower() == "null":
-                continue
-            if value.lower() == "empty":
-                continue
-            if value.lower() == "":
-                continue
-
-        # Nested dicts and lists not supported
-        if isinstance(value, dict) or isinstance(value, list):
-            value = str(value)
 
-        # Prefix multiple items in Cypher with comma
-        if k_idx != 0:
-            query += ", "
-
-        # Add params for query
-        param_key = f"{a_key}_{suffix}"
-        result_params[param_key] = value
+        if not isinstance(value, (dict, list)):
+            # Add params for query
+            param_key = f"{a_key}_{suffix}"
+            while param_key in result_params and result_params[param_key] is not value:
+                # Taken by a flattened map entry or a reserved key param. The same value, like a node's own key, shares its param
+                param_key = f"_{param_key}"
+            result_params[param_key] = value
+
+            # Add string representation of property data, comma separated
+            query += f"{separator}`{a_key}`:${param_key}"
+            separator = ", "
+            continue
 
-        # Add string representation of property data
-        query += f"`{a_key}`:${param_key}"
+        # Lists and maps, possibly expanded to several dotted properties
+        if values is None:
+            values = PropertyValues()
+        for name, item in values.items(a_key, value):
+            if name != a_key and policy.is_null(item, name):
+                continue
+            param_key = f"{_NON_PARAM_CHARS.sub('_', name)}_{suffix}"
+            while param_key in result_params:
+                param_key = f"_{param_key}"
+            result_params[param_key] = item
+            query += f"{separator}`{name}`:${param_key}"
+            separator = ", "
 
     # Close out query
     query += "}"
@@ -113,6 +315,10 @@ def node_elements(
     key: str,
     dedupe: bool = True,
     exclude_keys: list[str] = [],
+    fingerprint_property: Optional[str] = None,
+    null_policy: Optional[NullPolicy] = None,
+    map_mode: str = "str",
+    schema: Optional[RecordSchema] = None,
 ) -> (str, dict):
 
     # Sample string output
@@ -130,18 +336,17 @@ def node_elements(
     if dedupe == True:
         records = deduped(records)
 
-    # Convert each batch of records
-    # result_str_list = []
+    # Params of every record go to one dict. The element string is extended in place, which CPython does without copying, so assembly stays linear and holds a single copy of the string
     result_str = ""
     result_params = {}
+    values = PropertyValues(map_mode)
+    if schema is None:
+        schema = record_schema(records, exclude_keys)
     for idx, record in enumerate(records):
 
         # Suffix to uniquely id params
         suffix = f"{batch}{idx}"
 
-        query, param = properties(suffix, record, exclude_keys)
-        result_params.update(param)
-
         key_placeholder = f"{key}_{suffix}"
         key_value = record[key]
 
@@ -149,20 +354,116 @@ def node_elements(
         if isinstance(key_value, dict) or isinstance(key_value, list):
             key_value = str(key_value)
 
-        result_params.update({key_placeholder: key_value})
+        # Reserved before property params are named, so a flattened map entry can not take the key's or digest's name
+        result_params[key_placeholder] = key_value
+        if fingerprint_property is not None:
+            # Content hash of the record, only written when it differs from the stored one
+            digest_placeholder = f"{fingerprint_property}_{suffix}"
+            result_params[digest_placeholder] = record_digest(record, schema.excluded)
+
+        query, _ = properties(
+            suffix, record, exclude_keys, null_policy, values, schema, result_params
+        )
 
         if idx != 0:
             result_str += ", "
-        result_str += f"[${key_placeholder}, {query}]"
+        if fingerprint_property is None:
+            result_str += f"[${key_placeholder}, {query}]"
+        else:
+            result_str += f"[${key_placeholder}, {query}, ${digest_placeholder}]"
 
-    # Compile results
-    # if len(result_str_list) == 0:
-    #     result_str = None
-    # else:
-    #     result_str = ",".join(result_str_list)
     return (result_str, result_params)
 
 
+def escaped(name: str) -> str:
+    """Returns a label, type or property name quoted with backticks for Cypher."""
+    return "`" + name.replace("`", "``") + "`"
+
+
+class CompiledNodes:
+    """Query parts of a Nodes specification, resolved once and shared by all of its batches.
+
+    Args:
+        key (str): Unique key for each node.
+        labels (list[str]): Node labels.
+        exclude_keys (Iterable[str]): Keys not uploaded as properties. Default ().
+        dedupe (bool): Remove duplicate records and MERGE, else CREATE. Default True.
+        operation (str): Overrides the clause locating each node, as for nodes_query. Default None.
+        fingerprint_property (str): Node property holding the content hash of each record. Default None.
+        null_policy (NullPolicy): Values not uploaded as properties. Default None for the default NullPolicy.
+        map_mode (str): How maps, and lists Neo4j cannot store, are uploaded. Default 'str'.
+        schema (RecordSchema): Expected record shape. Default None, taken from the first record of each batch.
+    """
+
+    __slots__ = (
+        "key",
+        "exclude_keys",
+        "dedupe",
+        "operation",
+        "fingerprint_property",
+        "null_policy",
+        "map_mode",
+        "schema",
+        "clauses",
+    )
+
+    def __init__(
+        self,
+        key: str,
+        labels: list[str],
+        exclude_keys: Iterable[str] = (),
+        dedupe: bool = True,
+        operation: Optional[str] = None,
+        fingerprint_property: Optional[str] = None,
+        null_policy: Optional[NullPolicy] = None,
+        map_mode: str = "str",
+        schema: Optional[RecordSchema] = None,
+    ):
+        if operation is not None:
+            dedupe = operation == "MERGE"
+        elif dedupe == True:
+            operation = "MERGE"
+        else:
+            operation = "CREATE"
+
+        self.key = key
+        self.exclude_keys = frozenset(exclude_keys or ())
+        self.dedupe = dedupe
+        self.operation = operation
+        self.fingerprint_property = fingerprint_property
+        self.null_policy = null_policy
+        self.map_mode = map_mode
+        self.schema = schema
+
+        # Everything after the node list
+        clauses = f"\nUNWIND node_data AS node\n{operation} (n:{escaped(labels[0])} {{ {escaped(key)}:node[0]}} )"
+        if fingerprint_property is None:
+            clauses += "\nSET n += node[1]"
+        for label in labels[1:]:
+            clauses += f"\nSET n:{escaped(label)}"
+        if fingerprint_property is not None:
+            fingerprint = escaped(fingerprint_property)
+            clauses += f"\nWITH n, node WHERE n.{fingerprint} IS NULL OR n.{fingerprint} <> node[2]\nSET n += node[1], n.{fingerprint} = node[2]"
+        self.clauses = clauses
+
+    def batch(self, batch: str, records: list[dict]) -> tuple[str, dict, int]:
+        """Returns the query and params uploading a non empty batch of records, and the number of rows in the query once duplicates are removed."""
+        if self.dedupe:
+            records = deduped(records)
+        elements_str, params = node_elements(
+            batch=batch,
+            records=records,
+            key=self.key,
+            dedupe=False,
+            exclude_keys=self.exclude_keys,
+            fingerprint_property=self.fingerprint_property,
+            null_policy=self.null_policy,
+            map_mode=self.map_mode,
+            schema=self.schema,
+        )
+        return f"WITH [{elements_str}] AS node_data{self.clauses}", params, len(records)
+
+
 def nodes_query(
     batch: str,
     records: list[dict],
@@ -170,6 +471,12 @@ def nodes_query(
     labels: list[str],
     exclude_keys: list[str] = [],
     dedupe: bool = True,
+    operation: Optional[str] = None,
+    fingerprint_property: Optional[str] = None,
+    null_policy: Optional[NullPolicy] = None,
+    map_mode: str = "str",
+    schema: Optional[RecordSchema] = None,
+    compiled: Optional[CompiledNodes] = None,
 ) -> (str, dict):
     """Returns a Cypher query for batch uploading node records.
 
@@ -179,6 +486,12 @@ def nodes_query(
         labels (list[str]): List of strings designating Node labels
         constraints (list[str], optional): Optional constraints for defining unique Node Property values. Stub for future feature. Defaults to [].
         dedupe (bool, optional): Should duplicates be prevented. True means the Cypher MERGE command will be used. Defaults to True.
+        operation (str, optional): Overrides the clause locating each node: 'MERGE', 'CREATE' or 'MATCH' to only update existing nodes. Duplicate records are only removed for MERGE. Defaults to None, chosen by dedupe.
+        fingerprint_property (str, optional): Node property holding a content hash of each record. When set, properties are only written to nodes whose stored hash differs. Defaults to None.
+        null_policy (NullPolicy, optional): Values not uploaded as properties. Defaults to None for the default NullPolicy.
+        map_mode (str, optional): How maps, and lists Neo4j cannot store, are uploaded. See PropertyValues. Defaults to 'str'.
+        schema (RecordSchema, optional): Expected record shape, shared by the batches of a specification. Defaults to None, taken from the first record.
+        compiled (CompiledNodes, optional): Query parts compiled once per specification. When set, every argument but batch and records is taken from it. Defaults to None, compiled from the arguments.
 
     Returns:
         str, dict: Cypher query and params for uploading data.
@@ -201,20 +514,21 @@ def nodes_query(
     if len(records) == 0:
         return None, {}
 
-    elements_str, params = node_elements(
-        batch=batch, records=records, key=key, dedupe=dedupe, exclude_keys=exclude_keys
-    )
-
-    if dedupe == True:
-        merge_create = "MERGE"
-    else:
-        merge_create = "CREATE"
-
-    query = f"""WITH [{elements_str}] AS node_data\nUNWIND node_data AS node\n{merge_create} (n:`{labels[0]}` {{ `{key}`:node[0]}} )\nSET n += node[1]"""
+    # Compiled once per spec by iter_chunked_query, else for this batch only
+    if compiled is None:
+        compiled = CompiledNodes(
+            key,
+            labels,
+            exclude_keys,
+            dedupe,
+            operation,
+            fingerprint_property,
+            null_policy,
+            map_mode,
+            schema,
+        )
 
-    if len(labels) > 1:
-        for label in labels[1:]:
-            query += f"\nSET n:`{label}`"
+    query, params, _ = compiled.batch(batch, records)
 
     return query, params
 
@@ -226,6 +540,10 @@ def relationship_elements(
     to_node: TargetNode,
     dedupe: bool = True,
     exclude_keys: list[str] = [],
+    fingerprint_property: Optional[str] = None,
+    null_policy: Optional[NullPolicy] = None,
+    map_mode: str = "str",
+    schema: Optional[RecordSchema] = None,
 ) -> (str, dict):
 
     # Sample string output
@@ -241,8 +559,10 @@ def relationship_elements(
     if len(records) == 0:
         return None, {}
 
+    # Single params dict and in place string extension, as in node_elements
     result_str = ""
     result_params = {}
+    values = PropertyValues(map_mode)
 
     # Remove any duplicates
     # if dedupe == True:
@@ -250,6 +570,9 @@ def relationship_elements(
     if dedupe == True:
         records = deduped(records)
 
+    if schema is None:
+        schema = record_schema(records, exclude_keys)
+
     for idx, record in enumerate(records):
 
         suffix = f"{batch}{idx}"
@@ -258,27 +581,117 @@ def relationship_elements(
         from_param_key = f"{from_node.record_key}_{suffix}"
         to_param_key = f"{to_node.record_key}_{suffix}"
 
-        props_str, props_params = properties(
-            suffix=suffix, record=record, exclude_keys=exclude_keys
+        # Reserved before property params are named, as in node_elements
+        result_params[from_param_key] = record[from_node.record_key]
+        result_params[to_param_key] = record[to_node.record_key]
+        if fingerprint_property is not None:
+            digest_param_key = f"{fingerprint_property}_{suffix}"
+            result_params[digest_param_key] = record_digest(record, schema.excluded)
+
+        props_str, _ = properties(
+            suffix=suffix,
+            record=record,
+            exclude_keys=exclude_keys,
+            null_policy=null_policy,
+            values=values,
+            schema=schema,
+            params=result_params,
         )
 
-        # Update string
         if idx != 0:
             result_str += ", "
-        result_str += f"[${from_param_key}, ${to_param_key},{props_str}]"
-
-        # Update param dict
-        result_params.update(props_params)
-        result_params.update(
-            {
-                from_param_key: record[from_node.record_key],
-                to_param_key: record[to_node.record_key],
-            }
-        )
+        if fingerprint_property is None:
+            result_str += f"[${from_param_key}, ${to_param_key},{props_str}]"
+        else:
+            result_str += (
+                f"[${from_param_key}, ${to_param_key},{props_str}, ${digest_param_key}]"
+            )
 
     return result_str, result_params
 
 
+class CompiledRelationships:
+    """Query parts of a Relationships specification, resolved once and shared by all of its batches.
+
+    Args:
+        from_node (TargetNode): Source node.
+        to_node (TargetNode): Target node.
+        type (str): Relationship type.
+        exclude_keys (Iterable[str]): Keys not uploaded as properties. Default ().
+        dedupe (bool): Remove duplicate records and MERGE, else CREATE. Default True.
+        fingerprint_property (str): Relationship property holding the content hash of each record. Default None.
+        null_policy (NullPolicy): Values not uploaded as properties. Default None for the default NullPolicy.
+        map_mode (str): How maps, and lists Neo4j cannot store, are uploaded. Default 'str'.
+        schema (RecordSchema): Expected record shape. Default None, taken from the first record of each batch.
+    """
+
+    __slots__ = (
+        "from_node",
+        "to_node",
+        "exclude_keys",
+        "dedupe",
+        "fingerprint_property",
+        "null_policy",
+        "map_mode",
+        "schema",
+        "clauses",
+    )
+
+    def __init__(
+        self,
+        from_node: TargetNode,
+        to_node: TargetNode,
+        type: str,
+        exclude_keys: Iterable[str] = (),
+        dedupe: bool = True,
+        fingerprint_property: Optional[str] = None,
+        null_policy: Optional[NullPolicy] = None,
+        map_mode: str = "str",
+        schema: Optional[RecordSchema] = None,
+    ):
+        self.from_node = from_node
+        self.to_node = to_node
+        self.exclude_keys = frozenset(exclude_keys or ())
+        self.dedupe = dedupe
+        self.fingerprint_property = fingerprint_property
+        self.null_policy = null_policy
+        self.map_mode = map_mode
+        self.schema = schema
+
+        # Optional node labels
+        from_label = "" if from_node.node_label is None else f":{escaped(from_node.node_label)}"
+        to_label = "" if to_node.node_label is None else f":{escaped(to_node.node_label)}"
+        operation = "MERGE" if dedupe == True else "CREATE"
+
+        # Everything after the relationship list
+        clauses = f"\nUNWIND from_to_data AS tuple\nMATCH (fromNode{from_label} {{{escaped(from_node.node_key)}:tuple[0]}})\nMATCH (toNode{to_label} {{{escaped(to_node.node_key)}:tuple[1]}})\n{operation} (fromNode)-[r:{escaped(type)}]->(toNode)"
+        if fingerprint_property is None:
+            clauses += "\nSET r += tuple[2]"
+        else:
+            # Properties are only written when the hash differs, but every matched row is returned so committed records can be told from those missing a node
+            fingerprint = escaped(fingerprint_property)
+            clauses += f"\nFOREACH (_ IN CASE WHEN r.{fingerprint} IS NULL OR r.{fingerprint} <> tuple[3] THEN [1] ELSE [] END | SET r += tuple[2], r.{fingerprint} = tuple[3])\nRETURN tuple[0] AS from_key, tuple[1] AS to_key"
+        self.clauses = clauses
+
+    def batch(self, batch: str, records: list[dict]) -> tuple[str, dict, int]:
+        """Returns the query and params uploading a non empty batch of records, and the number of rows in the query once duplicates are removed."""
+        if self.dedupe:
+            records = deduped(records)
+        elements_str, params = relationship_elements(
+            batch=batch,
+            records=records,
+            from_node=self.from_node,
+            to_node=self.to_node,
+            dedupe=False,
+            exclude_keys=self.exclude_keys,
+            fingerprint_property=self.fingerprint_property,
+            null_policy=self.null_policy,
+            map_mode=self.map_mode,
+            schema=self.schema,
+        )
+        return f"WITH [{elements_str}] AS from_to_data{self.clauses}", params, len(records)
+
+
 def relationships_query(
     batch: str,
     records: list[dict],
@@ -287,6 +700,11 @@ def relationships_query(
     type: str,
     exclude_keys: list[str] = [],
     dedupe: bool = True,
+    fingerprint_property: Optional[str] = None,
+    null_policy: Optional[NullPolicy] = None,
+    map_mode: str = "str",
+    schema: Optional[RecordSchema] = None,
+    compiled: Optional[CompiledRelationships] = None,
 ) -> (str, dict):
 
     # Sample output
@@ -308,39 +726,128 @@ def relationships_query(
     if len(records) == 0:
         return None, {}
 
-    elements_str, params = relationship_elements(
-        batch=batch,
-        records=records,
-        from_node=from_node,
-        to_node=to_node,
-        dedupe=dedupe,
-        exclude_keys=exclude_keys,
+    # Compiled once per spec by iter_chunked_query, else for this batch only
+    if compiled is None:
+        compiled = CompiledRelationships(
+            from_node,
+            to_node,
+            type,
+            exclude_keys,
+            dedupe,
+            fingerprint_property,
+            null_policy,
+            map_mode,
+            schema,
+        )
+
+    query, params, _ = compiled.batch(batch, records)
+
+    return query, params
+
+
+def iter_chunked_query(
+    spec: Nodes | Relationships,
+    config: Neo4jConfig,
+    create_only: bool = False,
+    created_keys: Optional[dict[tuple, set]] = None,
+) -> Iterator[tuple[list[dict], str, dict]]:
+    """Lazily generates Cypher queries for batch uploading a specification.
+
+    Args:
+        spec (Nodes | Relationships): Nodes or Relationships model specifying creation specifications and records
+        config (Neo4jConfig): Configuration containing max_batch_size, the default null_policy, and skip_unchanged and fingerprint_property for content hashed writes
+        create_only (bool): The target is known to contain none of the spec's nodes. Node records are combined by key so each key is unique and uploaded with CREATE instead of MERGE. Keys already created by an earlier spec sharing the same first label and key, tracked in created_keys, still use MERGE. Nodes with dedupe disabled are always created, and only add their keys to created_keys. Has no effect on Relationships. Default False.
+        created_keys (dict[tuple, set]): Node keys created so far, by (first label, key). Share across calls to detect keys repeated between specs. Default a new dict.
+
+    Returns:
+        Iterator[tuple[list[dict], str, dict, int]]: Records in each batch, the batch's query and params, and the number of rows the query writes once duplicates are removed. Vector index and embedding batches of Nodes vector_properties follow the spec's other batches with an empty record list, so records are only counted once, and their embedding rows.
+    """
+
+    # Groups of (records, dedupe) to chunk
+    groups = [(spec.records, spec.dedupe)]
+    null_policy = spec_null_policy(spec, config)
+
+    if create_only and isinstance(spec, Nodes) and spec.dedupe:
+        if created_keys is None:
+            created_keys = {}
+        seen = created_keys.setdefault((spec.labels[0], spec.key), set())
+        create_records = []
+        merge_records = []
+        for record in merged_by_key(spec.records, spec.key, null_policy):
+            value = convert_to_hashable(record.get(spec.key))
+            if value in seen:
+                merge_records.append(record)
+            else:
+                seen.add(value)
+                create_records.append(record)
+
+        # Keys are unique, so dedupe=False to switch nodes_query to CREATE
+        groups = [(create_records, False), (merge_records, True)]
+    elif create_only and isinstance(spec, Nodes):
+        # Always created, so a later spec with dedupe merges onto these keys instead of creating them again
+        if created_keys is not None:
+            seen = created_keys.setdefault((spec.labels[0], spec.key), set())
+            seen.update(convert_to_hashable(r.get(spec.key)) for r in spec.records)
+
+    fingerprint_property = (
+        config.fingerprint_property if config.skip_unchanged else None
     )
 
-    # Handle optional Node Label
-    from_node_label = from_node.node_label
-    to_node_label = to_node.node_label
-    if from_node_label == None:
-        from_node_label = ""
-    else:
-        from_node_label = f":`{from_node_label}`"
-    if to_node_label == None:
-        to_node_label = ""
-    else:
-        to_node_label = f":`{to_node_label}`"
+    # Embeddings are uploaded in their own batches
+    vector_names = (
+        {v.name for v in spec.vector_properties} if isinstance(spec, Nodes) else set()
+    )
+    # Types are inferred once per spec, then converted a column at a time per chunk
+    converters = property_converters(spec, null_policy)
 
-    # Required Node Key
-    from_node_key = f"{from_node.node_key}"
-    to_node_key = f"{to_node.node_key}"
+    # Keys not uploaded as properties, and the property columns of the spec's record shape
+    exclude_keys = spec_exclude_keys(spec)
+    schema = spec_schema(spec, vector_names)
 
-    if dedupe == True:
-        merge_create = "MERGE"
-    else:
-        merge_create = "CREATE"
+    # Break up large batches of records
+    b = config.max_batch_size
 
-    query = f"""WITH [{elements_str}] AS from_to_data\nUNWIND from_to_data AS tuple\nMATCH (fromNode{from_node_label} {{`{from_node_key}`:tuple[0]}})\nMATCH (toNode{to_node_label} {{`{to_node_key}`:tuple[1]}})\n{merge_create} (fromNode)-[r:`{type}`]->(toNode)\nSET r += tuple[2]"""
+    # Process each batch into separate query statements
+    idx = 0
+    for records, dedupe in groups:
+        # Spec attributes are read, and query clauses built, once per group
+        if isinstance(spec, Nodes):
+            compiled = CompiledNodes(
+                spec.key,
+                spec.labels,
+                exclude_keys,
+                dedupe,
+                fingerprint_property=fingerprint_property,
+                null_policy=null_policy,
+                map_mode=spec.map_mode,
+                schema=schema,
+            )
+        else:
+            compiled = CompiledRelationships(
+                spec.from_node,
+                spec.to_node,
+                spec.type,
+                exclude_keys,
+                dedupe,
+                fingerprint_property,
+                null_policy,
+                spec.map_mode,
+                schema,
+            )
 
-    return query, params
+        suffix = "n" if isinstance(spec, Nodes) else "r"
+        for start in range(0, len(records), b):
+            chunk = records[start : start + b]
+            query_chunk = query_records(chunk, vector_names, converters)
+            query_str, query_params, rows = compiled.batch(f"b{idx}{suffix}", query_chunk)
+            idx += 1
+            yield chunk, query_str, query_params, rows
+
+    if vector_names:
+        for query_str, query_params in iter_vector_queries(
+            spec, config.vector_batch_size
+        ):
+            yield [], query_str, query_params, len(query_params.get("rows", ()))
 
 
 def chunked_query(
@@ -356,46 +863,30 @@ def chunked_query(
     Returns:
         list[(str, dict)]: List of queries and params to run for uploading data
     """
+    return [(q, p) for _, q, p, _ in iter_chunked_query(spec, config)]
 
-    # Break up large batches of records
-    b = config.max_batch_size
-    records = spec.records
-    chunked_records = [
-        records[i * b : (i + 1) * b] for i in range((len(records) + b - 1) // b)
-    ]
 
-    # Process each batch into separate query statements
-    result = []
-    for idx, records in enumerate(chunked_records):
-        if isinstance(spec, Nodes):
-            query_str, query_params = nodes_query(
-                f"b{idx}n",
-                records,
-                spec.key,
-                spec.labels,
-                spec.exclude_keys,
-                spec.dedupe,
-            )
-        if isinstance(spec, Relationships):
+def iter_specification_queries(
+    specifications: list[Nodes | Relationships],
+    config: Neo4jConfig,
+    create_only: bool = False,
+) -> Iterator[tuple[int, list[dict], str, dict]]:
+    """Lazily generates Cypher queries for batch uploading specifications, one batch at a time.
 
-            # Shorthand for automatically excluding keys used to specify source and target nodes
-            if spec.auto_exclude_keys is True:
-                exclude_keys = [spec.from_node.record_key, spec.to_node.record_key]
-            else:
-                exclude_keys = spec.exclude_keys
+    Args:
+        specifications (list[Nodes | Relationships]): Nodes and/or Relationships specifications and properties to upload
+        config (Neo4jConfig): Configuration containing max_batch_size
+        create_only (bool): The target is known to contain none of the nodes. See iter_chunked_query. Default False.
 
-            query_str, query_params = relationships_query(
-                f"b{idx}r",
-                records,
-                spec.from_node,
-                spec.to_node,
-                spec.type,
-                exclude_keys,
-                spec.dedupe,
-            )
-        if query_str is not None:
-            result.append((query_str, query_params))
-    return result
+    Returns:
+        Iterator[tuple[int, list[dict], str, dict, int]]: Index of the specification, records in the batch, the batch's query and params, and the number of rows it writes.
+    """
+    created_keys = {}
+    for spec_index, spec in enumerate(specifications):
+        for chunk, query, params, rows in iter_chunked_query(
+            spec, config, create_only, created_keys
+        ):
+            yield spec_index, chunk, query, params, rows
 
 
 def specification_queries(
@@ -411,7 +902,7 @@ def specification_queries(
         list[(str, dict)]: List of queries and params to run for uploading data
     """
 
-    result = []
-    for spec in specifications:
-        result.extend(chunked_query(spec, config))
-    return result
+    return [
+        (query, params)
+        for _, _, query, params, _ in iter_specification_queries(specifications, config)
+    ]
@@ -0,0 +1,103 @@
+from neo4j_uploader.models import (
+    NodesSource,
+    Nodes,
+    RecordSource,
+    Relationships,
+    RelationshipsSource,
+    SourceData,
+)
+from neo4j_uploader._streaming import open_text
+from typing import Callable, Iterator
+import csv
+
+
+def _to_bool(value: str) -> bool:
+    return value.strip().lower() in ("true", "t", "yes", "y", "1")
+
+
+_CONVERTERS: dict[str, Callable[[str], object]] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": _to_bool,
+}
+
+
+def _iter_csv(source: RecordSource, chunk_size: int) -> Iterator[list[dict]]:
+    # Per column converters and property names are resolved once from the header
+    with open_text(source.path) as f:
+        reader = csv.reader(f, delimiter=source.delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+        selected = [
+            (
+                index,
+                source.rename.get(column, column),
+                _CONVERTERS.get(source.column_types.get(column)),
+            )
+            for index, column in enumerate(header)
+            if source.columns is None or column in source.columns
+        ]
+
+        chunk = []
+        for row in reader:
+            record = {}
+            for index, name, convert in selected:
+                value = row[index] if index < len(row) else ""
+                # Empty fields stay '' and are skipped as null values on upload
+                if convert is not None and value != "":
+                    value = convert(value)
+                record[name] = value
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _iter_parquet(source: RecordSource, chunk_size: int) -> Iterator[list[dict]]:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Reading Parquet sources requires pyarrow. Install it with 'pip install pyarrow'."
+        ) from e
+
+    parquet = pq.ParquetFile(source.path)
+    for batch in parquet.iter_batches(batch_size=chunk_size, columns=source.columns):
+        if source.rename:
+            names = [source.rename.get(n, n) for n in batch.schema.names]
+            batch = pa.Table.from_batches([batch]).rename_columns(names)
+        # Rows are only built for this record batch
+        yield batch.to_pylist()
+
+
+def iter_source_records(source: RecordSource, chunk_size: int) -> Iterator[list[dict]]:
+    """Reads a CSV or Parquet source in chunks of at most chunk_size records, so only one chunk of row dicts exists at a time.
+
+    Raises:
+        ImportError: If the source is Parquet and pyarrow is not installed.
+    """
+    if source.file_format() == "parquet":
+        return _iter_parquet(source, chunk_size)
+    return _iter_csv(source, chunk_size)
+
+
+def iter_source_spec_chunks(
+    sources: SourceData, chunk_size: int
+) -> Iterator[tuple[tuple[str, int], Nodes | Relationships]]:
+    """Streams node sources, then relationship sources, as specifications holding at most chunk_size records each.
+
+    Returns:
+        Iterator: (kind, index) identifying the source, and a specification with a chunk of its records.
+    """
+    for kind, kind_sources in (
+        ("nodes", sources.nodes),
+        ("relationships", sources.relationships),
+    ):
+        for index, source in enumerate(kind_sources):
+            for records in iter_source_records(source, chunk_size):
+                yield (kind, index), source.specification(records)
@@ -0,0 +1,217 @@
+from neo4j_uploader.models import Neo4jConfig, Nodes, Relationships, SpecProgress
+from neo4j_uploader._queries import iter_specification_queries
+from neo4j.spatial import CartesianPoint, Point, WGS84Point
+from neo4j.time import Date, DateTime, Duration, Time
+from typing import BinaryIO, Iterator, Optional
+import datetime
+import json
+import os
+import struct
+import zlib
+
+# File signature and format version
+SPOOL_MAGIC = b"N4JUSPL1"
+
+# Frame header: kind, spec index, record count, payload length
+_FRAME = struct.Struct(">BIII")
+_BATCH = 1
+_SPECS = 2
+
+
+# Key of JSON objects holding an encoded temporal or spatial param value
+_TYPE_TAG = "__neo4j_uploader_type__"
+
+_TEMPORAL_TYPES = {
+    "date": Date,
+    "datetime": DateTime,
+    "duration": Duration,
+    "time": Time,
+}
+
+# Standard library values, which the driver also accepts as params. datetime precedes date, its base class
+_STDLIB_TYPES = {
+    "py_datetime": datetime.datetime,
+    "py_date": datetime.date,
+    "py_time": datetime.time,
+}
+
+
+def _encode_value(value):
+    # json default for param values converted by property_types or given as driver native values
+    for name, cls in _TEMPORAL_TYPES.items():
+        if isinstance(value, cls):
+            return {_TYPE_TAG: name, "value": value.iso_format()}
+    for name, cls in _STDLIB_TYPES.items():
+        if isinstance(value, cls):
+            return {_TYPE_TAG: name, "value": value.isoformat()}
+    if isinstance(value, datetime.timedelta):
+        return {
+            _TYPE_TAG: "py_timedelta",
+            "value": [value.days, value.seconds, value.microseconds],
+        }
+    if isinstance(value, Point):
+        return {_TYPE_TAG: "point", "srid": value.srid, "value": list(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _tagged_points(value):
+    # Point subclasses tuple, which json writes as a plain array without calling default, so points are tagged before encoding
+    if isinstance(value, Point):
+        return _encode_value(value)
+    if isinstance(value, (list, tuple)):
+        return [_tagged_points(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _tagged_points(v) for k, v in value.items()}
+    return value
+
+
+def _decode_object(obj: dict):
+    name = obj.get(_TYPE_TAG)
+    if name is None:
+        return obj
+    if name == "point":
+        cls = WGS84Point if obj["srid"] in (4326, 4979) else CartesianPoint
+        return cls(obj["value"])
+    if name == "py_timedelta":
+        return datetime.timedelta(*obj["value"])
+    if name in _STDLIB_TYPES:
+        return _STDLIB_TYPES[name].fromisoformat(obj["value"])
+    return _TEMPORAL_TYPES[name].from_iso_format(obj["value"])
+
+
+def _write_frame(
+    f: BinaryIO, kind: int, spec_index: int, records: int, payload, level: int
+):
+    encoded = zlib.compress(
+        json.dumps(payload, separators=(",", ":"), default=_encode_value).encode(),
+        level,
+    )
+    f.write(_FRAME.pack(kind, spec_index, records, len(encoded)))
+    f.write(encoded)
+
+
+def _iter_frames(
+    f: BinaryIO, decode: bool = True
+) -> Iterator[tuple[int, int, int, Optional[object]]]:
+    # Yields (kind, spec index, records, payload). With decode False payloads are skipped without reading and their length is yielded instead
+    if f.read(len(SPOOL_MAGIC)) != SPOOL_MAGIC:
+        raise ValueError("Not a neo4j_uploader spool file")
+    size = os.fstat(f.fileno()).st_size
+    while True:
+        header = f.read(_FRAME.size)
+        if len(header) == 0:
+            return
+        if len(header) < _FRAME.size:
+            raise ValueError("Truncated spool file")
+        kind, spec_index, records, length = _FRAME.unpack(header)
+        if not decode:
+            if f.seek(length, os.SEEK_CUR) > size:
+                raise ValueError("Truncated spool file")
+            yield kind, spec_index, records, length
+            continue
+        encoded = f.read(length)
+        if len(encoded) < length:
+            raise ValueError("Truncated spool file")
+        yield kind, spec_index, records, json.loads(zlib.decompress(encoded), object_hook=_decode_object)
+
+
+def write_spool_file(
+    specifications: list[Nodes | Relationships],
+    config: Neo4jConfig,
+    path: str,
+    compression_level: int = 6,
+) -> list[SpecProgress]:
+    """Streams the batch queries of specifications to a spool file.
+
+    Each batch is a length prefixed, zlib compressed JSON frame holding its query and params. The file is written to a temporary path and renamed when complete, so a partial spool is never read.
+
+    Args:
+        specifications (list[Nodes | Relationships]): Specifications in upload order.
+        config (Neo4jConfig): Configuration used for query generation.
+        path (str): Spool file to create.
+        compression_level (int): zlib level from 0 to 9. Default 6.
+
+    Returns:
+        list[SpecProgress]: Batch and record totals of each specification.
+
+    Raises:
+        TypeError: If a parameter value can not be encoded as JSON.
+    """
+    specs = [
+        SpecProgress(
+            name=spec.name(),
+            element_type="nodes" if isinstance(spec, Nodes) else "relationships",
+            batches_total=0,
+            records_total=0,
+        )
+        for spec in specifications
+    ]
+    create_only = config.overwrite or config.assume_empty
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(SPOOL_MAGIC)
+            for spec_index, chunk, query, params, _ in iter_specification_queries(
+                specifications, config, create_only
+            ):
+                _write_frame(
+                    f,
+                    _BATCH,
+                    spec_index,
+                    len(chunk),
+                    [query, _tagged_points(params)],
+                    compression_level,
+                )
+                specs[spec_index].batches_total += 1
+                specs[spec_index].records_total += len(chunk)
+
+            # Trailing index, as totals are only known once every batch is written
+            _write_frame(
+                f,
+                _SPECS,
+                0,
+                0,
+                {
+                    "specs": [s.model_dump() for s in specs],
+                    "create_only": create_only,
+                },
+                compression_level,
+            )
+    except BaseException:
+        # A partial spool is never left behind
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return specs
+
+
+def read_spool_index(path: str) -> tuple[list[SpecProgress], bool]:
+    """Returns the specification totals of a spool file and whether its queries assume an empty database. Batch payloads are skipped, not decompressed."""
+    with open(path, "rb") as f:
+        kind = length = None
+        for kind, _, _, length in _iter_frames(f, decode=False):
+            pass
+        # The index is the last frame
+        if kind != _SPECS:
+            raise ValueError("Spool file has no index, it may be incomplete")
+        f.seek(-length, os.SEEK_CUR)
+        payload = json.loads(
+            zlib.decompress(f.read(length)), object_hook=_decode_object
+        )
+    specs = [SpecProgress.model_validate(s) for s in payload["specs"]]
+    return specs, payload["create_only"]
+
+
+def iter_spool(path: str) -> Iterator[tuple[int, int, str, dict]]:
+    """Streams batches back from a spool file.
+
+    Returns:
+        Iterator[tuple[int, int, str, dict]]: Specification index, record count, query and params of each batch, in written order.
+    """
+    with open(path, "rb") as f:
+        for kind, spec_index, records, payload in _iter_frames(f):
+            if kind == _BATCH:
+                query, params = payload
+                yield spec_index, records, query, params
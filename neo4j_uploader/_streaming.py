@@ -0,0 +1,243 @@
+from neo4j_uploader.models import Nodes, Relationships
+from neo4j_uploader.errors import InvalidPayloadError
+from typing import Iterator, TextIO
+import gzip
+import json
+import re
+
+# Characters read from the file per refill
+_READ_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+# Fields required before records can be streamed, by specification kind
+_REQUIRED_FIELDS = {
+    "nodes": ("labels", "key"),
+    "relationships": ("type", "from_node", "to_node"),
+}
+
+
+def open_text(path: str) -> TextIO:
+    """Opens a UTF-8 text file for reading, decompressing paths ending in .gz."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def is_ndjson(path: str) -> bool:
+    """Returns True for .ndjson and .jsonl paths, optionally followed by .gz."""
+    name = path[:-3] if path.endswith(".gz") else path
+    return name.endswith((".ndjson", ".jsonl"))
+
+
+class _JSONStream:
+    # Incremental JSON tokenizer over a text file. Only the structure around records is walked by hand, each record is parsed whole with raw_decode
+
+    def __init__(self, f: TextIO):
+        self._f = f
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._f.read(_READ_SIZE)
+        if chunk == "":
+            self._eof = True
+            return False
+        # Drop consumed text so memory stays bounded by the largest single value
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Returns the next non whitespace character without consuming it, or '' at the end."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise InvalidPayloadError(f"Expected '{char}' in JSON file, found '{found}'")
+        self._pos += 1
+
+    def accept(self, char: str) -> bool:
+        """Consumes char if it is next."""
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def value(self):
+        """Parses the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise InvalidPayloadError("Invalid or truncated JSON file")
+            # A number at the end of the buffer may continue in the next read
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def iter_array(self) -> Iterator[None]:
+        """Consumes an array, yielding when each element is next so the caller can parse it."""
+        self.expect("[")
+        if self.accept("]"):
+            return
+        while True:
+            yield
+            if self.accept("]"):
+                return
+            self.expect(",")
+
+    def iter_object(self) -> Iterator[str]:
+        """Consumes an object, yielding each key when its value is next so the caller can parse it."""
+        self.expect("{")
+        if self.accept("}"):
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.accept("}"):
+                return
+            self.expect(",")
+
+
+def _spec(kind: str, fields: dict, records: list[dict]) -> Nodes | Relationships:
+    model = Nodes if kind == "nodes" else Relationships
+    try:
+        return model.model_validate({**fields, "records": records})
+    except Exception as e:
+        raise InvalidPayloadError(e)
+
+
+def iter_json_spec_chunks(
+    path: str, chunk_size: int
+) -> Iterator[tuple[tuple[str, int], Nodes | Relationships]]:
+    """Streams a GraphData .json file as specifications holding at most chunk_size records each.
+
+    Records are parsed one at a time. A specification's records are only streamed when its other required fields appear before its 'records' array, as in samples/batch_upload_data.json. Otherwise they are held until the specification object ends.
+
+    Args:
+        path (str): .json file in the batch_upload schema, optionally .gz.
+        chunk_size (int): Maximum records per yielded specification.
+
+    Returns:
+        Iterator: (kind, index) identifying the source specification, and a specification with a chunk of its records.
+
+    Raises:
+        InvalidPayloadError: If the file is not valid JSON in the batch_upload schema, or a field follows already streamed records.
+    """
+    with open_text(path) as f:
+        stream = _JSONStream(f)
+        for kind in stream.iter_object():
+            if kind not in _REQUIRED_FIELDS:
+                # Unknown top level fields are ignored, as by GraphData
+                stream.value()
+                continue
+            for index, _ in enumerate(stream.iter_array()):
+                spec_id = (kind, index)
+                fields = {}
+                held = []
+                streamed = False
+                for field in stream.iter_object():
+                    if streamed:
+                        raise InvalidPayloadError(
+                            f"Field '{field}' of {kind} specification {index} follows its records. Place 'records' last to stream the file."
+                        )
+                    if field != "records":
+                        fields[field] = stream.value()
+                        continue
+
+                    streamed = all(k in fields for k in _REQUIRED_FIELDS[kind])
+                    chunk = []
+                    for _ in stream.iter_array():
+                        record = stream.value()
+                        if not streamed:
+                            held.append(record)
+                            continue
+                        chunk.append(record)
+                        if len(chunk) >= chunk_size:
+                            yield spec_id, _spec(kind, fields, chunk)
+                            chunk = []
+                    if streamed and chunk:
+                        yield spec_id, _spec(kind, fields, chunk)
+
+                for start in range(0, len(held), chunk_size):
+                    yield spec_id, _spec(kind, fields, held[start : start + chunk_size])
+
+
+def iter_ndjson_spec_chunks(
+    path: str, chunk_size: int
+) -> Iterator[tuple[str, Nodes | Relationships]]:
+    """Streams an NDJSON file, as written by neo4j_uploader.synthetic, as specifications holding at most chunk_size records each.
+
+    Specification lines declare a Nodes or Relationships specification by name, without records. Record lines reference a declared name, and records of different specifications may be interleaved. Pending node records are always emitted before relationship records so relationships can find their nodes.
+
+    Args:
+        path (str): .ndjson or .jsonl file, optionally .gz.
+        chunk_size (int): Maximum records per yielded specification.
+
+    Returns:
+        Iterator: Specification name and a specification with a chunk of its records.
+
+    Raises:
+        InvalidPayloadError: If a line is not valid JSON, or references an undeclared specification.
+    """
+    declared = {}
+    pending = {}
+
+    def flush(names):
+        for name in names:
+            records = pending.pop(name, None)
+            if records:
+                kind, fields = declared[name]
+                yield name, _spec(kind, fields, records)
+
+    with open_text(path) as f:
+        for number, line in enumerate(f, start=1):
+            if line.strip() == "":
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise InvalidPayloadError(f"Line {number}: {e}")
+
+            name = entry.get("spec")
+            if "record" not in entry:
+                kind = "nodes" if "nodes" in entry else "relationships"
+                if kind not in entry:
+                    raise InvalidPayloadError(
+                        f"Line {number}: expected a 'record', 'nodes' or 'relationships' entry"
+                    )
+                yield from flush([name])
+                declared[name] = (kind, entry[kind])
+                continue
+
+            if name not in declared:
+                raise InvalidPayloadError(
+                    f"Line {number}: record for undeclared specification '{name}'"
+                )
+            records = pending.setdefault(name, [])
+            records.append(entry["record"])
+            if len(records) >= chunk_size:
+                if declared[name][0] == "relationships":
+                    yield from flush(
+                        [n for n in pending if declared[n][0] == "nodes"]
+                    )
+                yield from flush([name])
+
+    # Nodes first, then relationships
+    yield from flush(sorted(pending, key=lambda n: declared[n][0] != "nodes"))
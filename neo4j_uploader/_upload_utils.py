@@ -1,12 +1,16 @@
 from neo4j_uploader._n4j import execute_query
 from neo4j_uploader._logger import logger
+from neo4j_uploader._queries import DEFAULT_NULL_POLICY
+from neo4j_uploader.models import NullPolicy
+from functools import lru_cache
 
 # Legacy functions
 
 def prop_subquery(
         record: dict, 
         suffix : str = "", 
-        exclude_keys: list[str] = []
+        exclude_keys: list[str] = [],
+        null_policy: NullPolicy = DEFAULT_NULL_POLICY
         )-> (str, dict):
     """
     Generates a Cypher substring statement to set properties for a record, excluding given keys
@@ -18,6 +22,8 @@ def prop_subquery(
 
         exclude_keys: List of dictionary key values to ignore from substring generation
 
+        null_policy: Values not set as properties. Defaults to None and 'none', 'null', 'empty' and '' in any case
+
     
     Returns:
         A tuple containing the substring and a dict of parameters
@@ -40,17 +46,8 @@ def prop_subquery(
         value = record[a_key]
 
         # Do not set properties with a None/Null/Empty value
-        if value is None:
+        if null_policy.is_null(value, a_key):
             continue
-        if isinstance(value, str):
-            if value.lower() == "none":
-                continue
-            if value.lower() == "null":
-                continue
-            if value.lower() == "empty":
-                continue
-            if value.lower() == "":
-                continue
 
         # Prefix multiple items in Cypgher with comma
         if idx!= 0:
@@ -118,7 +115,7 @@ def with_node_elements(
         # Only processing batches of properties for Nodes. Still recommended way to handle batches vs. series of MATCH or CREATE statements
         with_element = f"{props_string}"
         results_list.append(with_element)
-        results_params = results_params | params
+        results_params.update(params)
 
     return results_list, results_params
 
@@ -286,8 +283,15 @@ def target_key(
     if explicit_value is not None:
         return explicit_key
     
+    # Records of a relationship type usually share their keys, so the scan runs once per shape
+    return _first_prefixed_key(tuple(record), prefix)
+
+@lru_cache(maxsize=1024)
+def _first_prefixed_key(
+        keys: tuple[str, ...],
+        prefix: str) -> str:
+
     # find all matching keys
-    keys = record.keys()
     filtered_keys = [k for k in keys if k.startswith(prefix)]
 
     if len(filtered_keys) == 0:
@@ -295,8 +299,7 @@ def target_key(
         return None
     
     # Take first if multiple matches
-    key = sorted(filtered_keys)[0]
-    return key
+    return min(filtered_keys)
 
 def to_key(
         record: dict,
@@ -340,15 +343,15 @@ def with_relationship_elements(
 
     # Force sort bc list is not being consistent
     # Little complicated looking because the from and to node id keys are now dynamic, and not necessarily the same for all relationships
-    relationships = sorted(relationships, key=lambda x: (x[from_key(x, nodes_key)], x[to_key(x, nodes_key)]))
+    # Keys are resolved once per relationship, not again for sorting
+    keyed = [(from_key(r, nodes_key), to_key(r, nodes_key), r) for r in relationships]
+    keyed.sort(key=lambda x: (x[2][x[0]], x[2][x[1]]))
     
-    for idx, rel in enumerate(relationships):
+    for idx, (from_node_key, to_node_key, rel) in enumerate(keyed):
 
         suffix = f"r{idx}"
 
         # Get unique key-value of from and to nodes
-        from_node_key = from_key(rel, nodes_key)
-        to_node_key = to_key(rel, nodes_key)
         from_node_value = rel[from_node_key]
         to_node_value = rel[to_node_key]
 
@@ -383,7 +386,7 @@ def with_relationship_elements(
 
         with_element = f"[${from_node_key_param},${to_node_key_param},{props_string}]"
         results_list.append(with_element)
-        results_params = results_params | params
+        results_params.update(params)
     
     return results_list, results_params
 
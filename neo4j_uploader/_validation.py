@@ -0,0 +1,73 @@
+from neo4j_uploader.models import GraphData, Nodes, Relationships
+
+# Records checked per specification in 'spec-only' validation
+KEY_SAMPLE_SIZE = 100
+
+
+def _sampled(records: list, size: int) -> list:
+    # Evenly spaced records, always including the first and last
+    if len(records) <= size or size < 2:
+        return records[:size]
+    step = (len(records) - 1) / (size - 1)
+    return [records[round(i * step)] for i in range(size)]
+
+
+def _check_keys(spec: Nodes | Relationships, sample_size: int):
+    # Key fields of sampled records, so a missing key fails before anything is uploaded
+    if isinstance(spec, Nodes):
+        required = (spec.key,)
+    else:
+        required = (spec.from_node.record_key, spec.to_node.record_key)
+    for record in _sampled(spec.records, sample_size):
+        if not isinstance(record, dict):
+            raise ValueError(f"{spec.name()} record is not a dict: {record!r}")
+        for key in required:
+            if key not in record:
+                raise ValueError(f"{spec.name()} record missing key '{key}': {record!r}")
+
+
+def _spec(model: type, spec, sample_size: int) -> Nodes | Relationships:
+    if isinstance(spec, model):
+        return spec
+    if not isinstance(spec, dict):
+        raise ValueError(f"{model.__name__} specification is not a dict: {spec!r}")
+    records = spec.get("records")
+    if not isinstance(records, list):
+        raise ValueError(f"{model.__name__} specification records must be a list")
+
+    # Validate everything but the records, then attach the caller's list as is
+    result = model.model_validate({**spec, "records": []})
+    result.records = records
+    _check_keys(result, sample_size)
+    return result
+
+
+def graph_data(
+    data: dict | GraphData,
+    validation: str = "full",
+    sample_size: int = KEY_SAMPLE_SIZE,
+) -> GraphData:
+    """Returns data as GraphData.
+
+    Args:
+        data (dict | GraphData): Payload to convert. GraphData is returned as is.
+        validation (str): 'full' validates and copies every record. 'spec-only' validates each specification's fields, ie labels, key and TargetNodes, but keeps its records list without copying or validating it, only checking the key fields of a sample of records. Default 'full'.
+        sample_size (int): Records checked per specification with 'spec-only'. Default 100.
+
+    Raises:
+        ValidationError: If a specification is invalid.
+        ValueError: If records are not a list, or a sampled record is not a dict or misses a key field.
+    """
+    if isinstance(data, GraphData):
+        return data
+    if validation == "full":
+        return GraphData.model_validate(data)
+
+    if not isinstance(data, dict):
+        raise ValueError(f"GraphData payload is not a dict: {type(data).__name__}")
+    nodes = data.get("nodes") or []
+    relationships = data.get("relationships") or []
+    return GraphData.model_construct(
+        nodes=[_spec(Nodes, s, sample_size) for s in nodes],
+        relationships=[_spec(Relationships, s, sample_size) for s in relationships],
+    )
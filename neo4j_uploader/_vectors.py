@@ -0,0 +1,77 @@
+from neo4j_uploader.models import Nodes, VectorProperty
+from neo4j_uploader.errors import InvalidPayloadError
+from typing import Iterator
+
+
+def vector_values(value, dimensions: int) -> list[float]:
+    """Returns an embedding as a list of floats, the form Bolt can send.
+
+    Args:
+        value (list | tuple | numpy.ndarray): Embedding. NumPy arrays are converted with tolist(), without importing NumPy.
+        dimensions (int): Expected length.
+
+    Raises:
+        InvalidPayloadError: If value is not a sequence of dimensions numbers.
+    """
+    if hasattr(value, "tolist"):
+        value = value.tolist()
+    if not isinstance(value, (list, tuple)) or len(value) != dimensions:
+        length = len(value) if isinstance(value, (list, tuple)) else type(value).__name__
+        raise InvalidPayloadError(
+            f"Expected an embedding of {dimensions} dimensions, got {length}"
+        )
+    try:
+        return [float(v) for v in value]
+    except (TypeError, ValueError) as e:
+        raise InvalidPayloadError(f"Embedding contains a non numeric value: {e}")
+
+
+def without_vectors(records: list[dict], names: set[str]) -> list[dict]:
+    """Returns copies of records without their embedding keys, for the regular property batches."""
+    return [{k: v for k, v in r.items() if k not in names} for r in records]
+
+
+def vector_index_query(label: str, vector: VectorProperty) -> str:
+    """Returns a Cypher statement creating the vector index of an embedding property, if it does not exist."""
+    return (
+        f"CREATE VECTOR INDEX `{vector.index(label)}` IF NOT EXISTS\n"
+        f"FOR (n:`{label}`) ON (n.`{vector.name}`)\n"
+        f"OPTIONS {{indexConfig: {{`vector.dimensions`: {vector.dimensions}, `vector.similarity_function`: '{vector.similarity}'}}}}"
+    )
+
+
+def vector_query(label: str, key: str) -> str:
+    """Returns a Cypher query setting an embedding property on existing nodes, from $rows of [key value, embedding] and the $property name."""
+    return (
+        "UNWIND $rows AS row\n"
+        f"MATCH (n:`{label}` {{`{key}`:row[0]}})\n"
+        "CALL db.create.setNodeVectorProperty(n, $property, row[1])"
+    )
+
+
+def iter_vector_queries(
+    spec: Nodes, batch_size: int
+) -> Iterator[tuple[str, dict]]:
+    """Lazily generates the index statements and embedding batches of a Nodes specification's vector_properties.
+
+    Embeddings are set with db.create.setNodeVectorProperty, which stores them as compact float32 vectors, in batches of at most batch_size records. Records without an embedding are skipped.
+
+    Raises:
+        InvalidPayloadError: If an embedding does not have the declared dimensions.
+    """
+    label = spec.labels[0]
+    query = vector_query(label, spec.key)
+    for vector in spec.vector_properties:
+        if vector.create_index:
+            yield vector_index_query(label, vector), {}
+        rows = []
+        for record in spec.records:
+            value = record.get(vector.name)
+            if value is None:
+                continue
+            rows.append([record[spec.key], vector_values(value, vector.dimensions)])
+            if len(rows) >= batch_size:
+                yield query, {"rows": rows, "property": vector.name}
+                rows = []
+        if rows:
+            yield query, {"rows": rows, "property": vector.name}
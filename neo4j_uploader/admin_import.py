@@ -0,0 +1,592 @@
+"""Export of GraphData specifications to `neo4j-admin database import` CSV files.
+
+Transactional uploads suit incremental changes, while an initial load of a very large graph is much faster with the offline importer. The exporter writes the same Nodes and Relationships specifications used by batch_upload to header and data CSV files, so one data model serves both.
+
+Each Nodes specification becomes a group of files with an ID space named after its first label and keyed by `Nodes.key`. Relationship endpoints are resolved to those ID spaces from `TargetNode.node_label` and `TargetNode.node_key`. Data rows are split into shards of at most `shard_size` rows and can be gzip compressed.
+
+Values are prepared as batch_upload prepares them: `property_types` and `infer_types` give typed `:date`, `:datetime`, `:duration` and `:point` columns, maps and unsupported lists follow `map_mode`, and `vector_properties` are written as `float[]` columns whose vector indexes are created after the import. Payload files are streamed in two passes, one typing the columns and one writing the rows, so only records sharing a key with a record in another chunk are held in memory.
+
+Example:
+
+    from neo4j_uploader.admin_import import export_admin_import
+
+    export = export_admin_import(data, "import/", shard_size=5_000_000, compress=True)
+    print(" ".join(export.command("neo4j")))
+
+CLI usage:
+
+    python -m neo4j_uploader.admin_import graph.json import/ --shard-size 5000000 --gzip
+"""
+
+from neo4j_uploader.models import GraphData, Nodes, NullPolicy, Relationships, TargetNode
+from neo4j_uploader._queries import (
+    DEFAULT_NULL_POLICY,
+    PropertyValues,
+    convert_to_hashable,
+    is_null,
+    merged_by_key,
+)
+from neo4j_uploader._fingerprints import spec_exclude_keys
+from neo4j_uploader._property_types import converted_records, property_converters
+from neo4j_uploader._streaming import (
+    is_ndjson,
+    iter_json_spec_chunks,
+    iter_ndjson_spec_chunks,
+)
+from neo4j_uploader._vectors import vector_index_query, vector_values
+from neo4j.spatial import Point, WGS84Point
+from neo4j.time import Date, DateTime, Duration
+from pydantic import BaseModel
+from typing import Any, Callable, Iterable, Iterator, Optional
+import argparse
+import csv
+import gzip
+import os
+import re
+import sys
+
+# Specify Google doctstring type for pdoc auto doc generation
+__docformat__ = "google"
+
+ARRAY_DELIMITER = ";"
+
+# Records parsed per chunk when exporting a payload file
+FILE_CHUNK_SIZE = 10_000
+
+_UNSAFE_FILENAME = re.compile(r"[^\w.-]+")
+
+
+class AdminImportExport(BaseModel):
+    """Files written by export_admin_import.
+
+    Args:
+        directory (str): Directory containing all files.
+        node_files (list[list[str]]): Per Nodes specification, the header file followed by its data shards.
+        relationship_files (list[list[str]]): Per Relationships specification, the header file followed by its data shards.
+        nodes_exported (int): Node rows written, after combining records with the same key.
+        relationships_exported (int): Relationship rows written, after removing duplicates.
+        multiline_fields (bool): True if any string value contains a line break, requiring --multiline-fields=true.
+        vector_index_statements (list[str]): Cypher statements creating the vector indexes of exported vector_properties, to run once the imported database is started.
+    """
+
+    directory: str
+    node_files: list[list[str]] = []
+    relationship_files: list[list[str]] = []
+    nodes_exported: int = 0
+    relationships_exported: int = 0
+    multiline_fields: bool = False
+    vector_index_statements: list[str] = []
+
+    def command(self, database: str = "neo4j") -> list[str]:
+        """Returns the neo4j-admin command line importing the exported files.
+
+        Duplicate nodes across specifications and relationships to missing nodes are skipped, matching batch_upload behaviour.
+
+        Args:
+            database (str): Target database name. Default 'neo4j'.
+
+        Returns:
+            list[str]: Command arguments.
+        """
+        result = [
+            "neo4j-admin",
+            "database",
+            "import",
+            "full",
+            f"--array-delimiter={ARRAY_DELIMITER}",
+            "--skip-duplicate-nodes=true",
+            "--skip-bad-relationships=true",
+        ]
+        if self.multiline_fields:
+            result.append("--multiline-fields=true")
+        for files in self.node_files:
+            result.append(f"--nodes={','.join(files)}")
+        for files in self.relationship_files:
+            result.append(f"--relationships={','.join(files)}")
+        result.append(database)
+        return result
+
+
+def _scalar_type(value) -> str:
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "long"
+    if isinstance(value, float):
+        return "double"
+    # Values converted by property_types or infer_types
+    if isinstance(value, DateTime):
+        return "localdatetime" if value.tzinfo is None else "datetime"
+    if isinstance(value, Date):
+        return "date"
+    if isinstance(value, Duration):
+        return "duration"
+    if isinstance(value, Point):
+        return "point"
+    return "string"
+
+
+def _value_type(value) -> str:
+    if isinstance(value, list):
+        types = {_scalar_type(v) for v in value}
+        if types == {"long", "double"}:
+            return "double[]"
+        if len(types) == 1:
+            return f"{types.pop()}[]"
+        # Empty or mixed lists are uploaded as strings
+        return "string"
+    if isinstance(value, dict):
+        return "string"
+    return _scalar_type(value)
+
+
+def _column_type(current: Optional[str], value) -> str:
+    # Widen a column type to also fit value
+    kind = _value_type(value)
+    if current is None or current == kind:
+        return kind
+    if {current, kind} == {"long", "double"}:
+        return "double"
+    if {current, kind} == {"long[]", "double[]"}:
+        return "double[]"
+    return "string"
+
+
+def _format_point(value: Point) -> str:
+    if isinstance(value, WGS84Point):
+        return f"{{crs:WGS-84, longitude:{value.x!r}, latitude:{value.y!r}}}"
+    return f"{{crs:cartesian, x:{value.x!r}, y:{value.y!r}}}"
+
+
+def _format(value, kind: str, null_check: Callable[[Any], bool] = is_null) -> str:
+    if null_check(value):
+        return ""
+    if kind.endswith("[]"):
+        return ARRAY_DELIMITER.join(_format(v, kind[:-2], null_check) for v in value)
+    if kind == "string":
+        # Nested dicts, lists and other values are stored as their string form, as in batch_upload
+        return value if isinstance(value, str) else str(value)
+    if kind == "boolean":
+        return "true" if value else "false"
+    if kind == "point":
+        return _format_point(value)
+    if kind in ("date", "datetime", "localdatetime", "duration"):
+        return value.iso_format()
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _header_field(name: str, kind: str) -> str:
+    return name if kind == "string" else f"{name}:{kind}"
+
+
+class _ShardWriter:
+    # Writes CSV rows across numbered shard files
+
+    def __init__(self, directory: str, prefix: str, shard_size: int, compress: bool):
+        self.directory = directory
+        self.prefix = prefix
+        self.shard_size = shard_size
+        self.compress = compress
+        self.files: list[str] = []
+        self.rows = 0
+        self.multiline = False
+        self._file = None
+        self._writer = None
+
+    def _open(self):
+        if self._file is not None:
+            self._file.close()
+        suffix = ".csv.gz" if self.compress else ".csv"
+        name = f"{self.prefix}.part{len(self.files) + 1:04d}{suffix}"
+        path = os.path.join(self.directory, name)
+        if self.compress:
+            self._file = gzip.open(path, "wt", newline="", encoding="utf-8")
+        else:
+            self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self.files.append(path)
+
+    def write(self, row: list[str]):
+        if self.rows % self.shard_size == 0:
+            self._open()
+        if not self.multiline:
+            self.multiline = any("\n" in f or "\r" in f for f in row)
+        self._writer.writerow(row)
+        self.rows += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _write_header(directory: str, prefix: str, header: list[str]) -> str:
+    path = os.path.join(directory, f"{prefix}.header.csv")
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerow(header)
+    return path
+
+
+def _id_space(nodes: list[Nodes], target: TargetNode) -> str:
+    # ID space of the Nodes specifications a relationship endpoint refers to
+    spaces = {
+        spec.labels[0]
+        for spec in nodes
+        if spec.key == target.node_key
+        and (target.node_label is None or target.node_label in spec.labels)
+    }
+    if len(spaces) != 1:
+        raise ValueError(
+            f"Relationship endpoint label {target.node_label} with key {target.node_key} must match exactly one Nodes ID space, found {sorted(spaces)}"
+        )
+    return spaces.pop()
+
+
+def _spec_policy(spec: Nodes | Relationships) -> NullPolicy:
+    return DEFAULT_NULL_POLICY if spec.null_policy is None else spec.null_policy
+
+
+def _merge(existing: dict, record: dict, policy: NullPolicy):
+    # Later non null values override earlier ones, as consecutive MERGE and SET += statements do
+    for k, v in record.items():
+        if not policy.is_null(v, k):
+            existing[k] = v
+
+
+def _unique_relationships(spec: Relationships, records: list[dict]) -> list[dict]:
+    # Combine records with the same endpoints, as MERGE does for a relationship between the same nodes
+    policy = _spec_policy(spec)
+    merged = {}
+    for record in records:
+        endpoints = convert_to_hashable(
+            (record.get(spec.from_node.record_key), record.get(spec.to_node.record_key))
+        )
+        existing = merged.get(endpoints)
+        if existing is None:
+            merged[endpoints] = dict(record)
+            continue
+        _merge(existing, record, policy)
+    return list(merged.values())
+
+
+def _prefix(kind: str, index: int, name: str) -> str:
+    return f"{kind}_{index:03d}_{_UNSAFE_FILENAME.sub('_', name)}"
+
+
+class _SpecExport:
+    """Columns of one specification, typed over all of its records, and the conversion of its records into CSV rows.
+
+    Records are added in chunks, first all of them to scan, then all of them again to rows. With dedupe, records sharing a key or endpoints within a chunk are combined directly, while those sharing one with another chunk are held until held_rows.
+
+    Args:
+        spec (Nodes | Relationships): First chunk of the specification. Its records are used to infer property types.
+    """
+
+    def __init__(self, spec: Nodes | Relationships):
+        self.policy = _spec_policy(spec)
+        self.converters = property_converters(spec, self.policy)
+        self.spec = spec.model_copy(update={"records": []})
+        self.exclude_keys = set(spec_exclude_keys(spec))
+        self.values = PropertyValues(spec.map_mode)
+        self.vectors = (
+            {v.name: v for v in spec.vector_properties} if isinstance(spec, Nodes) else {}
+        )
+        # Embeddings are stored as float32 vectors by batch_upload
+        self.types = {name: "float[]" for name in self.vectors}
+        self.columns: list[str] = []
+        self._seen = set()
+        self._repeated = set()
+        self._held = {}
+
+    def _identity(self, record: dict):
+        if isinstance(self.spec, Nodes):
+            return convert_to_hashable(record.get(self.spec.key))
+        return convert_to_hashable(
+            (
+                record.get(self.spec.from_node.record_key),
+                record.get(self.spec.to_node.record_key),
+            )
+        )
+
+    def _unique(self, records: list[dict]) -> list[dict]:
+        if not self.spec.dedupe:
+            return records
+        if isinstance(self.spec, Nodes):
+            return merged_by_key(records, self.spec.key, self.policy)
+        return _unique_relationships(self.spec, records)
+
+    def properties(self, record: dict) -> dict:
+        """Returns the property values of a converted record, as batch_upload sets them."""
+        result = {}
+        for k, v in record.items():
+            if k in self.exclude_keys or self.policy.is_null(v, k):
+                continue
+            if k in self.vectors:
+                result[k] = vector_values(v, self.vectors[k].dimensions)
+            elif isinstance(v, (dict, list)):
+                for name, item in self.values.items(k, v):
+                    if name != k and self.policy.is_null(item, name):
+                        continue
+                    result[name] = item
+            else:
+                result[k] = v
+        return result
+
+    def scan(self, records: list[dict]):
+        """Widens column types to fit a chunk of records."""
+        records = self._unique(records)
+        if self.spec.dedupe:
+            for record in records:
+                identity = self._identity(record)
+                if identity in self._seen:
+                    self._repeated.add(identity)
+                self._seen.add(identity)
+        for record in converted_records(records, self.converters):
+            for k, v in self.properties(record).items():
+                if k not in self.vectors:
+                    self.types[k] = _column_type(self.types.get(k), v)
+
+    def finish_scan(self):
+        """Fixes the columns once every record was scanned."""
+        self._seen = set()
+        if isinstance(self.spec, Nodes) and self.spec.key not in self.types:
+            # The key is always stored as a property, as MERGE on the key sets it
+            self.types[self.spec.key] = "string"
+        self.columns = sorted(self.types)
+
+    def header(self, nodes: list[Nodes]) -> list[str]:
+        """Returns the header row. nodes resolve the ID spaces of relationship endpoints."""
+        fields = [_header_field(c, self.types[c]) for c in self.columns]
+        if isinstance(self.spec, Nodes):
+            return [f":ID({self.spec.labels[0]})"] + fields + [":LABEL"]
+        return [
+            f":START_ID({_id_space(nodes, self.spec.from_node)})",
+            f":END_ID({_id_space(nodes, self.spec.to_node)})",
+        ] + fields + [":TYPE"]
+
+    def _row(self, record: dict) -> list[str]:
+        record = converted_records([record], self.converters)[0]
+        props = self.properties(record)
+        values = [_format(props.get(c), self.types[c]) for c in self.columns]
+        if isinstance(self.spec, Nodes):
+            return (
+                [_format(record.get(self.spec.key), "string")]
+                + values
+                + [ARRAY_DELIMITER.join(self.spec.labels)]
+            )
+        return [
+            _format(record.get(self.spec.from_node.record_key), "string"),
+            _format(record.get(self.spec.to_node.record_key), "string"),
+        ] + values + [self.spec.type]
+
+    def rows(self, records: list[dict]) -> Iterator[list[str]]:
+        """Yields the rows of a chunk of records, holding back those combined with records of other chunks."""
+        for record in self._unique(records):
+            if self._repeated:
+                identity = self._identity(record)
+                if identity in self._repeated:
+                    existing = self._held.get(identity)
+                    if existing is None:
+                        self._held[identity] = dict(record)
+                    else:
+                        _merge(existing, record, self.policy)
+                    continue
+            yield self._row(record)
+
+    def held_rows(self) -> Iterator[list[str]]:
+        """Yields the rows of records combined across chunks."""
+        for record in self._held.values():
+            yield self._row(record)
+        self._held = {}
+
+
+def _spec_exports(
+    chunks: Iterable[tuple[object, Nodes | Relationships]],
+) -> dict[object, _SpecExport]:
+    # First pass, typing the columns of every specification in order of appearance
+    exports = {}
+    for spec_id, spec in chunks:
+        export = exports.get(spec_id)
+        if export is None:
+            export = exports[spec_id] = _SpecExport(spec)
+        export.scan(spec.records)
+    for export in exports.values():
+        export.finish_scan()
+    return exports
+
+
+def iter_node_rows(spec: Nodes) -> Iterator[list[str]]:
+    """Yields the header of a Nodes specification followed by its data rows. Records with the same key are combined first when dedupe is True."""
+    export = _spec_exports([(0, spec)])[0]
+    yield export.header([])
+    yield from export.rows(spec.records)
+
+
+def iter_relationship_rows(
+    spec: Relationships, nodes: list[Nodes]
+) -> Iterator[list[str]]:
+    """Yields the header of a Relationships specification followed by its data rows.
+
+    Args:
+        spec (Relationships): Relationships to export.
+        nodes (list[Nodes]): All Nodes specifications, used to resolve endpoint ID spaces.
+
+    Raises:
+        ValueError: If an endpoint does not match exactly one Nodes ID space.
+    """
+    export = _spec_exports([(0, spec)])[0]
+    yield export.header(nodes)
+    yield from export.rows(spec.records)
+
+
+def _export_chunks(
+    chunks: Callable[[], Iterable[tuple[object, Nodes | Relationships]]],
+    directory: str,
+    shard_size: int,
+    compress: bool,
+) -> AdminImportExport:
+    # Types columns in a first pass over chunks, then writes rows in a second
+    if shard_size <= 0:
+        raise ValueError(f"shard_size must be positive, got {shard_size}")
+    exports = _spec_exports(chunks())
+    nodes = [e.spec for e in exports.values() if isinstance(e.spec, Nodes)]
+    headers = {spec_id: e.header(nodes) for spec_id, e in exports.items()}
+    os.makedirs(directory, exist_ok=True)
+
+    # Files are numbered per kind in order of appearance
+    writers = {}
+    counts = {"nodes": 0, "relationships": 0}
+    for spec_id, export in exports.items():
+        kind = "nodes" if isinstance(export.spec, Nodes) else "relationships"
+        prefix = _prefix(kind, counts[kind], export.spec.name())
+        counts[kind] += 1
+        writers[spec_id] = _ShardWriter(directory, prefix, shard_size, compress)
+
+    try:
+        for spec_id, spec in chunks():
+            writer = writers[spec_id]
+            for row in exports[spec_id].rows(spec.records):
+                writer.write(row)
+        for spec_id, export in exports.items():
+            for row in export.held_rows():
+                writers[spec_id].write(row)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    result = AdminImportExport(directory=directory)
+    for spec_id, export in exports.items():
+        writer = writers[spec_id]
+        files = [_write_header(directory, writer.prefix, headers[spec_id])] + writer.files
+        result.multiline_fields |= writer.multiline
+        if isinstance(export.spec, Nodes):
+            result.node_files.append(files)
+            result.nodes_exported += writer.rows
+            for vector in export.spec.vector_properties:
+                if vector.create_index:
+                    result.vector_index_statements.append(
+                        vector_index_query(export.spec.labels[0], vector)
+                    )
+        else:
+            result.relationship_files.append(files)
+            result.relationships_exported += writer.rows
+    return result
+
+
+def export_admin_import(
+    data: dict | GraphData,
+    directory: str,
+    shard_size: int = 1_000_000,
+    compress: bool = False,
+) -> AdminImportExport:
+    """Writes neo4j-admin import header and data CSV files for a GraphData payload.
+
+    Args:
+        data (dict or GraphData): Payload in the batch_upload schema.
+        directory (str): Output directory. Created if missing.
+        shard_size (int): Maximum data rows per CSV file. Default 1,000,000.
+        compress (bool): Gzip compress data files. Default False.
+
+    Returns:
+        AdminImportExport: Written files and the import command to run.
+
+    Raises:
+        ValueError: If shard_size is not positive, or a relationship endpoint does not match exactly one Nodes ID space.
+        InvalidPayloadError: If an embedding does not have the declared dimensions.
+    """
+    gdata = GraphData.model_validate(data)
+
+    def chunks():
+        for index, spec in enumerate(gdata.nodes):
+            yield ("nodes", index), spec
+        for index, spec in enumerate(gdata.relationships):
+            yield ("relationships", index), spec
+
+    return _export_chunks(chunks, directory, shard_size, compress)
+
+
+def export_admin_import_file(
+    path: str,
+    directory: str,
+    shard_size: int = 1_000_000,
+    compress: bool = False,
+    chunk_size: int = FILE_CHUNK_SIZE,
+) -> AdminImportExport:
+    """Writes neo4j-admin import files for a payload file, streaming it instead of loading it whole.
+
+    The file is read twice, in chunks of chunk_size records, in the formats accepted by batch_upload_file: .json in the batch_upload schema, or .ndjson/.jsonl as written by neo4j_uploader.synthetic, optionally .gz. Property types are inferred from the first chunk of each specification.
+
+    Args:
+        path (str): Payload file.
+        directory (str): Output directory. Created if missing.
+        shard_size (int): Maximum data rows per CSV file. Default 1,000,000.
+        compress (bool): Gzip compress data files. Default False.
+        chunk_size (int): Records parsed at a time. Default 10,000.
+
+    Returns:
+        AdminImportExport: Written files and the import command to run.
+
+    Raises:
+        ValueError: If shard_size is not positive, or a relationship endpoint does not match exactly one Nodes ID space.
+        InvalidPayloadError: If the file is not valid or an embedding does not have the declared dimensions.
+    """
+    if is_ndjson(path):
+        chunks = lambda: iter_ndjson_spec_chunks(path, chunk_size)
+    else:
+        chunks = lambda: iter_json_spec_chunks(path, chunk_size)
+    return _export_chunks(chunks, directory, shard_size, compress)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Export a GraphData payload file to neo4j-admin import CSV files"
+    )
+    parser.add_argument(
+        "input", help="GraphData .json, or .ndjson/.jsonl, file, optionally .gz"
+    )
+    parser.add_argument("output", help="Output directory")
+    parser.add_argument(
+        "--shard-size", type=int, default=1_000_000, help="Rows per data file"
+    )
+    parser.add_argument(
+        "--gzip", action="store_true", help="Gzip compress data files"
+    )
+    parser.add_argument(
+        "--database", default="neo4j", help="Database name for the printed command"
+    )
+    args = parser.parse_args(argv)
+
+    export = export_admin_import_file(
+        args.input, args.output, shard_size=args.shard_size, compress=args.gzip
+    )
+    print(
+        f"Wrote {export.nodes_exported} nodes and {export.relationships_exported} relationships to {args.output}"
+    )
+    print(" ".join(export.command(args.database)))
+    for statement in export.vector_index_statements:
+        print(statement)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
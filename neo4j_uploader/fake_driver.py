@@ -0,0 +1,649 @@
+"""In-process stand-in for the Neo4j driver surface used by neo4j_uploader.
+
+Allows uploads to be benchmarked and regression tested deterministically without a running Neo4j instance. Simulates per call latency, throughput limits, transient errors and deadlocks, and keeps enough graph state (node keys and relationship endpoints) to return realistic `summary.counters`.
+
+Example:
+
+    from neo4j_uploader import batch_upload
+    from neo4j_uploader.fake_driver import FakeNeo4j
+
+    fake = FakeNeo4j(latency_seconds=0.005, transient_error_rate=0.01, seed=42)
+    with fake.patch():
+        result = batch_upload(config, data)
+    print(fake.stats)
+"""
+
+from neo4j.exceptions import Neo4jError, ServiceUnavailable
+from contextlib import contextmanager
+from typing import Callable, Optional
+import random
+import re
+import time
+
+# Specify Google doctstring type for pdoc auto doc generation
+__docformat__ = "google"
+
+TRANSIENT_ERROR_CODE = "Neo.TransientError.General.TransientError"
+DEADLOCK_ERROR_CODE = "Neo.TransientError.Transaction.DeadlockDetected"
+
+
+def _server_error(code: str, message: str) -> Neo4jError:
+    # The Neo4jError subclass the driver raises for code, ie TransientError for Neo.TransientError codes.
+    # Drivers up to 5.25 build it with the public hydrate, later ones only with _hydrate_neo4j, as 6.x has no public way to set a code
+    hydrate = getattr(Neo4jError, "hydrate", None)
+    if hydrate is None:
+        hydrate = Neo4jError._hydrate_neo4j
+    return hydrate(code=code, message=message)
+
+_NODE_LABEL = re.compile(r"(MERGE|CREATE|MATCH) \(n:`([^`]*)`")
+_NODE_ROW = re.compile(r"\[\$(\w+),\s*\{([^}]*)\}(?:,\s*\$(\w+))?")
+_RELATIONSHIP_ROW = re.compile(r"\[\$(\w+),\s*\$(\w+),\s*\{([^}]*)\}(?:,\s*\$(\w+))?")
+_PROPERTY_PARAM = re.compile(r":\$(\w+)")
+_EXTRA_LABEL = re.compile(r"SET n:`")
+_MATCH_NODE = re.compile(r"MATCH \((fromNode|toNode)(?::`([^`]*)`)? \{`([^`]*)`")
+_RELATIONSHIP_TYPE = re.compile(r"(MERGE|CREATE) \(fromNode\)-\[r:`([^`]*)`\]")
+_RETURN_ALIAS = re.compile(r"\bAS\s+`?(\w+)`?\s*$", re.MULTILINE | re.IGNORECASE)
+_CREATE_CONSTRAINT = re.compile(r"CREATE CONSTRAINT `?(\w+)`?")
+_DROP_CONSTRAINT = re.compile(r"DROP CONSTRAINT `?(\w+)`?")
+_CREATE_INDEX = re.compile(r"CREATE (?:\w+ )?INDEX `?(\w+)`?")
+_DROP_INDEX = re.compile(r"DROP INDEX `?(\w+)`?")
+_LIMIT = re.compile(r"LIMIT (\d+)")
+
+
+class FakeCounters:
+    """Mirrors the attributes of neo4j.SummaryCounters."""
+
+    def __init__(self, **counts):
+        self.nodes_created = 0
+        self.nodes_deleted = 0
+        self.relationships_created = 0
+        self.relationships_deleted = 0
+        self.properties_set = 0
+        self.labels_added = 0
+        self.labels_removed = 0
+        self.indexes_added = 0
+        self.indexes_removed = 0
+        self.constraints_added = 0
+        self.constraints_removed = 0
+        self.system_updates = 0
+        for key, value in counts.items():
+            setattr(self, key, value)
+
+    @property
+    def contains_updates(self) -> bool:
+        return any(
+            value
+            for key, value in self.__dict__.items()
+            if key != "system_updates"
+        )
+
+    @property
+    def contains_system_updates(self) -> bool:
+        return self.system_updates > 0
+
+    def __repr__(self):
+        counts = {k: v for k, v in self.__dict__.items() if v}
+        return f"FakeCounters({counts})"
+
+
+class FakeSummary:
+    """Mirrors the attributes of neo4j.ResultSummary used by neo4j_uploader."""
+
+    def __init__(
+        self,
+        query: str,
+        parameters: dict,
+        database: str,
+        counters: FakeCounters,
+        result_available_after: int,
+    ):
+        self.query = query
+        self.parameters = parameters
+        self.database = database
+        self.counters = counters
+        self.result_available_after = result_available_after
+        self.result_consumed_after = 0
+        self.notifications = None
+
+
+class FakeResult:
+    """Mirrors neo4j.Result for records returned by a session or transaction run."""
+
+    def __init__(self, records: list[dict], summary: FakeSummary):
+        self._records = records
+        self._summary = summary
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def keys(self) -> list[str]:
+        return list(self._records[0].keys()) if self._records else []
+
+    def single(self, strict: bool = False) -> Optional[dict]:
+        if not self._records:
+            return None
+        return self._records[0]
+
+    def data(self) -> list[dict]:
+        return [dict(r) for r in self._records]
+
+    def consume(self) -> FakeSummary:
+        return self._summary
+
+
+class FakeEagerResult(tuple):
+    """Mirrors neo4j.EagerResult, a (records, summary, keys) tuple with named access."""
+
+    def __new__(cls, records: list[dict], summary: FakeSummary, keys: list[str]):
+        return super().__new__(cls, (records, summary, keys))
+
+    @property
+    def records(self) -> list[dict]:
+        return self[0]
+
+    @property
+    def summary(self) -> FakeSummary:
+        return self[1]
+
+    @property
+    def keys(self) -> list[str]:
+        return self[2]
+
+
+class FakeStats:
+    """Aggregate call statistics of a FakeNeo4j instance.
+
+    Args:
+        queries (int): Number of queries run, including failed attempts.
+        rows (int): Number of UNWIND rows processed.
+        transient_errors (int): Number of transient errors raised.
+        deadlocks (int): Number of deadlock errors raised.
+        connectivity_checks (int): Number of verify_connectivity calls.
+        simulated_seconds (float): Total latency simulated across all calls.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.rows = 0
+        self.transient_errors = 0
+        self.deadlocks = 0
+        self.connectivity_checks = 0
+        self.simulated_seconds = 0.0
+
+    def __repr__(self):
+        return f"FakeStats({self.__dict__})"
+
+
+class FakeNeo4j:
+    """Simulated Neo4j server shared by all drivers it creates.
+
+    Args:
+        latency_seconds (float): Fixed latency added to every call. Default 0.0.
+        latency_jitter_seconds (float): Maximum additional random latency per call. Default 0.0.
+        rows_per_second (float): Throughput limit for UNWIND rows. 0 for unlimited. Default 0.
+        transient_error_rate (float): Probability (0.0 - 1.0) that a query raises a TransientError. Default 0.0.
+        deadlock_rate (float): Probability (0.0 - 1.0) that a write query raises a deadlock TransientError. Default 0.0.
+        driver_retries (int): Number of times execute_query and execute_write retry transient errors before raising, as the real driver does. Default 0 so errors surface to the caller.
+        available (bool): False to make verify_connectivity and all queries raise ServiceUnavailable. Default True.
+        seed (int): Random seed for latency jitter and error injection. Default 0.
+        supports_recreate (bool): Allow CREATE OR REPLACE DATABASE from the system database, as Enterprise Edition does. Default False, raising a ClientError like Community Edition.
+        record_queries (bool): Keep every successfully run (query, params, database) in `executed`. Default False.
+        sleep (Callable): Function called with the simulated latency of each call. Defaults to time.sleep, pass None to only track latency in stats without waiting.
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.0,
+        latency_jitter_seconds: float = 0.0,
+        rows_per_second: float = 0,
+        transient_error_rate: float = 0.0,
+        deadlock_rate: float = 0.0,
+        driver_retries: int = 0,
+        available: bool = True,
+        seed: int = 0,
+        supports_recreate: bool = False,
+        record_queries: bool = False,
+        sleep: Optional[Callable[[float], None]] = time.sleep,
+    ):
+        self.latency_seconds = latency_seconds
+        self.latency_jitter_seconds = latency_jitter_seconds
+        self.rows_per_second = rows_per_second
+        self.transient_error_rate = transient_error_rate
+        self.deadlock_rate = deadlock_rate
+        self.driver_retries = driver_retries
+        self.available = available
+        self.supports_recreate = supports_recreate
+        self.record_queries = record_queries
+        self.sleep = sleep
+        self.stats = FakeStats()
+        self.executed: list[tuple[str, dict, str]] = []
+        self._rng = random.Random(seed)
+
+        # Graph state: {database: {label: set(key values)}} and {database: set((type, from, to))}
+        self.nodes: dict[str, dict[str, set]] = {}
+        self.relationships: dict[str, set] = {}
+        # Stored content hash properties: {database: {(label, key value) or (type, from, to): digest}}
+        self.fingerprints: dict[str, dict] = {}
+        self.constraints: dict[str, set] = {}
+        self.indexes: dict[str, set] = {}
+
+    def driver(self, uri: str = "", auth=None, **kwargs) -> "FakeDriver":
+        """Returns a driver bound to this simulated server. Signature matches GraphDatabase.driver."""
+        return FakeDriver(self)
+
+    @contextmanager
+    def patch(self):
+        """Context manager routing all neo4j_uploader driver creation to this simulated server."""
+        from neo4j_uploader import _n4j
+
+        original = _n4j.GraphDatabase
+        _n4j.GraphDatabase = self
+        try:
+            yield self
+        finally:
+            _n4j.GraphDatabase = original
+
+    def node_count(self, database: str = "neo4j") -> int:
+        """Returns the number of distinct nodes stored for a database."""
+        return sum(len(keys) for keys in self.nodes.get(database, {}).values())
+
+    def relationship_count(self, database: str = "neo4j") -> int:
+        """Returns the number of distinct relationships stored for a database."""
+        return len(self.relationships.get(database, set()))
+
+    def _wait(self, rows: int = 0):
+        seconds = self.latency_seconds
+        if self.latency_jitter_seconds > 0:
+            seconds += self._rng.random() * self.latency_jitter_seconds
+        if self.rows_per_second > 0:
+            seconds += rows / self.rows_per_second
+        self.stats.simulated_seconds += seconds
+        if self.sleep is not None and seconds > 0:
+            self.sleep(seconds)
+        return seconds
+
+    def _check_available(self):
+        if not self.available:
+            raise ServiceUnavailable("Simulated Neo4j instance is unavailable")
+
+    def verify_connectivity(self):
+        self.stats.connectivity_checks += 1
+        self._wait()
+        self._check_available()
+
+    def run(self, query: str, parameters: Optional[dict], database: str):
+        """Simulates running a single query.
+
+        Returns:
+            tuple(list[dict], FakeSummary, list[str]): Records, summary and keys.
+        """
+        self._check_available()
+        parameters = parameters or {}
+        self.stats.queries += 1
+
+        is_write = "MERGE" in query or "CREATE" in query or "DELETE" in query
+        rows = query.count("[$") + len(parameters.get("rows", ()))
+        self.stats.rows += rows
+        waited = self._wait(rows)
+
+        roll = self._rng.random()
+        if roll < self.transient_error_rate:
+            self.stats.transient_errors += 1
+            raise _server_error(
+                code=TRANSIENT_ERROR_CODE,
+                message="Simulated transient error",
+            )
+        if is_write and roll < self.transient_error_rate + self.deadlock_rate:
+            self.stats.deadlocks += 1
+            raise _server_error(
+                code=DEADLOCK_ERROR_CODE,
+                message="Simulated deadlock detected while trying to acquire locks",
+            )
+
+        if self.record_queries:
+            self.executed.append((query, parameters, database))
+        records, counters = self._apply(query, parameters, database)
+        summary = FakeSummary(
+            query=query,
+            parameters=parameters,
+            database=database,
+            counters=counters,
+            result_available_after=int(waited * 1000),
+        )
+        keys = list(records[0].keys()) if records else []
+        return records, summary, keys
+
+    def _apply(self, query: str, params: dict, database: str):
+        nodes = self.nodes.setdefault(database, {})
+        relationships = self.relationships.setdefault(database, set())
+        constraints = self.constraints.setdefault(database, set())
+
+        indexes = self.indexes.setdefault(database, set())
+
+        if "DATABASE" in query and database != "system":
+            raise _server_error(
+                code="Neo.ClientError.Statement.NotSystemDatabaseError",
+                message="This is an administration command and it should be executed against the system database",
+            )
+        if query.startswith("CREATE OR REPLACE DATABASE"):
+            if not self.supports_recreate:
+                raise _server_error(
+                    code="Neo.ClientError.Statement.UnsupportedAdministrationCommand",
+                    message="Unsupported administration command",
+                )
+            name = params.get("name", "neo4j")
+            for state in (self.nodes, self.relationships, self.constraints, self.indexes):
+                state.pop(name, None)
+            return [], FakeCounters(system_updates=1)
+        if query.startswith("SHOW DATABASE"):
+            return [{"currentStatus": "online"}], FakeCounters()
+
+        if query.startswith("SHOW CONSTRAINTS"):
+            return [{"name": name} for name in sorted(constraints)], FakeCounters()
+        if query.startswith("SHOW INDEXES"):
+            return [{"name": name} for name in sorted(indexes)], FakeCounters()
+
+        match = _DROP_CONSTRAINT.search(query)
+        if match:
+            removed = 1 if match.group(1) in constraints else 0
+            constraints.discard(match.group(1))
+            return [], FakeCounters(constraints_removed=removed)
+
+        match = _CREATE_CONSTRAINT.search(query)
+        if match:
+            added = 0 if match.group(1) in constraints else 1
+            constraints.add(match.group(1))
+            return [], FakeCounters(constraints_added=added)
+
+        match = _DROP_INDEX.search(query)
+        if match:
+            removed = 1 if match.group(1) in indexes else 0
+            indexes.discard(match.group(1))
+            return [], FakeCounters(indexes_removed=removed)
+
+        match = _CREATE_INDEX.search(query)
+        if match:
+            added = 0 if match.group(1) in indexes else 1
+            indexes.add(match.group(1))
+            return [], FakeCounters(indexes_added=added)
+
+        if "DELETE" in query:
+            return self._apply_delete(query, params, nodes, relationships)
+
+        if query.startswith("UNWIND $keys AS k"):
+            match = re.search(r"MATCH \(n:`([^`]*)`", query)
+            keys = nodes.get(match.group(1), set()) if match else set()
+            return [
+                {"key": value} for value in params.get("keys", []) if _hashable(value) in keys
+            ], FakeCounters()
+
+        if "setNodeVectorProperty" in query:
+            return [], self._apply_vectors(query, params, nodes)
+
+        fingerprints = self.fingerprints.setdefault(database, {})
+
+        if "AS node_data" in query:
+            return [], self._apply_nodes(query, params, nodes, fingerprints)
+
+        if "AS from_to_data" in query:
+            return self._apply_relationships(
+                query, params, nodes, relationships, fingerprints
+            )
+
+        return [], FakeCounters()
+
+    def _apply_delete(self, query: str, params: dict, nodes: dict, relationships: set):
+        limit = params.get("limit")
+        if limit is None:
+            match = _LIMIT.search(query)
+            limit = int(match.group(1)) if match else None
+
+        counters = FakeCounters()
+        if "-[r]->" in query and "DETACH" not in query:
+            # Relationships only
+            deleted = list(relationships)[:limit]
+            relationships.difference_update(deleted)
+            counters.relationships_deleted = len(deleted)
+            count = len(deleted)
+        else:
+            deleted_values = set()
+            for label in list(nodes.keys()):
+                keys = nodes[label]
+                while keys and (limit is None or len(deleted_values) < limit):
+                    deleted_values.add(keys.pop())
+                if not keys:
+                    del nodes[label]
+            detached = {
+                r for r in relationships if r[1] in deleted_values or r[2] in deleted_values
+            }
+            relationships.difference_update(detached)
+            counters.nodes_deleted = len(deleted_values)
+            counters.relationships_deleted = len(detached)
+            count = len(deleted_values)
+
+        records = [{alias: count for alias in _RETURN_ALIAS.findall(query)}]
+        return records, counters
+
+    def _apply_nodes(
+        self, query: str, params: dict, nodes: dict, fingerprints: dict
+    ) -> FakeCounters:
+        match = _NODE_LABEL.search(query)
+        if match is None:
+            return FakeCounters()
+        verb, label = match.groups()
+        extra_labels = len(_EXTRA_LABEL.findall(query))
+        keys = nodes.setdefault(label, set())
+
+        counters = FakeCounters()
+        for key_param, props, digest_param in _NODE_ROW.findall(query):
+            value = _hashable(params.get(key_param))
+            if verb == "MATCH" and value not in keys:
+                continue
+            created = verb == "CREATE" or (verb == "MERGE" and value not in keys)
+            if created:
+                keys.add(value)
+                counters.nodes_created += 1
+                counters.labels_added += 1 + extra_labels
+            digest = params.get(digest_param)
+            if not _fingerprint_changed(fingerprints, (label, value), digest, created):
+                continue
+            counters.properties_set += len(_PROPERTY_PARAM.findall(props))
+            counters.properties_set += 0 if digest is None else 1
+        return counters
+
+    def _apply_vectors(self, query: str, params: dict, nodes: dict) -> FakeCounters:
+        # UNWIND $rows of [key value, embedding], only matching existing nodes
+        match = _NODE_LABEL.search(query)
+        keys = nodes.get(match.group(2), set()) if match else set()
+        counters = FakeCounters()
+        for key_value, _ in params.get("rows", []):
+            if _hashable(key_value) in keys:
+                counters.properties_set += 1
+        return counters
+
+    def _apply_relationships(
+        self,
+        query: str,
+        params: dict,
+        nodes: dict,
+        relationships: set,
+        fingerprints: dict,
+    ) -> tuple[list[dict], FakeCounters]:
+        match = _RELATIONSHIP_TYPE.search(query)
+        if match is None:
+            return [], FakeCounters()
+        verb, rel_type = match.groups()
+        targets = {name: label for name, label, _ in _MATCH_NODE.findall(query)}
+
+        def exists(label, value):
+            if label:
+                return value in nodes.get(label, ())
+            return any(value in keys for keys in nodes.values())
+
+        # Matched rows are returned by queries ending in RETURN tuple[0], tuple[1]
+        returns = "RETURN tuple[0]" in query
+        records = []
+        counters = FakeCounters()
+        for from_param, to_param, props, digest_param in _RELATIONSHIP_ROW.findall(
+            query
+        ):
+            from_value = _hashable(params.get(from_param))
+            to_value = _hashable(params.get(to_param))
+            if not exists(targets.get("fromNode"), from_value):
+                continue
+            if not exists(targets.get("toNode"), to_value):
+                continue
+            if returns:
+                records.append(
+                    {"from_key": params.get(from_param), "to_key": params.get(to_param)}
+                )
+            rel = (rel_type, from_value, to_value)
+            created = verb == "CREATE" or rel not in relationships
+            if created:
+                relationships.add(rel)
+                counters.relationships_created += 1
+            digest = params.get(digest_param)
+            if not _fingerprint_changed(fingerprints, rel, digest, created):
+                continue
+            counters.properties_set += len(_PROPERTY_PARAM.findall(props))
+            counters.properties_set += 0 if digest is None else 1
+        return records, counters
+
+
+def _fingerprint_changed(
+    fingerprints: dict, element: tuple, digest: Optional[str], created: bool
+) -> bool:
+    # Mirrors WITH ... WHERE n.`hash` IS NULL OR n.`hash` <> digest, storing the new digest
+    if digest is None:
+        return True
+    if not created and fingerprints.get(element) == digest:
+        return False
+    fingerprints[element] = digest
+    return True
+
+
+def _hashable(value):
+    if isinstance(value, (list, dict)):
+        return str(value)
+    return value
+
+
+def _is_retryable(error: Exception) -> bool:
+    return isinstance(error, Neo4jError) and error.is_retryable()
+
+
+class FakeTransaction:
+    """Mirrors neo4j.Transaction and neo4j.ManagedTransaction. Effects are applied immediately and are not undone by rollback."""
+
+    def __init__(self, server: FakeNeo4j, database: str):
+        self._server = server
+        self._database = database
+        self.closed = False
+
+    def run(self, query: str, parameters: Optional[dict] = None, **kwargs) -> FakeResult:
+        if "IN TRANSACTIONS" in query:
+            raise _server_error(
+                code="Neo.DatabaseError.Statement.ExecutionFailed",
+                message="A query with 'CALL { ... } IN TRANSACTIONS' can only be executed in an implicit transaction",
+            )
+        records, summary, _ = self._server.run(
+            query, {**(parameters or {}), **kwargs}, self._database
+        )
+        return FakeResult(records, summary)
+
+    def commit(self):
+        self.closed = True
+
+    def rollback(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FakeSession:
+    """Mirrors neo4j.Session."""
+
+    def __init__(self, server: FakeNeo4j, database: str):
+        self._server = server
+        self._database = database
+
+    def run(self, query: str, parameters: Optional[dict] = None, **kwargs) -> FakeResult:
+        records, summary, _ = self._server.run(
+            query, {**(parameters or {}), **kwargs}, self._database
+        )
+        return FakeResult(records, summary)
+
+    def begin_transaction(self, **kwargs) -> FakeTransaction:
+        return FakeTransaction(self._server, self._database)
+
+    def _execute(self, work: Callable, *args, **kwargs):
+        attempt = 0
+        while True:
+            try:
+                return work(FakeTransaction(self._server, self._database), *args, **kwargs)
+            except Exception as e:
+                if not _is_retryable(e) or attempt >= self._server.driver_retries:
+                    raise
+                attempt += 1
+
+    def execute_write(self, work: Callable, *args, **kwargs):
+        return self._execute(work, *args, **kwargs)
+
+    def execute_read(self, work: Callable, *args, **kwargs):
+        return self._execute(work, *args, **kwargs)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FakeDriver:
+    """Mirrors the neo4j.Driver methods used by neo4j_uploader."""
+
+    def __init__(self, server: FakeNeo4j):
+        self._server = server
+
+    def verify_connectivity(self, **kwargs):
+        self._server.verify_connectivity()
+
+    def execute_query(
+        self,
+        query: str,
+        parameters_: Optional[dict] = None,
+        routing_=None,
+        database_: Optional[str] = None,
+        **kwargs,
+    ) -> FakeEagerResult:
+        # As with the real driver, keyword arguments without a trailing underscore are query parameters
+        parameters = {**(parameters_ or {}), **kwargs}
+        session = FakeSession(self._server, database_ or "neo4j")
+
+        def work(tx):
+            result = tx.run(query, parameters)
+            return FakeEagerResult(result.data(), result.consume(), result.keys())
+
+        return session.execute_write(work)
+
+    def session(self, database: Optional[str] = None, **kwargs) -> FakeSession:
+        return FakeSession(self._server, database or "neo4j")
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
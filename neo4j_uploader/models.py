@@ -1,12 +1,79 @@
 from datetime import datetime, timedelta
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Any, Callable, Literal, Optional
+from collections import deque
 from neo4j_uploader._logger import logger
 
 # Specify Google doctstring type for pdoc auto doc generation
 __docformat__ = "google"
 
 
+class NullPolicy(BaseModel):
+    """Values treated as null, which are not uploaded as properties.
+
+    Args:
+        sentinels (list[str]): String values treated as null, in addition to None. Default ['none', 'null', 'empty', ''].
+        case_sensitive (bool): Match sentinels exactly instead of in any case. Default False.
+        enabled (bool): When False, only None is null and strings are never checked. Default True.
+        column_sentinels (dict[str, list[str]]): Sentinels replacing the default ones for specific properties. An empty list only treats None as null for that property. Default {}.
+    """
+
+    sentinels: list[str] = ["none", "null", "empty", ""]
+    case_sensitive: bool = False
+    enabled: bool = True
+    column_sentinels: dict[str, list[str]] = {}
+
+    # Compiled checks by overridden column, None for the default sentinels
+    _checks: dict = PrivateAttr(default_factory=dict)
+
+    def _compile(self, sentinels: list[str]) -> Callable[[Any], bool]:
+        if not self.enabled or len(sentinels) == 0:
+            return lambda value: value is None
+
+        values = frozenset(s if self.case_sensitive else s.lower() for s in sentinels)
+        # Lowercasing never shortens a string, so longer values can be rejected before it
+        max_length = max(len(s) for s in values)
+
+        if self.case_sensitive:
+
+            def check(value) -> bool:
+                return value is None or (
+                    isinstance(value, str) and len(value) <= max_length and value in values
+                )
+
+        else:
+
+            def check(value) -> bool:
+                return value is None or (
+                    isinstance(value, str)
+                    and len(value) <= max_length
+                    and value.lower() in values
+                )
+
+        return check
+
+    def null_check(self, column: Optional[str] = None) -> Callable[[Any], bool]:
+        """Returns a function testing whether a value of column is null. Checks are compiled once, on first use, so the policy should not be modified afterwards.
+
+        Args:
+            column (str): Property name, for column_sentinels overrides. Default None for the default sentinels.
+        """
+        if column not in self.column_sentinels:
+            column = None
+        check = self._checks.get(column)
+        if check is None:
+            sentinels = (
+                self.sentinels if column is None else self.column_sentinels[column]
+            )
+            check = self._compile(sentinels)
+            self._checks[column] = check
+        return check
+
+    def is_null(self, value, column: Optional[str] = None) -> bool:
+        """Returns True if value of column is not uploaded as a property."""
+        return self.null_check(column)(value)
+
+
 class Neo4jConfig(BaseModel):
     """
     Object for specifying target local or hosted Neo4j database instance to upload to data to.
@@ -18,6 +85,18 @@ class Neo4jConfig(BaseModel):
         neo4j_database (str): The name of the Neo4j database to upload to. Default 'neo4j'.
         max_batch_size (int): Maximum number of nodes to upload in a single batch. Default 500.
         overwrite (bool): Overwrite existing nodes. Default False.
+        assume_empty (bool): Caller asserts the target database contains none of the uploaded nodes. Together with overwrite, node records are combined by key client side and uploaded with CREATE instead of MERGE, skipping the lookup and lock for each node. Default False.
+        prefetch_existing_keys (bool): Before each node batch, look up which keys already exist with one indexed UNWIND query per label. New keys are uploaded with CREATE and existing keys with MATCH ... SET instead of MERGE. Results are cached and used to skip relationships whose labelled nodes do not exist. Ignored when overwrite or assume_empty is True. Default False.
+        skip_unchanged (bool): Store a content hash of each record in a hidden property and only write properties when the hash differs. When a FingerprintStore is passed to the upload, records whose hash is unchanged since their last committed upload are not sent at all. Default False.
+        fingerprint_property (str): Name of the hidden content hash property used by skip_unchanged. Default '_upload_fingerprint'.
+        fingerprint_store_path (str): Path of a local SQLite file recording the digest of each committed record, by database, label/type and key. Used by skip_unchanged when no FingerprintStore is passed to the upload, so reruns only send changed records. Default None.
+        reset_strategy (str): How the database is cleared when overwrite is True. 'batched_delete' deletes relationships then nodes in CALL { } IN TRANSACTIONS batches, 'delete' runs DETACH DELETE batches in managed transactions for older servers and 'recreate' replaces the whole database with CREATE OR REPLACE DATABASE, falling back to 'batched_delete' when not permitted. Default 'batched_delete'.
+        recreate_timeout_seconds (int): Maximum time to wait for a recreated database to come online. Default 300.
+        reset_batch_size (int): Number of relationships or nodes deleted per inner transaction when overwrite is True. Default 10,000.
+        profile_memory (bool): Record peak memory and top allocation sites for each upload phase with tracemalloc. Results are added to UploadResult.memory_profile. Slows uploads down considerably. Default False.
+        null_policy (NullPolicy): Values not uploaded as properties, unless a specification sets its own. Default NullPolicy(), None and 'none', 'null', 'empty' and '' in any case.
+        vector_batch_size (int): Maximum number of embeddings set per transaction for Nodes vector_properties. Embeddings are uploaded in their own batches, after a specification's other properties. Default 100.
+        validation (str): How a dict payload is converted to GraphData. 'full' validates and copies every record. 'spec-only' is for trusted input: it validates each specification's fields, but uses its records list as is, only checking that a sample of records have their key fields. Default 'full'.
     """
 
     neo4j_uri: str
@@ -26,6 +105,18 @@ class Neo4jConfig(BaseModel):
     neo4j_database: str = Field(default="neo4j")
     max_batch_size: int = Field(default=500)
     overwrite: bool = False
+    assume_empty: bool = False
+    prefetch_existing_keys: bool = False
+    skip_unchanged: bool = False
+    fingerprint_property: str = "_upload_fingerprint"
+    fingerprint_store_path: Optional[str] = None
+    reset_strategy: Literal["delete", "batched_delete", "recreate"] = "batched_delete"
+    recreate_timeout_seconds: int = Field(default=300)
+    reset_batch_size: int = Field(default=10_000)
+    profile_memory: bool = False
+    null_policy: NullPolicy = NullPolicy()
+    vector_batch_size: int = Field(default=100)
+    validation: Literal["full", "spec-only"] = "full"
 
     def creds(self) -> tuple[str, str, str]:
         """Convenience for providing tuple of Neo4j credentials as (uri, user, password).
@@ -35,6 +126,33 @@ class Neo4jConfig(BaseModel):
         """
 
 
+class VectorProperty(BaseModel):
+    """Embedding property of a Nodes specification, stored compactly with db.create.setNodeVectorProperty and searchable through a vector index.
+
+    Args:
+        name (str): Record key and node property holding the embedding. Values may be lists or NumPy arrays.
+        dimensions (int): Length of every embedding.
+        similarity (str): Similarity function of the vector index, 'cosine' or 'euclidean'. Default 'cosine'.
+        index_name (str): Name of the vector index. Default None for '<first label>_<name>_vector'.
+        create_index (bool): Create the vector index if it does not exist, before setting embeddings. Default True.
+    """
+
+    name: str
+    dimensions: int
+    similarity: Literal["cosine", "euclidean"] = "cosine"
+    index_name: Optional[str] = None
+    create_index: bool = True
+
+    def index(self, label: str) -> str:
+        """Returns the vector index name for nodes with the given label."""
+        if self.index_name is not None:
+            return self.index_name
+        return f"{label}_{self.name}_vector"
+
+
+PropertyType = Literal["string", "date", "datetime", "duration", "point"]
+
+
 class Nodes(BaseModel):
     """Configuration object for uploading nodes to a Neo4j database.
 
@@ -44,6 +162,11 @@ class Nodes(BaseModel):
         records (list[dict]): List of dictionary objects containing node data.
         exclude_keys (list[str]): List of keys to exclude from upload.
         dedupe (bool): Remove duplicate entries. Default True.
+        null_policy (NullPolicy): Values not uploaded as properties. Default None, using Neo4jConfig.null_policy.
+        map_mode (str): How map values, and lists Neo4j cannot store as a property, are uploaded. 'str' stores their string form, 'json' compact JSON and 'flatten' one property per map entry with dotted names, ie `address.city`. Lists of a single primitive type are always uploaded as lists. Default 'str'.
+        vector_properties (list[VectorProperty]): Embedding properties, uploaded with db.create.setNodeVectorProperty in separate batches of Neo4jConfig.vector_batch_size. Default [].
+        property_types (dict[str, str]): Conversion of property values to Neo4j temporal and spatial types: 'date', 'datetime' and 'duration' for ISO 8601 strings, 'point' for maps with lat and lon (or lng, or latitude and longitude) numbers. 'string' keeps values as they are. Values that do not convert are uploaded unchanged. Default {}.
+        infer_types (bool): Detect property_types from a sample of the records. Explicit property_types take precedence. Default False.
     """
 
     labels: list[str]
@@ -51,6 +174,15 @@ class Nodes(BaseModel):
     records: list[dict]
     exclude_keys: Optional[list[str]] = []
     dedupe: Optional[bool] = True
+    null_policy: Optional[NullPolicy] = None
+    map_mode: Literal["str", "json", "flatten"] = "str"
+    vector_properties: list[VectorProperty] = []
+    property_types: dict[str, PropertyType] = {}
+    infer_types: bool = False
+
+    def name(self) -> str:
+        """Returns a readable identifier for this specification, ie 'Person:User'."""
+        return ":".join(self.labels)
 
 
 class TargetNode(BaseModel):
@@ -78,6 +210,10 @@ class Relationships(BaseModel):
         exclude_keys (list[str]): List of keys to exclude from upload.
         auto_exclude_keys (bool): Automatically exclude keys used to reference nodes used in the from_node and to_node arguments. Default True.
         dedupe (bool): Remove duplicate entries. Default True.
+        null_policy (NullPolicy): Values not uploaded as properties. Default None, using Neo4jConfig.null_policy.
+        map_mode (str): How map values, and lists Neo4j cannot store as a property, are uploaded. 'str' stores their string form, 'json' compact JSON and 'flatten' one property per map entry with dotted names, ie `address.city`. Lists of a single primitive type are always uploaded as lists. Default 'str'.
+        property_types (dict[str, str]): Conversion of property values to Neo4j temporal and spatial types: 'date', 'datetime' and 'duration' for ISO 8601 strings, 'point' for maps with lat and lon (or lng, or latitude and longitude) numbers. 'string' keeps values as they are. Values that do not convert are uploaded unchanged. Default {}.
+        infer_types (bool): Detect property_types from a sample of the records. Explicit property_types take precedence. Default False.
     """
 
     type: str
@@ -87,6 +223,14 @@ class Relationships(BaseModel):
     exclude_keys: Optional[list[str]] = []
     auto_exclude_keys: Optional[bool] = True
     dedupe: Optional[bool] = True
+    null_policy: Optional[NullPolicy] = None
+    map_mode: Literal["str", "json", "flatten"] = "str"
+    property_types: dict[str, PropertyType] = {}
+    infer_types: bool = False
+
+    def name(self) -> str:
+        """Returns a readable identifier for this specification, ie 'KNOWS'."""
+        return self.type
 
 
 class GraphData(BaseModel):
@@ -101,6 +245,430 @@ class GraphData(BaseModel):
     relationships: Optional[list[Relationships]] = []
 
 
+class RecordSource(BaseModel):
+    """Common options of CSV and Parquet files read as Nodes or Relationships records.
+
+    Args:
+        path (str): CSV or Parquet file. CSV files may be gzip compressed with a trailing .gz.
+        format (str): 'csv' or 'parquet'. Default None, inferred from the path extension.
+        columns (list[str]): Source columns to read. Default None for all columns.
+        rename (dict[str, str]): Property name for source columns whose name differs. Default {}.
+        column_types (dict[str, str]): Conversion of CSV text values by source column: 'str', 'int', 'float' or 'bool'. Parquet values keep their stored types. Default {}, leaving CSV values as strings.
+        delimiter (str): CSV field delimiter. Default ','.
+        exclude_keys (list[str]): Properties, after renaming, to exclude from upload.
+        null_policy (NullPolicy): Values not uploaded as properties. Default None, using Neo4jConfig.null_policy.
+        map_mode (str): How Parquet map and struct values are uploaded, as for Nodes. Default 'str'.
+        property_types (dict[str, str]): Temporal and spatial types by property, after renaming, as for Nodes. Default {}.
+        infer_types (bool): Detect property_types from a sample of each chunk, as for Nodes. Default False.
+    """
+
+    path: str
+    format: Optional[Literal["csv", "parquet"]] = None
+    columns: Optional[list[str]] = None
+    rename: dict[str, str] = {}
+    column_types: dict[str, Literal["str", "int", "float", "bool"]] = {}
+    delimiter: str = ","
+    exclude_keys: Optional[list[str]] = []
+    null_policy: Optional[NullPolicy] = None
+    map_mode: Literal["str", "json", "flatten"] = "str"
+    property_types: dict[str, PropertyType] = {}
+    infer_types: bool = False
+
+    def file_format(self) -> str:
+        """Returns the configured format, or the one inferred from the path."""
+        if self.format is not None:
+            return self.format
+        return "parquet" if self.path.endswith((".parquet", ".pq")) else "csv"
+
+
+class NodesSource(RecordSource):
+    """Maps the rows of a CSV or Parquet file to node records.
+
+    Args:
+        labels (list[str]): Node labels.
+        key (str): Property, after renaming, that uniquely identifies each node.
+        dedupe (bool): Remove duplicate entries. Default True.
+        vector_properties (list[VectorProperty]): Embedding columns, after renaming, as for Nodes. Default [].
+    """
+
+    labels: list[str]
+    key: str
+    dedupe: Optional[bool] = True
+    vector_properties: list[VectorProperty] = []
+
+    def name(self) -> str:
+        """Returns a readable identifier for this source, ie 'Person:User'."""
+        return ":".join(self.labels)
+
+    def specification(self, records: list[dict]) -> Nodes:
+        """Returns a Nodes specification for a chunk of records read from this source, without validating the records again."""
+        return Nodes.model_construct(
+            labels=self.labels,
+            key=self.key,
+            records=records,
+            exclude_keys=self.exclude_keys,
+            dedupe=self.dedupe,
+            null_policy=self.null_policy,
+            map_mode=self.map_mode,
+            property_types=self.property_types,
+            infer_types=self.infer_types,
+            vector_properties=self.vector_properties,
+        )
+
+
+class RelationshipsSource(RecordSource):
+    """Maps the rows of a CSV or Parquet file to relationship records.
+
+    Args:
+        type (str): Relationship type.
+        from_node (TargetNode): Source node, with record_key naming the property, after renaming, holding its key.
+        to_node (TargetNode): Target node, with record_key naming the property, after renaming, holding its key.
+        auto_exclude_keys (bool): Exclude the from and to properties from upload. Default True.
+        dedupe (bool): Remove duplicate entries. Default True.
+    """
+
+    type: str
+    from_node: TargetNode
+    to_node: TargetNode
+    auto_exclude_keys: Optional[bool] = True
+    dedupe: Optional[bool] = True
+
+    def name(self) -> str:
+        """Returns a readable identifier for this source, ie 'KNOWS'."""
+        return self.type
+
+    def specification(self, records: list[dict]) -> Relationships:
+        """Returns a Relationships specification for a chunk of records read from this source, without validating the records again."""
+        return Relationships.model_construct(
+            type=self.type,
+            from_node=self.from_node,
+            to_node=self.to_node,
+            records=records,
+            exclude_keys=self.exclude_keys,
+            auto_exclude_keys=self.auto_exclude_keys,
+            dedupe=self.dedupe,
+            null_policy=self.null_policy,
+            map_mode=self.map_mode,
+            property_types=self.property_types,
+            infer_types=self.infer_types,
+        )
+
+
+class SourceData(BaseModel):
+    """CSV and Parquet sources to upload, the file based counterpart of GraphData.
+
+    Args:
+        nodes (list[NodesSource]): Node sources, uploaded first.
+        relationships (list[RelationshipsSource]): Relationship sources, uploaded after all nodes.
+    """
+
+    nodes: list[NodesSource] = []
+    relationships: list[RelationshipsSource] = []
+
+
+class FrameSpec(BaseModel):
+    """Common options of pandas DataFrames, Arrow tables and dicts of NumPy arrays uploaded as Nodes or Relationships records.
+
+    Args:
+        frame (Any): pandas DataFrame, pyarrow Table or RecordBatch, or a dict of column name to array. Not copied or validated.
+        exclude_keys (list[str]): Columns to exclude from upload. Excluded columns are dropped before rows are built.
+        null_policy (NullPolicy): Values not uploaded as properties. Default None, using Neo4jConfig.null_policy.
+        map_mode (str): How struct and map values are uploaded, as for Nodes. Default 'str'.
+        property_types (dict[str, str]): Temporal and spatial types by column, as for Nodes. Default {}.
+        infer_types (bool): Detect property_types from a sample of each chunk, as for Nodes. Default False.
+    """
+
+    frame: Any
+    exclude_keys: Optional[list[str]] = []
+    null_policy: Optional[NullPolicy] = None
+    map_mode: Literal["str", "json", "flatten"] = "str"
+    property_types: dict[str, PropertyType] = {}
+    infer_types: bool = False
+
+
+class NodesFrame(FrameSpec):
+    """Maps the rows of a columnar frame to node records.
+
+    Args:
+        labels (list[str]): Node labels.
+        key (str): Column that uniquely identifies each node.
+        dedupe (bool): Remove duplicate entries. Default True.
+        vector_properties (list[VectorProperty]): Embedding columns, as for Nodes. Default [].
+    """
+
+    labels: list[str]
+    key: str
+    dedupe: Optional[bool] = True
+    vector_properties: list[VectorProperty] = []
+
+    def name(self) -> str:
+        """Returns a readable identifier for this frame, ie 'Person:User'."""
+        return ":".join(self.labels)
+
+    def required_columns(self) -> set[str]:
+        """Returns columns read directly from each record, which are never dropped or cleaned."""
+        return {self.key}
+
+    def specification(self, records: list[dict]) -> Nodes:
+        """Returns a Nodes specification for a chunk of rows of this frame, without validating the records again."""
+        return Nodes.model_construct(
+            labels=self.labels,
+            key=self.key,
+            records=records,
+            exclude_keys=self.exclude_keys,
+            dedupe=self.dedupe,
+            null_policy=self.null_policy,
+            map_mode=self.map_mode,
+            property_types=self.property_types,
+            infer_types=self.infer_types,
+            vector_properties=self.vector_properties,
+        )
+
+
+class RelationshipsFrame(FrameSpec):
+    """Maps the rows of a columnar frame to relationship records.
+
+    Args:
+        type (str): Relationship type.
+        from_node (TargetNode): Source node, with record_key naming the column holding its key.
+        to_node (TargetNode): Target node, with record_key naming the column holding its key.
+        auto_exclude_keys (bool): Exclude the from and to columns from upload, instead of exclude_keys. Default True.
+        dedupe (bool): Remove duplicate entries. Default True.
+    """
+
+    type: str
+    from_node: TargetNode
+    to_node: TargetNode
+    auto_exclude_keys: Optional[bool] = True
+    dedupe: Optional[bool] = True
+
+    def name(self) -> str:
+        """Returns a readable identifier for this frame, ie 'KNOWS'."""
+        return self.type
+
+    def required_columns(self) -> set[str]:
+        """Returns columns read directly from each record, which are never dropped or cleaned."""
+        return {self.from_node.record_key, self.to_node.record_key}
+
+    def specification(self, records: list[dict]) -> Relationships:
+        """Returns a Relationships specification for a chunk of rows of this frame, without validating the records again."""
+        return Relationships.model_construct(
+            type=self.type,
+            from_node=self.from_node,
+            to_node=self.to_node,
+            records=records,
+            exclude_keys=self.exclude_keys,
+            auto_exclude_keys=self.auto_exclude_keys,
+            dedupe=self.dedupe,
+            null_policy=self.null_policy,
+            map_mode=self.map_mode,
+            property_types=self.property_types,
+            infer_types=self.infer_types,
+        )
+
+
+class FrameData(BaseModel):
+    """Columnar frames to upload, the in memory columnar counterpart of GraphData.
+
+    Args:
+        nodes (list[NodesFrame]): Node frames, uploaded first.
+        relationships (list[RelationshipsFrame]): Relationship frames, uploaded after all nodes.
+    """
+
+    nodes: list[NodesFrame] = []
+    relationships: list[RelationshipsFrame] = []
+
+
+class AllocationSite(BaseModel):
+    """Source line responsible for memory allocated during an upload phase.
+
+    Args:
+        file (str): Source file of the allocation.
+        line (int): Line number within the file.
+        size_bytes (int): Bytes allocated by this line and still held at the end of the phase.
+        count (int): Number of memory blocks allocated by this line and still held at the end of the phase.
+    """
+
+    file: str
+    line: int
+    size_bytes: int
+    count: int
+
+
+class PhaseMemory(BaseModel):
+    """Memory usage of a single upload phase, captured when Neo4jConfig.profile_memory is enabled.
+
+    Args:
+        phase (str): Name of the phase. One of 'validation', 'reset', 'query_generation' or 'upload'.
+        peak_bytes (int): Peak traced memory reached during the phase.
+        allocated_bytes (int): Net traced memory allocated by the phase and still held at its end. Can be negative.
+        top_allocations (list[AllocationSite]): Largest allocation sites of the phase.
+    """
+
+    phase: str
+    peak_bytes: int
+    allocated_bytes: int
+    top_allocations: list[AllocationSite] = []
+
+
+class ResetProgress(BaseModel):
+    """Progress of clearing a database before an upload.
+
+    Args:
+        phase (str): Current phase. One of 'schema', 'relationships', 'nodes', 'recreate' or 'complete'.
+        strategy (str): Reset strategy in use. Differs from the requested strategy if 'recreate' was not permitted and fell back to 'batched_delete'.
+        schema_dropped (int): Number of constraints and indexes dropped.
+        relationships_deleted (int): Number of relationships deleted so far.
+        nodes_deleted (int): Number of nodes deleted so far.
+    """
+
+    phase: str
+    strategy: str = "batched_delete"
+    schema_dropped: int = 0
+    relationships_deleted: int = 0
+    nodes_deleted: int = 0
+
+
+class SpecProgress(BaseModel):
+    """Upload progress of a single Nodes or Relationships specification.
+
+    Args:
+        name (str): Specification identifier. Node labels joined by ':' or the relationship type.
+        element_type (str): 'nodes' or 'relationships'.
+        batches_total (int): Number of batches the specification was split into.
+        batches_completed (int): Number of batches uploaded successfully.
+        batches_failed (int): Number of batches that raised an error.
+        records_total (int): Number of records in the specification.
+        records_completed (int): Number of records in successfully uploaded batches.
+        records_failed (int): Number of records in failed batches.
+        seconds_elapsed (float): Time spent uploading this specification's batches.
+    """
+
+    name: str
+    element_type: str
+    batches_total: int
+    batches_completed: int = 0
+    batches_failed: int = 0
+    records_total: int
+    records_completed: int = 0
+    records_failed: int = 0
+    seconds_elapsed: float = 0.0
+
+    def records_remaining(self) -> int:
+        """Returns the number of records not yet processed."""
+        return max(self.records_total - self.records_completed - self.records_failed, 0)
+
+    def records_per_second(self) -> float:
+        """Returns the average processing rate of this specification, or 0.0 if nothing was processed yet."""
+        if self.seconds_elapsed <= 0:
+            return 0.0
+        return (self.records_completed + self.records_failed) / self.seconds_elapsed
+
+    def projected_seconds_to_complete(
+        self, records_per_second: Optional[float] = None
+    ) -> int:
+        """Returns projected seconds to process this specification's remaining records.
+
+        Args:
+            records_per_second (float): Rate to project with, such as UploadResult's recent rate for the element type. Default None for this specification's own average rate.
+
+        Returns:
+            int: Projected seconds. 0 if no records remain, -1 if the rate is not known yet.
+        """
+        remaining = self.records_remaining()
+        if remaining == 0:
+            return 0
+        rate = self.records_per_second() if records_per_second is None else records_per_second
+        if rate <= 0:
+            return -1
+        return int(remaining / rate)
+
+
+class ThroughputModel(BaseModel):
+    """Assumed server performance used to estimate upload durations.
+
+    Args:
+        seconds_per_batch (float): Fixed round trip and transaction overhead of each batch. Default 0.02.
+        node_rows_per_second (float): Node records written per second within a batch. Default 20,000.
+        relationship_rows_per_second (float): Relationship records written per second within a batch. Default 10,000.
+        parameter_bytes_per_second (float): Network and decoding throughput for query text and parameters. Default 50,000,000.
+    """
+
+    seconds_per_batch: float = 0.02
+    node_rows_per_second: float = 20_000
+    relationship_rows_per_second: float = 10_000
+    parameter_bytes_per_second: float = 50_000_000
+
+    def batch_seconds(self, element_type: str, rows: int, payload_bytes: int) -> float:
+        """Returns the estimated duration of a single batch."""
+        rate = (
+            self.node_rows_per_second
+            if element_type == "nodes"
+            else self.relationship_rows_per_second
+        )
+        return (
+            self.seconds_per_batch
+            + rows / rate
+            + payload_bytes / self.parameter_bytes_per_second
+        )
+
+
+class SpecPlan(BaseModel):
+    """Planned upload of a single Nodes or Relationships specification.
+
+    Args:
+        name (str): Specification identifier. Node labels joined by ':' or the relationship type.
+        element_type (str): 'nodes' or 'relationships'.
+        batches (int): Number of batches the specification is split into.
+        records (int): Number of input records.
+        records_after_dedupe (int): Number of rows sent after duplicate records are removed, including embedding rows of vector_properties.
+        query_bytes (int): Total size of the generated Cypher text.
+        parameter_bytes (int): Total JSON encoded size of the parameters, approximating the Bolt payload.
+        estimated_seconds (float): Estimated upload duration from the ThroughputModel.
+    """
+
+    name: str
+    element_type: str
+    batches: int = 0
+    records: int = 0
+    records_after_dedupe: int = 0
+    query_bytes: int = 0
+    parameter_bytes: int = 0
+    estimated_seconds: float = 0.0
+
+
+class UploadPlan(BaseModel):
+    """Dry run summary of what an upload would send, returned by plan_upload.
+
+    Args:
+        specs (list[SpecPlan]): Plan for each specification, in upload order.
+        query_templates (list[str]): Distinct query shapes, with the inline row list replaced by '$rows'.
+        throughput (ThroughputModel): Performance assumptions behind the estimates.
+        will_reset (bool): True if the target database would be cleared first. Reset time is not estimated.
+    """
+
+    specs: list[SpecPlan] = []
+    query_templates: list[str] = []
+    throughput: ThroughputModel = ThroughputModel()
+    will_reset: bool = False
+
+    def batches_total(self) -> int:
+        """Returns the number of batches across all specifications."""
+        return sum(s.batches for s in self.specs)
+
+    def records_total(self) -> int:
+        """Returns the number of rows sent across all specifications."""
+        return sum(s.records_after_dedupe for s in self.specs)
+
+    def parameter_bytes_total(self) -> int:
+        """Returns the parameter payload size across all specifications."""
+        return sum(s.parameter_bytes for s in self.specs)
+
+    def estimated_seconds(self) -> float:
+        """Returns the estimated upload duration across all specifications."""
+        return sum(s.estimated_seconds for s in self.specs)
+
+
 class UploadResult(BaseModel):
     """Result object for uploading nodes to a Neo4j database.
 
@@ -123,7 +691,21 @@ class UploadResult(BaseModel):
 
         properties_set (int): Number of properties set.
 
+        nodes_deleted (int): Number of nodes deleted while resetting the database when Neo4jConfig.overwrite is True.
+
+        relationships_deleted (int): Number of relationships deleted while resetting the database when Neo4jConfig.overwrite is True.
+
+        records_unchanged (int): Number of records not sent because their content hash matched the fingerprint store. Only counted when Neo4jConfig.skip_unchanged is True.
+
         error_message (str): Error message if upload failed.
+
+        memory_profile (list[PhaseMemory]): Memory usage per upload phase. Only populated when Neo4jConfig.profile_memory is True.
+
+        specs (list[SpecProgress]): Progress of each Nodes and Relationships specification, in upload order. Rates and estimates below count the records within these specifications rather than batches.
+
+        peak_records_per_second (float): Highest rolling window rate observed so far.
+
+        window_seconds (float): Length of the sliding window used by current_records_per_second. Default 30.0.
     """
 
     started_at: datetime
@@ -135,7 +717,25 @@ class UploadResult(BaseModel):
     nodes_created: int = 0
     relationships_created: int = 0
     properties_set: int = 0
+    nodes_deleted: int = 0
+    relationships_deleted: int = 0
+    records_unchanged: int = 0
     error_message: Optional[str] = ""
+    memory_profile: list[PhaseMemory] = []
+    specs: list[SpecProgress] = []
+    peak_records_per_second: float = 0.0
+    window_seconds: float = 30.0
+
+    # Completed batches as (finished_at, duration seconds, records, element_type), oldest first
+    _samples: deque = PrivateAttr(default_factory=deque)
+
+    def peak_memory_bytes(self) -> int:
+        """Returns the highest peak memory across all profiled phases.
+
+        Returns:
+            int: Peak bytes, or 0 if memory was not profiled.
+        """
+        return max((p.peak_bytes for p in self.memory_profile), default=0)
 
     def __repr__(self):
         return (
@@ -161,8 +761,118 @@ class UploadResult(BaseModel):
         """
         return float(f"{self.records_completed / self.records_total:.2f}")
 
+    def record_batch(
+        self,
+        spec_index: int,
+        records: int,
+        seconds: float,
+        succeeded: bool = True,
+        finished_at: Optional[datetime] = None,
+    ):
+        """Registers a processed batch and updates rolling throughput.
+
+        Args:
+            spec_index (int): Index into specs of the batch's specification.
+            records (int): Number of records in the batch.
+            seconds (float): Time taken to upload the batch.
+            succeeded (bool): False if the batch raised an error. Default True.
+            finished_at (datetime): Completion time of the batch. Default now.
+        """
+        finished_at = finished_at or datetime.now()
+        spec = self.specs[spec_index]
+        spec.seconds_elapsed += seconds
+        if succeeded:
+            spec.batches_completed += 1
+            spec.records_completed += records
+        else:
+            spec.batches_failed += 1
+            spec.records_failed += records
+
+        self._samples.append((finished_at, seconds, records, spec.element_type))
+
+        # Keep a single sample older than the window as the start of the window
+        window_start = finished_at - timedelta(seconds=self.window_seconds)
+        while len(self._samples) > 1 and self._samples[1][0] <= window_start:
+            self._samples.popleft()
+
+        current = self.current_records_per_second()
+        if current > self.peak_records_per_second:
+            self.peak_records_per_second = current
+
+    def current_records_per_second(self) -> float:
+        """Returns the record processing rate over the most recent window_seconds.
+
+        Returns:
+            float: Records per second, or 0.0 if no batches have been processed.
+        """
+        if len(self._samples) == 0:
+            return 0.0
+
+        last = self._samples[-1][0]
+        window_start = last - timedelta(seconds=self.window_seconds)
+        first = self._samples[0]
+        if first[0] <= window_start and len(self._samples) > 1:
+            # Oldest sample only anchors the start of the window
+            samples = list(self._samples)[1:]
+            start = first[0]
+        else:
+            samples = self._samples
+            start = min(first[0] - timedelta(seconds=first[1]), last)
+
+        elapsed = (last - start).total_seconds()
+        if elapsed <= 0:
+            return 0.0
+        return sum(s[2] for s in samples) / elapsed
+
+    def average_records_per_second(self) -> float:
+        """Returns the record processing rate since the upload started.
+
+        Returns:
+            float: Records per second, or 0.0 if no batches have been processed.
+        """
+        processed = sum(s.records_completed + s.records_failed for s in self.specs)
+        end = self.finished_at or datetime.now()
+        elapsed = (end - self.started_at).total_seconds()
+        if elapsed <= 0:
+            return 0.0
+        return processed / elapsed
+
+    def _element_type_rate(self, element_type: str) -> float:
+        # Prefer recent batches of the same element type, then lifetime totals
+        window = [s for s in self._samples if s[3] == element_type]
+        seconds = sum(s[1] for s in window)
+        if seconds > 0:
+            return sum(s[2] for s in window) / seconds
+        specs = [s for s in self.specs if s.element_type == element_type]
+        seconds = sum(s.seconds_elapsed for s in specs)
+        if seconds > 0:
+            return sum(s.records_completed + s.records_failed for s in specs) / seconds
+        return 0.0
+
+    def _spec_remaining_seconds(self) -> Optional[list[float]]:
+        # Seconds left for each spec at the recent rate of its element type, or None if a needed rate is unknown
+        fallback = self.current_records_per_second() or self.average_records_per_second()
+        rates = {}
+        result = []
+        for spec in self.specs:
+            remaining = spec.records_remaining()
+            if remaining == 0:
+                result.append(0.0)
+                continue
+            if spec.element_type not in rates:
+                rates[spec.element_type] = (
+                    self._element_type_rate(spec.element_type) or fallback
+                )
+            rate = rates[spec.element_type]
+            if rate <= 0:
+                return None
+            result.append(remaining / rate)
+        return result
+
     def projected_seconds_to_complete(self) -> int:
-        """Returns projected seconds to complete based on current rate of completion.
+        """Returns projected seconds to complete based on the current rate of completion.
+
+        When specs are available, remaining node and relationship records are each estimated with the recent rate observed for that element type, falling back to the overall rate for element types not yet started. Otherwise the estimate uses the average rate of completed batches.
 
         Returns:
             int: Projected seconds to complete. Returns -1 if no records have been completed or unable to calculate.
@@ -176,9 +886,14 @@ class UploadResult(BaseModel):
         if self.records_total <= self.records_completed:
             return 0
 
+        if self.specs:
+            remaining = self._spec_remaining_seconds()
+            if remaining is None:
+                return -1
+            return int(sum(remaining))
+
         # Calculate the time elapsed since the start
         elapsed_time = (datetime.now() - self.started_at).total_seconds()
-        # logger.debug(f"Elapsed time: {elapsed_time} seconds")
 
         # Avoid division by zero if the elapsed time is zero
         if elapsed_time == 0:
@@ -186,15 +901,12 @@ class UploadResult(BaseModel):
 
         # Calculate the rate of processing records per second
         records_per_second = self.records_completed / elapsed_time
-        # logger.debug(f"Records per second: {records_per_second}")
 
         # Calculate the number of remaining records
         remaining_records = self.records_total - self.records_completed
-        # logger.debug(f"Remaining records: {remaining_records}")
 
         # Project the remaining time based on the current rate
-        remaining_seconds = remaining_records * records_per_second
-        # logger.debug(f"Projected remaining seconds: {remaining_seconds}")
+        remaining_seconds = remaining_records / records_per_second
 
         # Return the projected time as an integer
         return int(remaining_seconds)
@@ -205,4 +917,32 @@ class UploadResult(BaseModel):
         Returns:
             datetime: Projected completion time of the upload.
         """
-        return self.started_at + timedelta(seconds=self.projected_seconds_to_complete())
+        return datetime.now() + timedelta(seconds=self.projected_seconds_to_complete())
+
+    def spec_projected_seconds_to_complete(self, spec_index: int) -> int:
+        """Returns projected seconds until a specification is complete. Specifications are uploaded in order, so this includes the remaining records of the specifications before it, each at the recent rate of its element type.
+
+        Args:
+            spec_index (int): Index into specs.
+
+        Returns:
+            int: Projected seconds. 0 if the specification is complete, -1 if no records have been completed or unable to calculate.
+        """
+        if self.specs[spec_index].records_remaining() == 0:
+            return 0
+        if self.records_completed == 0:
+            return -1
+        remaining = self._spec_remaining_seconds()
+        if remaining is None:
+            return -1
+        return int(sum(remaining[: spec_index + 1]))
+
+    def spec_projected_completion_time(self, spec_index: int) -> datetime:
+        """Returns the projected end time of a specification. See spec_projected_seconds_to_complete.
+
+        Returns:
+            datetime: Projected completion time of the specification.
+        """
+        return datetime.now() + timedelta(
+            seconds=self.spec_projected_seconds_to_complete(spec_index)
+        )
@@ -0,0 +1,396 @@
+"""Synthetic graph generation for load testing and benchmarks.
+
+Records are produced lazily so arbitrarily large fixtures can be streamed to disk without being held in memory. Output can be a GraphData object (for moderately sized graphs), a .json file in the GraphData schema or an NDJSON file.
+
+NDJSON format - one JSON object per line. A specification line declares a Nodes or Relationships specification without its records and must appear before any of its records:
+
+    {"spec": "Person", "nodes": {"labels": ["Person"], "key": "uid"}}
+    {"spec": "KNOWS", "relationships": {"type": "KNOWS", "from_node": {...}, "to_node": {...}}}
+
+Each following record line references a declared specification by name:
+
+    {"spec": "Person", "record": {"uid": "Person-0", "prop_0": 42}}
+
+CLI usage:
+
+    python -m neo4j_uploader.synthetic --nodes 1000000 --fan-out 3 --labels 2 --output graph.ndjson.gz
+"""
+
+from neo4j_uploader.models import GraphData, Nodes, Relationships, TargetNode
+from pydantic import BaseModel, Field
+from typing import Iterator, Literal, Optional
+from collections import deque
+import argparse
+import gzip
+import json
+import random
+import string
+import sys
+
+# Specify Google doctstring type for pdoc auto doc generation
+__docformat__ = "google"
+
+PropertyType = Literal["int", "float", "str", "bool"]
+
+# Number of recently generated records kept as candidates for duplication
+_DUPLICATE_WINDOW = 1024
+
+
+class SyntheticGraphConfig(BaseModel):
+    """Parameters for generating a synthetic graph.
+
+    Args:
+        node_count (int): Total number of node records to generate, split evenly across labels.
+        label_count (int): Number of distinct node labels. Default 1.
+        relationship_type_count (int): Number of distinct relationship types. Default 1.
+        fan_out (float): Average number of outgoing relationships per node. Default 2.0.
+        distribution (str): 'uniform' or 'power_law' selection of relationship endpoints. Default 'power_law'.
+        power_law_exponent (float): Exponent used by the power_law distribution. Higher values concentrate relationships on fewer nodes. Default 2.0.
+        property_width (int): Number of properties per record, excluding keys. Default 5.
+        property_types (list[str]): Value types cycled through for properties. At least one of 'int', 'float', 'str', 'bool'. Default all.
+        string_length (int): Length of generated string values. Default 12.
+        duplicate_ratio (float): Expected fraction (0.0 - below 1.0) of generated records that repeat a recently generated record. Duplicates are added to the unique records, so all node_count nodes always exist. Default 0.0.
+        key (str): Property name uniquely identifying nodes. Default 'uid'.
+        seed (int): Random seed so output is reproducible. Default 0.
+    """
+
+    node_count: int = Field(default=1000, ge=0)
+    label_count: int = Field(default=1, ge=1)
+    relationship_type_count: int = Field(default=1, ge=0)
+    fan_out: float = Field(default=2.0, ge=0.0)
+    distribution: Literal["uniform", "power_law"] = "power_law"
+    power_law_exponent: float = Field(default=2.0, gt=0.0)
+    property_width: int = Field(default=5, ge=0)
+    property_types: list[PropertyType] = Field(
+        default=["int", "float", "str", "bool"], min_length=1
+    )
+    string_length: int = Field(default=12, ge=0)
+    duplicate_ratio: float = Field(default=0.0, ge=0.0, lt=1.0)
+    key: str = "uid"
+    seed: int = 0
+
+    def label(self, index: int) -> str:
+        """Returns the node label for a label index."""
+        return f"Label{index}"
+
+    def relationship_type(self, index: int) -> str:
+        """Returns the relationship type for a type index."""
+        return f"TYPE{index}"
+
+    def nodes_per_label(self, index: int) -> int:
+        """Returns the number of node records generated for a label index."""
+        base, remainder = divmod(self.node_count, self.label_count)
+        return base + (1 if index < remainder else 0)
+
+    def relationships_per_type(self, index: int) -> int:
+        """Returns the number of relationship records generated for a relationship type index."""
+        total = int(self.node_count * self.fan_out)
+        base, remainder = divmod(total, self.relationship_type_count)
+        return base + (1 if index < remainder else 0)
+
+    def relationship_labels(self, index: int) -> tuple[str, str]:
+        """Returns the source and target node labels for a relationship type index."""
+        from_idx = index % self.label_count
+        to_idx = (index + 1) % self.label_count
+        return self.label(from_idx), self.label(to_idx)
+
+
+def _value(rng: random.Random, kind: str, length: int):
+    if kind == "int":
+        return rng.randint(0, 1_000_000)
+    if kind == "float":
+        return rng.random()
+    if kind == "bool":
+        return rng.random() < 0.5
+    return "".join(rng.choices(string.ascii_letters, k=length))
+
+
+def _properties(rng: random.Random, config: SyntheticGraphConfig) -> dict:
+    types = config.property_types
+    return {
+        f"prop_{idx}": _value(rng, types[idx % len(types)], config.string_length)
+        for idx in range(config.property_width)
+    }
+
+
+def _endpoint(rng: random.Random, config: SyntheticGraphConfig, count: int) -> int:
+    # Uniform or bounded power law index in [0, count)
+    if config.distribution == "uniform":
+        return rng.randrange(count)
+
+    # Inverse transform sampling of a bounded Pareto distribution over ranks 1..count
+    s = config.power_law_exponent
+    u = rng.random()
+    if s == 1.0:
+        rank = count**u
+    else:
+        rank = ((count ** (1.0 - s) - 1.0) * u + 1.0) ** (1.0 / (1.0 - s))
+    return min(int(rank) - 1, count - 1) if rank >= 1.0 else 0
+
+
+def _with_duplicates(
+    records: Iterator[dict], rng: random.Random, ratio: float
+) -> Iterator[dict]:
+    # Every unique record is yielded, each followed by a geometric number of duplicates so that on average ratio of all yielded records are duplicates
+    recent = deque(maxlen=_DUPLICATE_WINDOW)
+    for record in records:
+        recent.append(record)
+        yield record
+        while ratio > 0.0 and rng.random() < ratio:
+            yield dict(recent[rng.randrange(len(recent))])
+
+
+def iter_node_records(config: SyntheticGraphConfig, label_index: int = 0) -> Iterator[dict]:
+    """Lazily generates node records for a label.
+
+    Args:
+        config (SyntheticGraphConfig): Generation parameters.
+        label_index (int): Index of the label to generate records for.
+
+    Returns:
+        Iterator[dict]: Node records, one per node of the label plus any duplicates.
+    """
+    rng = random.Random(f"{config.seed}-nodes-{label_index}")
+    label = config.label(label_index)
+
+    def unique():
+        for idx in range(config.nodes_per_label(label_index)):
+            record = {config.key: f"{label}-{idx}"}
+            record.update(_properties(rng, config))
+            yield record
+
+    return _with_duplicates(unique(), rng, config.duplicate_ratio)
+
+
+def iter_relationship_records(
+    config: SyntheticGraphConfig, type_index: int = 0
+) -> Iterator[dict]:
+    """Lazily generates relationship records for a relationship type.
+
+    Args:
+        config (SyntheticGraphConfig): Generation parameters.
+        type_index (int): Index of the relationship type to generate records for.
+
+    Returns:
+        Iterator[dict]: Relationship records with `_from_<key>` and `_to_<key>` keys referencing generated nodes.
+    """
+    rng = random.Random(f"{config.seed}-relationships-{type_index}")
+    from_label, to_label = config.relationship_labels(type_index)
+    from_count = config.nodes_per_label(type_index % config.label_count)
+    to_count = config.nodes_per_label((type_index + 1) % config.label_count)
+    from_key = f"_from_{config.key}"
+    to_key = f"_to_{config.key}"
+
+    def unique():
+        if from_count == 0 or to_count == 0:
+            return
+        for _ in range(config.relationships_per_type(type_index)):
+            record = {
+                from_key: f"{from_label}-{_endpoint(rng, config, from_count)}",
+                to_key: f"{to_label}-{_endpoint(rng, config, to_count)}",
+            }
+            record.update(_properties(rng, config))
+            yield record
+
+    return _with_duplicates(unique(), rng, config.duplicate_ratio)
+
+
+def node_specification(config: SyntheticGraphConfig, label_index: int) -> dict:
+    """Returns the Nodes specification, without records, for a label index."""
+    return {"labels": [config.label(label_index)], "key": config.key}
+
+
+def relationship_specification(config: SyntheticGraphConfig, type_index: int) -> dict:
+    """Returns the Relationships specification, without records, for a relationship type index."""
+    from_label, to_label = config.relationship_labels(type_index)
+    return {
+        "type": config.relationship_type(type_index),
+        "from_node": {
+            "record_key": f"_from_{config.key}",
+            "node_key": config.key,
+            "node_label": from_label,
+        },
+        "to_node": {
+            "record_key": f"_to_{config.key}",
+            "node_key": config.key,
+            "node_label": to_label,
+        },
+    }
+
+
+def iter_specifications(
+    config: SyntheticGraphConfig,
+) -> Iterator[tuple[str, str, dict, Iterator[dict]]]:
+    """Lazily generates all specifications, nodes first.
+
+    Args:
+        config (SyntheticGraphConfig): Generation parameters.
+
+    Returns:
+        Iterator[tuple[str, str, dict, Iterator[dict]]]: Tuples of (name, 'nodes' or 'relationships', specification without records, records iterator).
+    """
+    for idx in range(config.label_count):
+        yield (
+            config.label(idx),
+            "nodes",
+            node_specification(config, idx),
+            iter_node_records(config, idx),
+        )
+    for idx in range(config.relationship_type_count):
+        yield (
+            config.relationship_type(idx),
+            "relationships",
+            relationship_specification(config, idx),
+            iter_relationship_records(config, idx),
+        )
+
+
+def generate_graph_data(config: SyntheticGraphConfig) -> GraphData:
+    """Generates a synthetic graph as a GraphData object. All records are held in memory, use write_ndjson() or write_json() for large graphs.
+
+    Args:
+        config (SyntheticGraphConfig): Generation parameters.
+
+    Returns:
+        GraphData: Generated nodes and relationships specifications.
+    """
+    nodes = []
+    relationships = []
+    for _, kind, spec, records in iter_specifications(config):
+        if kind == "nodes":
+            nodes.append(Nodes(records=list(records), **spec))
+        else:
+            relationships.append(
+                Relationships(
+                    type=spec["type"],
+                    from_node=TargetNode(**spec["from_node"]),
+                    to_node=TargetNode(**spec["to_node"]),
+                    records=list(records),
+                )
+            )
+    return GraphData(nodes=nodes, relationships=relationships)
+
+
+def _open(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "wt", encoding="utf-8")
+    return open(path, "w", encoding="utf-8")
+
+
+def write_ndjson(config: SyntheticGraphConfig, path: str) -> int:
+    """Streams a synthetic graph to an NDJSON file. Paths ending in .gz are gzip compressed.
+
+    Args:
+        config (SyntheticGraphConfig): Generation parameters.
+        path (str): Output file path.
+
+    Returns:
+        int: Number of records written.
+    """
+    count = 0
+    with _open(path) as f:
+        for name, kind, spec, records in iter_specifications(config):
+            f.write(json.dumps({"spec": name, kind: spec}) + "\n")
+            for record in records:
+                f.write(json.dumps({"spec": name, "record": record}) + "\n")
+                count += 1
+    return count
+
+
+def write_json(config: SyntheticGraphConfig, path: str) -> int:
+    """Streams a synthetic graph to a .json file in the GraphData schema. Paths ending in .gz are gzip compressed.
+
+    Args:
+        config (SyntheticGraphConfig): Generation parameters.
+        path (str): Output file path.
+
+    Returns:
+        int: Number of records written.
+    """
+    count = 0
+    with _open(path) as f:
+        f.write('{"nodes": [')
+        current_kind = "nodes"
+        first_spec = True
+        for _, kind, spec, records in iter_specifications(config):
+            if kind != current_kind:
+                f.write('], "relationships": [')
+                current_kind = kind
+                first_spec = True
+            if not first_spec:
+                f.write(", ")
+            first_spec = False
+            f.write(json.dumps(spec)[:-1] + ', "records": [')
+            for idx, record in enumerate(records):
+                if idx != 0:
+                    f.write(", ")
+                f.write(json.dumps(record))
+                count += 1
+            f.write("]}")
+        if current_kind == "nodes":
+            f.write('], "relationships": [')
+        f.write("]}")
+    return count
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic graph in the neo4j_uploader GraphData schema"
+    )
+    parser.add_argument("--nodes", type=int, default=1000, help="Total node records")
+    parser.add_argument("--labels", type=int, default=1, help="Distinct node labels")
+    parser.add_argument(
+        "--types", type=int, default=1, help="Distinct relationship types"
+    )
+    parser.add_argument(
+        "--fan-out", type=float, default=2.0, help="Average relationships per node"
+    )
+    parser.add_argument(
+        "--distribution", choices=["uniform", "power_law"], default="power_law"
+    )
+    parser.add_argument("--exponent", type=float, default=2.0)
+    parser.add_argument("--width", type=int, default=5, help="Properties per record")
+    parser.add_argument(
+        "--property-types",
+        default="int,float,str,bool",
+        help="Comma separated value types to cycle through",
+    )
+    parser.add_argument("--string-length", type=int, default=12)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.0)
+    parser.add_argument("--key", default="uid")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output",
+        required=True,
+        help="Output path. .ndjson, .json, optionally followed by .gz",
+    )
+    args = parser.parse_args(argv)
+
+    config = SyntheticGraphConfig(
+        node_count=args.nodes,
+        label_count=args.labels,
+        relationship_type_count=args.types,
+        fan_out=args.fan_out,
+        distribution=args.distribution,
+        power_law_exponent=args.exponent,
+        property_width=args.width,
+        property_types=args.property_types.split(","),
+        string_length=args.string_length,
+        duplicate_ratio=args.duplicate_ratio,
+        key=args.key,
+        seed=args.seed,
+    )
+
+    output = args.output[:-3] if args.output.endswith(".gz") else args.output
+    if output.endswith(".ndjson"):
+        count = write_ndjson(config, args.output)
+    elif output.endswith(".json"):
+        count = write_json(config, args.output)
+    else:
+        parser.error("--output must end in .ndjson or .json (optionally .gz)")
+    print(f"Wrote {count} records to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+import csv
+import gzip
+import json
+import os
+import pytest
+from neo4j_uploader.admin_import import (
+    export_admin_import,
+    export_admin_import_file,
+    main,
+)
+from neo4j_uploader.errors import InvalidPayloadError
+
+DATA = {
+    "nodes": [
+        {
+            "labels": ["Person", "User"],
+            "key": "uid",
+            "records": [
+                {"uid": "a", "age": 30, "tags": ["x", "y"]},
+                {"uid": "b", "age": 1.5, "active": True},
+                {"uid": "a", "name": "A,\"quoted\""},
+            ],
+        },
+        {"labels": ["City"], "key": "uid", "records": [{"uid": "c"}]},
+    ],
+    "relationships": [
+        {
+            "type": "LIVES_IN",
+            "from_node": {"record_key": "_from", "node_key": "uid", "node_label": "User"},
+            "to_node": {"record_key": "_to", "node_key": "uid", "node_label": "City"},
+            "records": [
+                {"_from": "a", "_to": "c", "since": 2020},
+                {"_from": "a", "_to": "c", "since": 2021},
+            ],
+        }
+    ],
+}
+
+
+def read_rows(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+class TestExportAdminImport:
+    def test_node_files(self, tmp_path):
+        export = export_admin_import(DATA, str(tmp_path))
+        header, data = export.node_files[0]
+
+        assert read_rows(header) == [
+            [":ID(Person)", "active:boolean", "age:double", "name", "tags:string[]", "uid", ":LABEL"]
+        ]
+        # Records with the same key are combined, as consecutive MERGEs would
+        assert read_rows(data) == [
+            ["a", "", "30", "A,\"quoted\"", "x;y", "a", "Person;User"],
+            ["b", "true", "1.5", "", "", "b", "Person;User"],
+        ]
+        assert export.nodes_exported == 3
+
+    def test_relationship_id_spaces(self, tmp_path):
+        export = export_admin_import(DATA, str(tmp_path))
+        header, data = export.relationship_files[0]
+
+        assert read_rows(header) == [[":START_ID(Person)", ":END_ID(City)", "since:long", ":TYPE"]]
+        assert read_rows(data) == [["a", "c", "2021", "LIVES_IN"]]
+
+    def test_shards_and_gzip(self, tmp_path):
+        data = {"nodes": [{"labels": ["N"], "key": "k", "records": [{"k": i} for i in range(5)]}]}
+        export = export_admin_import(data, str(tmp_path), shard_size=2, compress=True)
+
+        files = export.node_files[0]
+        assert len(files) == 1 + 3
+        assert all(f.endswith(".csv.gz") for f in files[1:])
+        assert sum(len(read_rows(f)) for f in files[1:]) == 5
+
+    def test_ambiguous_id_space(self, tmp_path):
+        data = {
+            "nodes": [
+                {"labels": ["A"], "key": "uid", "records": [{"uid": 1}]},
+                {"labels": ["B"], "key": "uid", "records": [{"uid": 2}]},
+            ],
+            "relationships": [
+                {
+                    "type": "R",
+                    "from_node": {"record_key": "f", "node_key": "uid"},
+                    "to_node": {"record_key": "t", "node_key": "uid", "node_label": "B"},
+                    "records": [{"f": 1, "t": 2}],
+                }
+            ],
+        }
+        with pytest.raises(ValueError):
+            export_admin_import(data, str(tmp_path))
+
+    def test_command(self, tmp_path):
+        export = export_admin_import(DATA, str(tmp_path))
+        command = export.command("graph")
+
+        assert command[:4] == ["neo4j-admin", "database", "import", "full"]
+        assert command[-1] == "graph"
+        assert f"--nodes={','.join(export.node_files[0])}" in command
+        assert "--multiline-fields=true" not in command
+
+    def test_map_mode(self, tmp_path):
+        data = {
+            "nodes": [
+                {
+                    "labels": ["N"],
+                    "key": "k",
+                    "map_mode": "json",
+                    "records": [{"k": 1, "meta": {"a": 1}, "mixed": [1, "x"]}],
+                }
+            ]
+        }
+        header, rows = export_admin_import(data, str(tmp_path)).node_files[0]
+
+        assert read_rows(header) == [[":ID(N)", "k:long", "meta", "mixed", ":LABEL"]]
+        assert read_rows(rows) == [["1", "1", '{"a":1}', '[1,"x"]', "N"]]
+
+    def test_typed_columns(self, tmp_path):
+        data = {
+            "nodes": [
+                {
+                    "labels": ["N"],
+                    "key": "k",
+                    "infer_types": True,
+                    "property_types": {"wait": "duration"},
+                    "records": [
+                        {
+                            "k": "a",
+                            "born": "2000-01-02",
+                            "seen": "2024-01-02T03:04:05Z",
+                            "wait": "P1D",
+                            "loc": {"latitude": 1.5, "longitude": 2.5},
+                        }
+                    ],
+                }
+            ]
+        }
+        header, rows = export_admin_import(data, str(tmp_path)).node_files[0]
+
+        assert read_rows(header) == [
+            [":ID(N)", "born:date", "k", "loc:point", "seen:datetime", "wait:duration", ":LABEL"]
+        ]
+        assert read_rows(rows) == [
+            [
+                "a",
+                "2000-01-02",
+                "a",
+                "{crs:WGS-84, longitude:2.5, latitude:1.5}",
+                "2024-01-02T03:04:05.000000000+00:00",
+                "P1D",
+                "N",
+            ]
+        ]
+
+    def test_vector_properties(self, tmp_path):
+        data = {
+            "nodes": [
+                {
+                    "labels": ["Doc"],
+                    "key": "k",
+                    "vector_properties": [{"name": "emb", "dimensions": 2}],
+                    "records": [{"k": 1, "emb": [1, 0.5]}, {"k": 2}],
+                }
+            ]
+        }
+        export = export_admin_import(data, str(tmp_path))
+        header, rows = export.node_files[0]
+
+        assert read_rows(header) == [[":ID(Doc)", "emb:float[]", "k:long", ":LABEL"]]
+        assert read_rows(rows) == [["1", "1.0;0.5", "1", "Doc"], ["2", "", "2", "Doc"]]
+        assert len(export.vector_index_statements) == 1
+        assert "CREATE VECTOR INDEX `Doc_emb_vector`" in export.vector_index_statements[0]
+
+        data["nodes"][0]["records"] = [{"k": 1, "emb": [1.0]}]
+        with pytest.raises(InvalidPayloadError):
+            export_admin_import(data, str(tmp_path / "invalid"))
+
+    @pytest.mark.parametrize("name", ["graph.json", "graph.ndjson"])
+    def test_file_chunks(self, tmp_path, name):
+        source = tmp_path / name
+        if name.endswith(".ndjson"):
+            lines = []
+            for spec in DATA["nodes"] + DATA["relationships"]:
+                fields = {k: v for k, v in spec.items() if k != "records"}
+                spec_name = spec.get("type") or spec["labels"][0]
+                kind = "relationships" if "type" in spec else "nodes"
+                lines.append({"spec": spec_name, kind: fields})
+                lines += [{"spec": spec_name, "record": r} for r in spec["records"]]
+            source.write_text("\n".join(json.dumps(line) for line in lines))
+        else:
+            source.write_text(json.dumps(DATA))
+
+        # Chunks of one record combine records with the same key across chunks, written last
+        export = export_admin_import_file(str(source), str(tmp_path / "out"), chunk_size=1)
+        expected = export_admin_import(DATA, str(tmp_path / "expected"))
+
+        for files, expected_files in [
+            (export.node_files[0], expected.node_files[0]),
+            (export.relationship_files[0], expected.relationship_files[0]),
+        ]:
+            assert read_rows(files[0]) == read_rows(expected_files[0])
+            assert sorted(read_rows(files[1])) == sorted(read_rows(expected_files[1]))
+        assert export.nodes_exported == 3
+
+    def test_cli(self, tmp_path):
+        source = tmp_path / "graph.json"
+        source.write_text(json.dumps(DATA))
+        assert main([str(source), str(tmp_path / "out")]) == 0
+        assert len(os.listdir(tmp_path / "out")) == 6
@@ -0,0 +1,107 @@
+import sys
+import pytest
+from neo4j_uploader import batch_upload_frames
+from neo4j_uploader.fake_driver import FakeNeo4j
+from neo4j_uploader.models import FrameData, NodesFrame, RelationshipsFrame
+from neo4j_uploader._columnar import (
+    _exclude_columns,
+    cleaned_table,
+    iter_frame_records,
+    iter_frame_spec_chunks,
+)
+
+CONFIG = {"neo4j_uri": "bolt://fake", "neo4j_password": "pw", "max_batch_size": 2}
+
+KNOWS = {
+    "type": "KNOWS",
+    "from_node": {"record_key": "src", "node_key": "uid", "node_label": "Person"},
+    "to_node": {"record_key": "dst", "node_key": "uid", "node_label": "Person"},
+}
+
+
+class TestExcludeColumns:
+    def test_nodes_keep_key(self):
+        spec = NodesFrame(frame=None, labels=["Person"], key="uid", exclude_keys=["uid", "note"])
+        assert _exclude_columns(spec) == {"note"}
+
+    def test_relationships_auto_exclude(self):
+        spec = RelationshipsFrame(frame=None, exclude_keys=["note"], **KNOWS)
+        # Auto excluded node references are still needed in each record
+        assert _exclude_columns(spec) == set()
+
+        spec = RelationshipsFrame(frame=None, exclude_keys=["note"], auto_exclude_keys=False, **KNOWS)
+        assert _exclude_columns(spec) == {"note"}
+
+    def test_missing_pyarrow(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        spec = NodesFrame(frame={"uid": [1]}, labels=["Person"], key="uid")
+        with pytest.raises(ImportError, match="pyarrow"):
+            cleaned_table(spec)
+
+
+class TestArrowFrames:
+    def test_cleaning(self):
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table(
+            {
+                "uid": ["null", "b", "c"],
+                "name": ["Ann", "NULL", None],
+                "tags": [["x"], None, ["y", "z"]],
+                "kind": pa.array(["a", "Empty", "a"]).dictionary_encode(),
+                "note": ["1", "2", "3"],
+            }
+        )
+        spec = NodesFrame(frame=table, labels=["Person"], key="uid", exclude_keys=["note"])
+        rows = cleaned_table(spec).to_pylist()
+
+        assert rows == [
+            # Keys are read as is
+            {"uid": "null", "name": "Ann", "tags": ["x"], "kind": "a"},
+            {"uid": "b", "name": None, "tags": None, "kind": None},
+            {"uid": "c", "name": None, "tags": ["y", "z"], "kind": "a"},
+        ]
+
+    def test_chunks(self):
+        pa = pytest.importorskip("pyarrow")
+        spec = NodesFrame(frame=pa.table({"uid": [1, 2, 3]}), labels=["Person"], key="uid")
+        assert list(iter_frame_records(spec, 2)) == [[{"uid": 1}, {"uid": 2}], [{"uid": 3}]]
+
+    def test_spec_chunks(self):
+        pa = pytest.importorskip("pyarrow")
+        frames = FrameData(
+            nodes=[NodesFrame(frame=pa.table({"uid": [1, 2, 3]}), labels=["Person"], key="uid")],
+            relationships=[RelationshipsFrame(frame={"src": [1], "dst": [2]}, **KNOWS)],
+        )
+        chunks = list(iter_frame_spec_chunks(frames, 2))
+
+        assert [spec_id for spec_id, _ in chunks] == [("nodes", 0), ("nodes", 0), ("relationships", 0)]
+        assert chunks[2][1].records == [{"src": 1, "dst": 2}]
+
+    def test_upload(self):
+        pa = pytest.importorskip("pyarrow")
+        frames = {
+            "nodes": [{"frame": pa.table({"uid": [1, 2, 3], "name": ["a", "none", "c"]}), "labels": ["Person"], "key": "uid"}],
+            "relationships": [{"frame": pa.table({"src": [1, 2], "dst": [2, 3]}), **KNOWS}],
+        }
+        fake = FakeNeo4j(sleep=None)
+        with fake.patch():
+            result = batch_upload_frames(CONFIG, frames)
+
+        assert result.was_successful
+        assert result.nodes_created == 3
+        assert result.relationships_created == 2
+        assert [s.records_total for s in result.specs] == [3, 2]
+
+
+class TestPandasFrames:
+    def test_missing_values(self):
+        pd = pytest.importorskip("pandas")
+        pytest.importorskip("pyarrow")
+        frame = pd.DataFrame({"uid": [1, 2], "score": [1.5, float("nan")]}, index=[10, 11])
+        spec = NodesFrame(frame=frame, labels=["Person"], key="uid")
+
+        # NaN is null and the index is dropped
+        assert next(iter_frame_records(spec, 10)) == [
+            {"uid": 1, "score": 1.5},
+            {"uid": 2, "score": None},
+        ]
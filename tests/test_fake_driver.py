@@ -0,0 +1,131 @@
+import pytest
+from neo4j.exceptions import ClientError, Neo4jError, TransientError, ServiceUnavailable
+from neo4j_uploader.fake_driver import FakeNeo4j, DEADLOCK_ERROR_CODE, _server_error
+from neo4j_uploader._queries import nodes_query, relationships_query
+from neo4j_uploader.models import TargetNode
+
+
+def upload_people(driver):
+    query, params = nodes_query(
+        "test", [{"uid": "a", "name": "A"}, {"uid": "b"}], "uid", ["Person"]
+    )
+    return driver.execute_query(query, params, database_="neo4j")
+
+
+class TestFakeNeo4j:
+    def test_node_counters(self):
+        fake = FakeNeo4j(sleep=None)
+        with fake.driver() as driver:
+            _, summary, _ = upload_people(driver)
+            assert summary.counters.nodes_created == 2
+            assert summary.counters.properties_set == 3
+
+            # MERGE of existing keys creates nothing new
+            _, summary, _ = upload_people(driver)
+            assert summary.counters.nodes_created == 0
+        assert fake.node_count() == 2
+
+    def test_relationship_counters(self):
+        fake = FakeNeo4j(sleep=None)
+        target = TargetNode(record_key="_from", node_key="uid", node_label="Person")
+        to = TargetNode(record_key="_to", node_key="uid", node_label="Person")
+        records = [
+            {"_from": "a", "_to": "b", "since": 2020},
+            {"_from": "a", "_to": "missing"},
+        ]
+        query, params = relationships_query(
+            "test", records, target, to, "KNOWS", exclude_keys=["_from", "_to"]
+        )
+        with fake.driver() as driver:
+            upload_people(driver)
+            _, summary, _ = driver.execute_query(query, params)
+        assert summary.counters.relationships_created == 1
+        assert summary.counters.properties_set == 1
+        assert fake.relationship_count() == 1
+
+    def test_simulated_latency(self):
+        waits = []
+        fake = FakeNeo4j(latency_seconds=0.5, rows_per_second=4, sleep=waits.append)
+        with fake.driver() as driver:
+            upload_people(driver)
+        assert waits == [1.0]
+        assert fake.stats.simulated_seconds == 1.0
+
+    def test_transient_errors_are_deterministic(self):
+        def failures(seed):
+            fake = FakeNeo4j(transient_error_rate=0.5, seed=seed, sleep=None)
+            result = []
+            with fake.driver() as driver:
+                for _ in range(20):
+                    try:
+                        upload_people(driver)
+                        result.append(False)
+                    except TransientError:
+                        result.append(True)
+            return result
+
+        assert failures(1) == failures(1)
+        assert any(failures(1))
+
+    def test_deadlocks(self):
+        fake = FakeNeo4j(deadlock_rate=1.0, sleep=None)
+        with fake.driver() as driver:
+            with pytest.raises(TransientError) as e:
+                upload_people(driver)
+        assert e.value.code == DEADLOCK_ERROR_CODE
+        assert fake.stats.deadlocks == 1
+
+    def test_server_errors(self, monkeypatch):
+        error = _server_error("Neo.ClientError.Statement.SyntaxError", "Invalid")
+        assert isinstance(error, ClientError)
+        assert error.code == "Neo.ClientError.Statement.SyntaxError"
+        assert not error.is_retryable()
+
+        # Drivers before 5.26 only provide the public hydrate
+        calls = []
+
+        def hydrate(**kwargs):
+            calls.append(kwargs)
+            return TransientError(kwargs["message"])
+
+        monkeypatch.setattr(Neo4jError, "hydrate", hydrate, raising=False)
+        error = _server_error(DEADLOCK_ERROR_CODE, "Deadlock")
+        assert isinstance(error, TransientError)
+        assert calls == [{"code": DEADLOCK_ERROR_CODE, "message": "Deadlock"}]
+
+    def test_driver_retries(self):
+        fake = FakeNeo4j(transient_error_rate=0.5, driver_retries=50, seed=3, sleep=None)
+        with fake.driver() as driver:
+            for _ in range(10):
+                upload_people(driver)
+        assert fake.stats.transient_errors > 0
+
+    def test_unavailable(self):
+        fake = FakeNeo4j(available=False, sleep=None)
+        with pytest.raises(ServiceUnavailable):
+            fake.driver().verify_connectivity()
+
+    def test_session_and_transaction(self):
+        fake = FakeNeo4j(sleep=None)
+        with fake.driver().session(database="neo4j") as session:
+            with session.begin_transaction() as tx:
+                tx.run("CREATE CONSTRAINT person_uid FOR (n:Person) REQUIRE n.uid IS UNIQUE")
+                tx.commit()
+            records = session.run("SHOW CONSTRAINTS").data()
+        assert records == [{"name": "person_uid"}]
+
+    def test_patch_routes_uploader(self):
+        from neo4j_uploader import batch_upload
+
+        fake = FakeNeo4j(sleep=None)
+        config = {"neo4j_uri": "bolt://fake", "neo4j_password": "pw", "overwrite": True}
+        data = {
+            "nodes": [
+                {"labels": ["Person"], "key": "uid", "records": [{"uid": "a"}, {"uid": "b"}]}
+            ]
+        }
+        with fake.patch():
+            result = batch_upload(config, data)
+        assert result.was_successful
+        assert result.nodes_created == 2
+        assert fake.stats.connectivity_checks == 1
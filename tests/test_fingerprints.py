@@ -0,0 +1,214 @@
+from neo4j_uploader import batch_upload
+from neo4j_uploader.fake_driver import FakeNeo4j, TRANSIENT_ERROR_CODE, _server_error
+from neo4j_uploader._fingerprints import (
+    FingerprintStore,
+    SQLiteFingerprintStore,
+    record_digest,
+    filter_unchanged,
+    commit_fingerprints,
+)
+from neo4j_uploader._queries import nodes_query, relationships_query
+from neo4j_uploader.models import Nodes, Relationships, TargetNode
+
+CONFIG = {
+    "neo4j_uri": "bolt://fake",
+    "neo4j_password": "pw",
+    "skip_unchanged": True,
+}
+
+
+def people(*records):
+    return {"nodes": [{"labels": ["Person"], "key": "uid", "records": list(records)}]}
+
+
+def knows(*records):
+    return {
+        "relationships": [
+            {
+                "type": "KNOWS",
+                "from_node": {"record_key": "_from", "node_key": "uid", "node_label": "Person"},
+                "to_node": {"record_key": "_to", "node_key": "uid", "node_label": "Person"},
+                "records": list(records),
+            }
+        ]
+    }
+
+
+class TestRecordDigest:
+    def test_independent_of_key_order(self):
+        assert record_digest({"a": 1, "b": 2}) == record_digest({"b": 2, "a": 1})
+
+    def test_ignores_excluded_keys(self):
+        assert record_digest({"a": 1, "x": 1}, ["x"]) == record_digest({"a": 1, "x": 2}, ["x"])
+        assert record_digest({"a": 1}) != record_digest({"a": 2})
+
+
+class TestFingerprintQueries:
+    def test_nodes_query_compares_hash(self):
+        query, params = nodes_query(
+            "b0n", [{"uid": "a"}], "uid", ["Person", "User"], fingerprint_property="_h"
+        )
+        assert "[$uid_b0n0,  {`uid`:$uid_b0n0}, $_h_b0n0]" in query
+        assert query.endswith(
+            "SET n:`User`\nWITH n, node WHERE n.`_h` IS NULL OR n.`_h` <> node[2]\nSET n += node[1], n.`_h` = node[2]"
+        )
+        assert params["_h_b0n0"] == record_digest({"uid": "a"})
+
+    def test_relationships_query_compares_hash(self):
+        target = TargetNode(record_key="_from", node_key="uid")
+        to = TargetNode(record_key="_to", node_key="uid")
+        query, _ = relationships_query(
+            "b0r", [{"_from": "a", "_to": "b"}], target, to, "KNOWS",
+            exclude_keys=["_from", "_to"], fingerprint_property="_h",
+        )
+        assert "r.`_h` <> tuple[3]" in query
+        assert "SET r += tuple[2], r.`_h` = tuple[3])" in query
+        # Matched rows are returned so only committed records are stored
+        assert query.endswith("RETURN tuple[0] AS from_key, tuple[1] AS to_key")
+
+
+class TestFingerprintStore:
+    def test_filter_unchanged(self):
+        store = FingerprintStore()
+        spec = Nodes(labels=["Person"], key="uid", records=[{"uid": "a"}, {"uid": "b"}])
+        assert filter_unchanged(spec, store, "neo4j") == spec.records
+
+        commit_fingerprints(spec, spec.records, store, "neo4j")
+        changed = Nodes(labels=["Person"], key="uid", records=[{"uid": "a"}, {"uid": "b", "x": 1}])
+        assert filter_unchanged(changed, store, "neo4j") == [{"uid": "b", "x": 1}]
+        # Scoped by database
+        assert len(filter_unchanged(changed, store, "other")) == 2
+
+    def test_keeps_all_records_of_a_changed_key(self):
+        store = FingerprintStore()
+        spec = Nodes(labels=["Person"], key="uid", records=[{"uid": "a", "x": 1}])
+        commit_fingerprints(spec, spec.records, store, "neo4j")
+        changed = Nodes(
+            labels=["Person"], key="uid", records=[{"uid": "a", "x": 1}, {"uid": "a", "x": 2}]
+        )
+        assert len(filter_unchanged(changed, store, "neo4j")) == 2
+
+    def test_commits_only_written_relationships(self):
+        store = FingerprintStore()
+        spec = Relationships(
+            type="KNOWS",
+            from_node=TargetNode(record_key="_from", node_key="uid", node_label="Person"),
+            to_node=TargetNode(record_key="_to", node_key="uid", node_label="Person"),
+            records=[{"_from": "a", "_to": "b"}, {"_from": "a", "_to": "c"}],
+        )
+        commit_fingerprints(
+            spec, spec.records, store, "neo4j", [{"from_key": "a", "to_key": "b"}]
+        )
+        assert filter_unchanged(spec, store, "neo4j") == [{"_from": "a", "_to": "c"}]
+
+
+class TestSkipUnchangedUpload:
+    def test_server_skips_unchanged_writes(self):
+        fake = FakeNeo4j(sleep=None)
+        with fake.patch():
+            first = batch_upload(CONFIG, people({"uid": "a", "name": "A"}, {"uid": "b"}))
+            second = batch_upload(CONFIG, people({"uid": "a", "name": "A"}, {"uid": "b", "name": "B"}))
+
+        # Two properties plus the hash for a, one plus the hash for b
+        assert first.properties_set == 5
+        # Only b changed
+        assert second.properties_set == 3
+
+    def test_store_skips_sending_unchanged_records(self):
+        fake = FakeNeo4j(sleep=None, record_queries=True)
+        store = FingerprintStore()
+        with fake.patch():
+            batch_upload(CONFIG, people({"uid": "a"}, {"uid": "b"}), fingerprint_store=store)
+            fake.executed.clear()
+            result = batch_upload(
+                CONFIG, people({"uid": "a"}, {"uid": "b", "name": "B"}), fingerprint_store=store
+            )
+
+        assert result.was_successful
+        assert result.records_unchanged == 1
+        assert len(fake.executed) == 1
+        assert "uid_b0n0" in fake.executed[0][1]
+        assert fake.executed[0][1]["uid_b0n0"] == "b"
+
+    def test_failed_batches_are_not_recorded(self):
+        fake = FakeNeo4j(sleep=None, transient_error_rate=1.0)
+        store = FingerprintStore()
+        with fake.patch():
+            result = batch_upload(CONFIG, people({"uid": "a"}), fingerprint_store=store)
+
+        assert not result.was_successful
+        assert store.get_many("neo4j", "Person", ['"a"']) == {}
+
+    def test_failed_embedding_batches_are_not_recorded(self):
+        data = people({"uid": "a", "emb": [1.0, 0.0]}, {"uid": "b"})
+        data["nodes"][0]["vector_properties"] = [
+            {"name": "emb", "dimensions": 2, "create_index": False}
+        ]
+        for prefetch in (False, True):
+            fake = FakeNeo4j(sleep=None)
+            run = fake.run
+
+            def failing_embeddings(query, parameters, database):
+                if "setNodeVectorProperty" in query:
+                    raise _server_error(TRANSIENT_ERROR_CODE, "Failed")
+                return run(query, parameters, database)
+
+            fake.run = failing_embeddings
+            store = FingerprintStore()
+            config = {**CONFIG, "prefetch_existing_keys": prefetch}
+            with fake.patch():
+                result = batch_upload(config, data, fingerprint_store=store)
+
+            assert not result.was_successful
+            # b has no embedding, a is retried until its embedding is set
+            spec = Nodes.model_validate(data["nodes"][0])
+            assert filter_unchanged(spec, store, "neo4j") == [data["nodes"][0]["records"][0]]
+
+            fake.run = run
+            with fake.patch():
+                assert batch_upload(config, data, fingerprint_store=store).was_successful
+            assert filter_unchanged(spec, store, "neo4j") == []
+
+    def test_relationships_missing_nodes_are_not_recorded(self):
+        records = [{"_from": "a", "_to": "b"}, {"_from": "a", "_to": "missing"}]
+        for prefetch in (False, True):
+            fake = FakeNeo4j(sleep=None)
+            store = FingerprintStore()
+            config = {**CONFIG, "prefetch_existing_keys": prefetch}
+            with fake.patch():
+                batch_upload(config, people({"uid": "a"}, {"uid": "b"}))
+                result = batch_upload(config, knows(*records), fingerprint_store=store)
+
+            assert result.was_successful
+            assert result.relationships_created == 1
+            spec = Relationships.model_validate(knows(*records)["relationships"][0])
+            assert filter_unchanged(spec, store, "neo4j") == [records[1]]
+
+
+class TestSQLiteFingerprintStore:
+    def test_persists_between_instances(self, tmp_path):
+        path = str(tmp_path / "fingerprints.db")
+        store = SQLiteFingerprintStore(path)
+        store.put_many("neo4j", "Person", [(str(i), "d") for i in range(1200)])
+        store.close()
+
+        store = SQLiteFingerprintStore(path)
+        found = store.get_many("neo4j", "Person", [str(i) for i in range(1300)])
+        assert len(found) == 1200
+        assert store.get_many("other", "Person", ["1"]) == {}
+
+        store.clear("neo4j")
+        assert store.get_many("neo4j", "Person", ["1"]) == {}
+        store.close()
+
+    def test_upload_with_store_path(self, tmp_path):
+        fake = FakeNeo4j(sleep=None, record_queries=True)
+        config = {**CONFIG, "fingerprint_store_path": str(tmp_path / "fp.db")}
+        with fake.patch():
+            batch_upload(config, people({"uid": "a"}, {"uid": "b"}))
+            fake.executed.clear()
+            result = batch_upload(config, people({"uid": "a"}, {"uid": "b"}))
+
+        assert result.was_successful
+        assert result.records_unchanged == 2
+        assert fake.executed == []
@@ -36,3 +36,64 @@ class TestBatchUploadGenerator:
         with pytest.raises(InvalidCredentialsError):
             generator = batch_upload_generator(invalid_config_dict, data_dict)
             next(generator)
+
+
+class TestMemoryProfile:
+
+    config = {"neo4j_uri": "bolt://fake", "neo4j_password": "pw"}
+    data = {
+        "nodes": [
+            {"labels": ["Person"], "key": "uid", "records": [{"uid": "a"}, {"uid": "b"}]}
+        ]
+    }
+
+    def test_profile_memory_reports_phases(self):
+        import tracemalloc
+        from neo4j_uploader.fake_driver import FakeNeo4j
+
+        fake = FakeNeo4j(sleep=None)
+        with fake.patch():
+            result = batch_upload({**self.config, "overwrite": True, "profile_memory": True}, self.data)
+
+        assert [p.phase for p in result.memory_profile] == [
+            "validation",
+            "query_generation",
+            "reset",
+            "upload",
+        ]
+        assert result.peak_memory_bytes() > 0
+        assert not tracemalloc.is_tracing()
+
+    def test_profile_memory_disabled_by_default(self):
+        from neo4j_uploader.fake_driver import FakeNeo4j
+
+        with FakeNeo4j(sleep=None).patch():
+            result = batch_upload(self.config, self.data)
+
+        assert result.memory_profile == []
+        assert result.peak_memory_bytes() == 0
+
+
+class TestCreateOnlyUpload:
+
+    def test_overwrite_creates_unique_nodes(self):
+        from neo4j_uploader.fake_driver import FakeNeo4j
+
+        fake = FakeNeo4j(sleep=None, record_queries=True)
+        config = {"neo4j_uri": "bolt://fake", "neo4j_password": "pw", "overwrite": True}
+        data = {
+            "nodes": [
+                {
+                    "labels": ["Person"],
+                    "key": "uid",
+                    "records": [{"uid": "a"}, {"uid": "b"}, {"uid": "a", "name": "A"}],
+                }
+            ]
+        }
+        with fake.patch():
+            result = batch_upload(config, data)
+
+        assert result.nodes_created == 2
+        assert result.specs[0].records_total == 2
+        upload = [q for q, _, _ in fake.executed if "node_data" in q]
+        assert "CREATE (n:`Person`" in upload[0]
@@ -36,6 +36,23 @@ class TestNeo4jConfig:
             "neo4j_database": "neo4j",
             "max_batch_size": 500,
             "overwrite": False,
+            "assume_empty": False,
+            "prefetch_existing_keys": False,
+            "skip_unchanged": False,
+            "fingerprint_property": "_upload_fingerprint",
+            "fingerprint_store_path": None,
+            "reset_strategy": "batched_delete",
+            "recreate_timeout_seconds": 300,
+            "reset_batch_size": 10_000,
+            "profile_memory": False,
+            "null_policy": {
+                "sentinels": ["none", "null", "empty", ""],
+                "case_sensitive": False,
+                "enabled": True,
+                "column_sentinels": {},
+            },
+            "vector_batch_size": 100,
+            "validation": "full",
         }
 
 
@@ -62,6 +79,11 @@ class TestGraphData:
             "key": "uid",
             "exclude_keys": [],
             "records": [{"uid": "test"}],
+            "null_policy": None,
+            "map_mode": "str",
+            "vector_properties": [],
+            "property_types": {},
+            "infer_types": False,
         }
 
     def test_valid_multiple_nodes(self):
@@ -143,6 +165,10 @@ class TestGraphData:
                 "record_key": "_to",
             },
             "records": [{"_from": "test1", "_to": "test2", "test_key": "test_value"}],
+            "null_policy": None,
+            "map_mode": "str",
+            "property_types": {},
+            "infer_types": False,
         }
 
 
@@ -162,3 +188,102 @@ class TestUploadResult:
 
         # Assert the projected time is -1
         assert projected_time == -1
+
+    def test_projected_seconds_divides_by_rate(self):
+        from neo4j_uploader.models import UploadResult
+        from datetime import datetime, timedelta
+
+        upload_result = UploadResult(
+            records_completed=10,
+            records_total=30,
+            started_at=datetime.now() - timedelta(seconds=10),
+        )
+
+        # 1 batch per second with 20 remaining
+        assert 19 <= upload_result.projected_seconds_to_complete() <= 20
+
+
+class TestUploadProgress:
+
+    def result(self):
+        from neo4j_uploader.models import UploadResult, SpecProgress
+        from datetime import datetime
+
+        start = datetime(2024, 1, 1)
+        return start, UploadResult(
+            started_at=start,
+            records_total=4,
+            window_seconds=10,
+            specs=[
+                SpecProgress(name="Person", element_type="nodes", batches_total=2, records_total=200),
+                SpecProgress(name="KNOWS", element_type="relationships", batches_total=2, records_total=200),
+            ],
+        )
+
+    def test_record_batch_updates_spec(self):
+        from datetime import timedelta
+
+        start, result = self.result()
+        result.record_batch(0, 100, 1.0, finished_at=start + timedelta(seconds=1))
+        result.record_batch(1, 100, 2.0, succeeded=False, finished_at=start + timedelta(seconds=3))
+
+        assert result.specs[0].records_completed == 100
+        assert result.specs[0].batches_completed == 1
+        assert result.specs[1].records_failed == 100
+        assert result.specs[1].records_remaining() == 100
+
+    def test_current_rate_uses_sliding_window(self):
+        from datetime import timedelta
+
+        start, result = self.result()
+        # Fast early batch falls out of the window
+        result.record_batch(0, 100, 1.0, finished_at=start + timedelta(seconds=1))
+        result.record_batch(0, 100, 10.0, finished_at=start + timedelta(seconds=20))
+        result.record_batch(1, 100, 10.0, finished_at=start + timedelta(seconds=30))
+
+        assert result.current_records_per_second() == 10.0
+        assert result.peak_records_per_second == 100.0
+
+    def test_projection_per_element_type(self):
+        from datetime import timedelta
+
+        start, result = self.result()
+        result.records_completed = 3
+        # Nodes at 100 rec/s, relationships at 10 rec/s
+        result.record_batch(0, 100, 1.0, finished_at=start + timedelta(seconds=1))
+        result.record_batch(0, 100, 1.0, finished_at=start + timedelta(seconds=2))
+        result.record_batch(1, 100, 10.0, finished_at=start + timedelta(seconds=12))
+
+        # 100 relationship records remaining at 10 rec/s
+        assert result.projected_seconds_to_complete() == 10
+
+    def test_projection_before_relationships_start(self):
+        from datetime import timedelta
+
+        start, result = self.result()
+        result.records_completed = 1
+        result.record_batch(0, 100, 1.0, finished_at=start + timedelta(seconds=1))
+
+        # Remaining 100 nodes and 200 relationships estimated from the observed rate
+        assert result.projected_seconds_to_complete() == 3
+
+    def test_projection_per_spec(self):
+        from datetime import timedelta
+
+        start, result = self.result()
+        result.records_completed = 1
+        result.record_batch(0, 100, 1.0, finished_at=start + timedelta(seconds=1))
+
+        # Own rate of the nodes spec, unknown for relationships until they start
+        assert result.specs[0].projected_seconds_to_complete() == 1
+        assert result.specs[1].projected_seconds_to_complete() == -1
+        assert result.specs[1].projected_seconds_to_complete(records_per_second=50) == 4
+
+        # Relationships follow the remaining nodes
+        assert result.spec_projected_seconds_to_complete(0) == 1
+        assert result.spec_projected_seconds_to_complete(1) == 3
+        assert result.spec_projected_completion_time(1) > result.spec_projected_completion_time(0)
+
+        result.record_batch(0, 100, 1.0, finished_at=start + timedelta(seconds=2))
+        assert result.specs[0].projected_seconds_to_complete() == 0
+        assert result.spec_projected_seconds_to_complete(0) == 0
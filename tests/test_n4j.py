@@ -0,0 +1,97 @@
+from neo4j_uploader._n4j import reset, reset_generator, drop_schema
+from neo4j_uploader.fake_driver import FakeNeo4j
+
+CREDS = ("bolt://fake", "neo4j", "pw")
+
+
+def populated() -> FakeNeo4j:
+    fake = FakeNeo4j(sleep=None, record_queries=True)
+    fake.nodes["neo4j"] = {"Person": {f"p{i}" for i in range(25)}}
+    fake.relationships["neo4j"] = {("KNOWS", f"p{i}", f"p{i + 1}") for i in range(24)}
+    fake.constraints["neo4j"] = {"person_uid"}
+    fake.indexes["neo4j"] = {"person_name"}
+    return fake
+
+
+class TestReset:
+    def test_reset_generator_progress(self):
+        fake = populated()
+        with fake.patch():
+            progress = [
+                p.model_copy()
+                for p in reset_generator(CREDS, "neo4j", batch_size=5, round_size=10)
+            ]
+
+        assert progress[0].phase == "schema"
+        assert progress[0].schema_dropped == 2
+        assert [p.phase for p in progress].count("relationships") == 4
+        assert progress[-1].phase == "complete"
+        assert progress[-1].relationships_deleted == 24
+        assert progress[-1].nodes_deleted == 25
+        assert fake.node_count() == 0
+        assert fake.constraints["neo4j"] == set()
+        assert fake.indexes["neo4j"] == set()
+
+    def test_reset_deletes_relationships_before_nodes(self):
+        fake = populated()
+        with fake.patch():
+            reset(CREDS, "neo4j")
+        queries = [q for q, _, _ in fake.executed if "DELETE" in q]
+        assert "IN TRANSACTIONS" in queries[0]
+        assert queries[0].startswith("MATCH ()-[r]->()")
+        assert "DETACH DELETE" in queries[-1]
+
+    def test_drop_schema_single_transaction(self):
+        fake = populated()
+        with fake.patch():
+            assert drop_schema(CREDS, "neo4j") == 2
+            assert drop_schema(CREDS, "neo4j") == 0
+
+    def test_overwrite_yields_reset_progress(self):
+        from neo4j_uploader import batch_upload_generator
+
+        fake = populated()
+        config = {"neo4j_uri": "bolt://fake", "neo4j_password": "pw", "overwrite": True}
+        data = {"nodes": [{"labels": ["Person"], "key": "uid", "records": [{"uid": "a"}]}]}
+        with fake.patch():
+            results = [r.model_copy() for r in batch_upload_generator(config, data)]
+
+        assert any(r.nodes_deleted == 25 and r.records_completed == 0 for r in results)
+        assert results[-1].nodes_created == 1
+        assert fake.node_count() == 1
+
+
+class TestResetStrategies:
+    def test_delete_strategy(self):
+        fake = populated()
+        with fake.patch():
+            progress = list(reset_generator(CREDS, "neo4j", batch_size=10, strategy="delete"))
+        assert progress[-1].nodes_deleted == 25
+        assert progress[-1].strategy == "delete"
+        assert not any("IN TRANSACTIONS" in q for q, _, _ in fake.executed)
+        assert fake.node_count() == 0
+
+    def test_recreate_strategy(self):
+        fake = populated()
+        fake.supports_recreate = True
+        with fake.patch():
+            progress = [p.model_copy() for p in reset_generator(CREDS, "neo4j", strategy="recreate")]
+        assert [p.phase for p in progress] == ["recreate", "complete"]
+        assert progress[-1].strategy == "recreate"
+        assert fake.node_count() == 0
+        assert fake.executed[0][2] == "system"
+        assert not any("DELETE" in q for q, _, _ in fake.executed)
+
+    def test_recreate_falls_back_when_not_permitted(self):
+        fake = populated()
+        with fake.patch():
+            progress = list(reset_generator(CREDS, "neo4j", strategy="recreate"))
+        assert progress[-1].strategy == "batched_delete"
+        assert progress[-1].nodes_deleted == 25
+        assert fake.node_count() == 0
+
+    def test_unknown_strategy(self):
+        import pytest
+
+        with pytest.raises(ValueError):
+            list(reset_generator(CREDS, "neo4j", strategy="truncate"))
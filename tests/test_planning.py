@@ -0,0 +1,90 @@
+import json
+import pytest
+from neo4j_uploader import plan_upload, plan_upload_file
+from neo4j_uploader.errors import InvalidPayloadError
+from neo4j_uploader.models import ThroughputModel
+from neo4j_uploader._planning import query_template
+
+CONFIG = {"neo4j_uri": "bolt://unreachable", "neo4j_password": "pw", "max_batch_size": 2}
+
+DATA = {
+    "nodes": [
+        {
+            "labels": ["Person"],
+            "key": "uid",
+            "records": [{"uid": "a"}, {"uid": "a"}, {"uid": "b"}, {"uid": "c"}],
+        }
+    ],
+    "relationships": [
+        {
+            "type": "KNOWS",
+            "from_node": {"record_key": "_from", "node_key": "uid"},
+            "to_node": {"record_key": "_to", "node_key": "uid"},
+            "records": [{"_from": "a", "_to": "b"}],
+        }
+    ],
+}
+
+
+class TestPlanUpload:
+    def test_counts_batches_and_records(self):
+        plan = plan_upload(CONFIG, DATA)
+        nodes, rels = plan.specs
+
+        assert (nodes.name, nodes.batches, nodes.records) == ("Person", 2, 4)
+        # The exact duplicate within the first batch is removed
+        assert nodes.records_after_dedupe == 3
+        assert (rels.element_type, rels.batches, rels.records_after_dedupe) == ("relationships", 1, 1)
+        assert plan.batches_total() == 3
+        assert plan.records_total() == 4
+        assert plan.parameter_bytes_total() > 0
+        assert plan.will_reset is False
+
+    def test_distinct_templates(self):
+        plan = plan_upload(CONFIG, DATA)
+
+        assert len(plan.query_templates) == 2
+        assert plan.query_templates[0].startswith("WITH $rows AS node_data\nUNWIND")
+
+    def test_throughput_model(self):
+        slow = plan_upload(CONFIG, DATA, {"seconds_per_batch": 1.0})
+        fast = plan_upload(CONFIG, DATA, ThroughputModel(seconds_per_batch=0.0))
+
+        assert slow.estimated_seconds() == pytest.approx(
+            3.0 + fast.estimated_seconds()
+        )
+
+    def test_counts_rows_reported_by_queries(self):
+        data = {
+            "nodes": [
+                {
+                    "labels": ["Doc"],
+                    "key": "a[$b",
+                    "vector_properties": [{"name": "emb", "dimensions": 1}],
+                    "records": [{"a[$b": 1, "emb": [0.5]}, {"a[$b": 2, "emb": [1.0]}],
+                }
+            ]
+        }
+        [docs] = plan_upload(CONFIG, data).specs
+
+        # One property batch, the index and one embedding batch
+        assert docs.batches == 3
+        assert docs.records_after_dedupe == 2 + 2
+
+    def test_file(self, tmp_path):
+        path = tmp_path / "graph.json"
+        path.write_text(json.dumps(DATA))
+
+        planned = plan_upload_file(CONFIG, str(path))
+        expected = plan_upload(CONFIG, DATA)
+        assert planned.specs == expected.specs
+        assert planned.query_templates == expected.query_templates
+
+    def test_invalid_payload(self):
+        with pytest.raises(InvalidPayloadError):
+            plan_upload(CONFIG, {"nodes": [{"records": []}]})
+
+
+def test_query_template():
+    query = "WITH [[$uid_b0n0,  {`uid`:$uid_b0n0}]] AS node_data\nUNWIND node_data AS node"
+    assert query_template(query) == "WITH $rows AS node_data\nUNWIND node_data AS node"
@@ -0,0 +1,152 @@
+from neo4j_uploader import batch_upload
+from neo4j_uploader.fake_driver import FakeNeo4j
+from neo4j_uploader._prefetch import (
+    KeyExistenceCache,
+    prefetched_nodes_queries,
+    prefetched_relationships_queries,
+)
+from neo4j_uploader._queries import nodes_query
+from neo4j_uploader.models import Nodes, Relationships, TargetNode
+
+CREDS = ("bolt://fake", "neo4j", "pw")
+
+
+def seed_people(fake, uids):
+    query, params = nodes_query("seed", [{"uid": u} for u in uids], "uid", ["Person"])
+    with fake.driver() as driver:
+        driver.execute_query(query, params, database_="neo4j")
+
+
+class TestPrefetchedNodes:
+    def test_splits_create_and_match(self):
+        fake = FakeNeo4j(sleep=None)
+        seed_people(fake, ["a"])
+        spec = Nodes(
+            labels=["Person"],
+            key="uid",
+            records=[{"uid": "a", "name": "A"}, {"uid": "b", "name": "B"}],
+        )
+        with fake.patch():
+            queries = prefetched_nodes_queries(
+                CREDS, "neo4j", "b0n", spec.records, spec, KeyExistenceCache()
+            )
+
+        assert len(queries) == 2
+        assert "CREATE (n:`Person`" in queries[0][0]
+        assert "MATCH (n:`Person`" in queries[1][0]
+        assert "MERGE" not in queries[0][0] + queries[1][0]
+
+    def test_cache_avoids_repeat_lookups(self):
+        fake = FakeNeo4j(sleep=None, record_queries=True)
+        cache = KeyExistenceCache()
+        spec = Nodes(labels=["Person"], key="uid", records=[{"uid": "a"}])
+        with fake.patch():
+            prefetched_nodes_queries(CREDS, "neo4j", "b0n", spec.records, spec, cache)
+            cache.commit_staged()
+            prefetched_nodes_queries(CREDS, "neo4j", "b1n", spec.records, spec, cache)
+
+        lookups = [q for q, _, _ in fake.executed if "UNWIND $keys" in q]
+        assert len(lookups) == 1
+        # Keys created by a committed batch are treated as existing afterwards
+        assert cache.exists("Person", "uid", "a") is True
+
+    def test_keys_marked_on_commit(self):
+        fake = FakeNeo4j(sleep=None)
+        cache = KeyExistenceCache()
+        spec = Nodes(labels=["Person"], key="uid", records=[{"uid": "a"}])
+        with fake.patch():
+            prefetched_nodes_queries(CREDS, "neo4j", "b0n", spec.records, spec, cache)
+            # Not committed, so looked up again
+            assert cache.exists("Person", "uid", "a") is None
+            queries = prefetched_nodes_queries(
+                CREDS, "neo4j", "b1n", spec.records, spec, cache
+            )
+        assert "CREATE (n:`Person`" in queries[0][0]
+
+        cache.commit_staged()
+        assert cache.exists("Person", "uid", "a") is True
+
+    def test_lookup_escapes_names(self):
+        fake = FakeNeo4j(sleep=None, record_queries=True)
+        spec = Nodes(labels=["Per`son"], key="u`id", records=[{"u`id": "a"}])
+        with fake.patch():
+            prefetched_nodes_queries(
+                CREDS, "neo4j", "b0n", spec.records, spec, KeyExistenceCache()
+            )
+
+        lookup = fake.executed[0][0]
+        assert "MATCH (n:`Per``son` {`u``id`:k})" in lookup
+        assert "RETURN n.`u``id` AS key" in lookup
+
+
+class TestPrefetchedRelationships:
+    def test_drops_missing_endpoints(self):
+        fake = FakeNeo4j(sleep=None)
+        seed_people(fake, ["a", "b"])
+        spec = Relationships(
+            type="KNOWS",
+            from_node=TargetNode(record_key="_from", node_key="uid", node_label="Person"),
+            to_node=TargetNode(record_key="_to", node_key="uid", node_label="Person"),
+            records=[{"_from": "a", "_to": "b"}, {"_from": "a", "_to": "missing"}],
+        )
+        with fake.patch():
+            queries = prefetched_relationships_queries(
+                CREDS, "neo4j", "b0r", spec.records, spec, KeyExistenceCache()
+            )
+
+        assert len(queries) == 1
+        assert "missing" not in str(queries[0][1])
+
+    def test_auto_exclude_keys(self):
+        fake = FakeNeo4j(sleep=None)
+        seed_people(fake, ["a", "b"])
+        spec = Relationships(
+            type="KNOWS",
+            from_node=TargetNode(record_key="_from", node_key="uid", node_label="Person"),
+            to_node=TargetNode(record_key="_to", node_key="uid", node_label="Person"),
+            records=[{"_from": "a", "_to": "b", "since": 2020}],
+        )
+        with fake.patch():
+            queries = prefetched_relationships_queries(
+                CREDS, "neo4j", "b0r", spec.records, spec, KeyExistenceCache()
+            )
+
+        assert "`since`" in queries[0][0]
+        assert "`_from`" not in queries[0][0]
+
+
+class TestPrefetchUpload:
+    def test_upload_with_prefetch(self):
+        fake = FakeNeo4j(sleep=None)
+        seed_people(fake, ["a"])
+        config = {
+            "neo4j_uri": "bolt://fake",
+            "neo4j_password": "pw",
+            "prefetch_existing_keys": True,
+            "max_batch_size": 1,
+        }
+        data = {
+            "nodes": [
+                {
+                    "labels": ["Person"],
+                    "key": "uid",
+                    "records": [{"uid": "a", "name": "A"}, {"uid": "b"}],
+                }
+            ],
+            "relationships": [
+                {
+                    "type": "KNOWS",
+                    "from_node": {"record_key": "_from", "node_key": "uid", "node_label": "Person"},
+                    "to_node": {"record_key": "_to", "node_key": "uid", "node_label": "Person"},
+                    "records": [{"_from": "a", "_to": "b"}, {"_from": "b", "_to": "c"}],
+                }
+            ],
+        }
+        with fake.patch():
+            result = batch_upload(config, data)
+
+        assert result.was_successful
+        assert result.nodes_created == 1
+        assert result.relationships_created == 1
+        assert fake.node_count() == 2
+        assert result.specs[0].batches_total == 2
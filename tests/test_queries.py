@@ -94,6 +94,14 @@ class TestNodesQuery():
         assert len(params) == 2
         assert query == "WITH [[$name_test0,  {`name`:$name_test0}], [$name_test1,  {`name`:$name_test1}]] AS node_data\nUNWIND node_data AS node\nCREATE (n:`Person` { `name`:node[0]} )\nSET n += node[1]"
 
+    def test_nodes_query_match_operation(self):
+        records = [{"name": "John"}]
+        labels = ["Person"]
+        query, params = nodes_query("test", records=records, labels=labels, key="name", operation="MATCH")
+
+        assert "MATCH (n:`Person` { `name`:node[0]} )" in query
+        assert "MERGE" not in query
+
     def test_nodes_query_exclude_keys(self):
         records = [{"name": "John", "id": 1}]
         labels = ["Person"]
@@ -330,6 +338,22 @@ class TestSpecificationQueries():
         assert result[0][0].startswith('WITH')
         assert result[1][0].startswith('WITH')
 
+    def test_iter_specification_queries_is_lazy(self):
+        from neo4j_uploader._queries import iter_specification_queries
+        nodes1 = Nodes(records=[{'name': 'Node 1'}], labels=['Label'], key="name")
+        nodes2 = Nodes(records=[{'name': 'Node 2'}], labels=['Label'], key="name")
+        config = Neo4jConfig(
+            neo4j_uri = "",
+            neo4j_password = "",
+            max_batch_size=1
+        )
+        result = iter_specification_queries([nodes1, nodes2], config)
+        spec_index, records, query, params, rows = next(result)
+        assert spec_index == 0
+        assert records == [{'name': 'Node 1'}]
+        assert rows == 1
+        assert next(result)[0] == 1
+
     def test_specification_queries_applies_config(self):
         nodes = Nodes(
             records=[{'name': 'Node 1'}, {'name': 'Node 2'}], 
@@ -342,4 +366,232 @@ class TestSpecificationQueries():
             max_batch_size=1
         )
         result = specification_queries([nodes], config)
-        assert len(result) == 2
\ No newline at end of file
+        assert len(result) == 2
+
+class TestCreateOnly():
+    config = Neo4jConfig(neo4j_uri="", neo4j_password="", max_batch_size=2)
+
+    def test_merged_by_key(self):
+        from neo4j_uploader._queries import merged_by_key
+        records = [
+            {"uid": "a", "name": "A", "age": 1},
+            {"uid": "b"},
+            {"uid": "a", "name": "null", "age": 2},
+        ]
+        result = merged_by_key(records, "uid")
+        assert result == [{"uid": "a", "name": "A", "age": 2}, {"uid": "b"}]
+        # Input records are not modified
+        assert records[0]["age"] == 1
+
+    def test_create_only_uses_create(self):
+        from neo4j_uploader._queries import iter_chunked_query
+        nodes = Nodes(
+            records=[{"uid": "a"}, {"uid": "b"}, {"uid": "a", "x": 1}],
+            labels=["Person"],
+            key="uid",
+        )
+        result = list(iter_chunked_query(nodes, self.config, create_only=True))
+        assert len(result) == 1
+        assert len(result[0][0]) == 2
+        assert "CREATE (n:`Person`" in result[0][1]
+        assert "MERGE" not in result[0][1]
+
+    def test_create_only_merges_keys_repeated_across_specs(self):
+        from neo4j_uploader._queries import iter_chunked_query
+        first = Nodes(records=[{"uid": "a"}], labels=["Person"], key="uid")
+        second = Nodes(records=[{"uid": "a"}, {"uid": "b"}], labels=["Person", "User"], key="uid")
+        created = {}
+        list(iter_chunked_query(first, self.config, True, created))
+        result = list(iter_chunked_query(second, self.config, True, created))
+        assert [len(r[0]) for r in result] == [1, 1]
+        assert result[0][1].count("CREATE") == 1
+        assert "MERGE" in result[1][1]
+
+    def test_create_only_merges_keys_created_without_dedupe(self):
+        from neo4j_uploader._queries import iter_chunked_query
+        first = Nodes(records=[{"uid": "a"}], labels=["Person"], key="uid", dedupe=False)
+        second = Nodes(records=[{"uid": "a"}, {"uid": "b"}], labels=["Person"], key="uid")
+        created = {}
+        list(iter_chunked_query(first, self.config, True, created))
+        result = list(iter_chunked_query(second, self.config, True, created))
+        assert [r[0] for r in result] == [[{"uid": "b"}], [{"uid": "a"}]]
+        assert "MERGE" in result[1][1]
+
+    def test_create_only_ignores_relationships(self):
+        from neo4j_uploader._queries import iter_chunked_query
+        rels = Relationships(
+            type="KNOWS",
+            from_node=TargetNode(record_key="_from", node_key="uid"),
+            to_node=TargetNode(record_key="_to", node_key="uid"),
+            records=[{"_from": "a", "_to": "b"}],
+        )
+        result = list(iter_chunked_query(rels, self.config, create_only=True))
+        assert "MERGE (fromNode)" in result[0][1]
+
+class TestNullPolicy():
+    def test_default_sentinels(self):
+        from neo4j_uploader.models import NullPolicy
+        policy = NullPolicy()
+        assert policy.is_null(None)
+        assert policy.is_null("NULL")
+        assert policy.is_null("")
+        assert not policy.is_null("nullable")
+        assert not policy.is_null(0)
+
+    def test_custom_sentinels_and_case(self):
+        from neo4j_uploader.models import NullPolicy
+        policy = NullPolicy(sentinels=["N/A", "-"], case_sensitive=True)
+        assert policy.is_null("N/A")
+        assert not policy.is_null("n/a")
+        assert not policy.is_null("null")
+
+    def test_disabled(self):
+        from neo4j_uploader.models import NullPolicy
+        policy = NullPolicy(enabled=False)
+        assert policy.is_null(None)
+        assert not policy.is_null("")
+
+    def test_column_sentinels(self):
+        from neo4j_uploader._queries import properties
+        from neo4j_uploader.models import NullPolicy
+        policy = NullPolicy(column_sentinels={"code": [], "grade": ["-"]})
+        record = {"code": "NULL", "grade": "-", "name": "none"}
+        query, params = properties("0", record, null_policy=policy)
+        assert params == {"code_0": "NULL"}
+
+    def test_spec_policy_overrides_config(self):
+        from neo4j_uploader._queries import iter_chunked_query
+        from neo4j_uploader.models import NullPolicy
+        config = Neo4jConfig(neo4j_uri="", neo4j_password="", null_policy=NullPolicy(sentinels=["N/A"]))
+        nodes = Nodes(records=[{"uid": "a", "x": "N/A", "y": "null"}], labels=["Person"], key="uid")
+        _, _, params, _ = next(iter_chunked_query(nodes, config))
+        assert params == {"uid_b0n0": "a", "y_b0n0": "null"}
+
+        nodes.null_policy = NullPolicy(enabled=False)
+        _, _, params, _ = next(iter_chunked_query(nodes, config))
+        assert params == {"uid_b0n0": "a", "x_b0n0": "N/A", "y_b0n0": "null"}
+
+class TestPropertyValues():
+    def test_native_lists(self):
+        from neo4j_uploader._queries import properties
+        record = {"tags": ["a", "b"], "scores": [1, 2], "empty": []}
+        _, params = properties("0", record)
+        assert params == {"empty_0": [], "scores_0": [1, 2], "tags_0": ["a", "b"]}
+
+    def test_mixed_lists_serialized(self):
+        from neo4j_uploader._queries import PropertyValues
+        values = PropertyValues()
+        assert values.list_value("x", [1, 2]) == [1, 2]
+        # Cached element type no longer matches
+        assert values.list_value("x", [1, "a"]) == "[1, 'a']"
+        assert values.list_value("y", [True, 1]) == "[True, 1]"
+        assert PropertyValues("json").list_value("z", [{"a": 1}]) == '[{"a":1}]'
+
+    def test_map_modes(self):
+        from neo4j_uploader._queries import properties, PropertyValues
+        record = {"address": {"city": "Oslo", "geo": {"zip": "0150"}, "lines": ["a"]}}
+        query, params = properties("0", record)
+        assert params == {"address_0": str(record["address"])}
+
+        _, params = properties("0", record, values=PropertyValues("json"))
+        assert params == {"address_0": '{"city":"Oslo","geo":{"zip":"0150"},"lines":["a"]}'}
+
+        query, params = properties("0", record, values=PropertyValues("flatten"))
+        assert query == " {`address.city`:$address_city_0, `address.geo.zip`:$address_geo_zip_0, `address.lines`:$address_lines_0}"
+        assert params == {"address_city_0": "Oslo", "address_geo_zip_0": "0150", "address_lines_0": ["a"]}
+
+    def test_flattened_param_collision(self):
+        from neo4j_uploader._queries import properties, PropertyValues
+        record = {"a": {"b": 1}, "a_b": 2}
+        query, params = properties("0", record, values=PropertyValues("flatten"))
+        assert query == " {`a.b`:$a_b_0, `a_b`:$_a_b_0}"
+        assert params == {"a_b_0": 1, "_a_b_0": 2}
+
+    def test_key_param_collision(self):
+        record = {"u": {"id": 1}, "u_id": "x"}
+        query, params = node_elements("b0n", [record], "u_id", map_mode="flatten")
+        assert query == "[$u_id_b0n0,  {`u.id`:$_u_id_b0n0, `u_id`:$u_id_b0n0}]"
+        assert params == {"u_id_b0n0": "x", "_u_id_b0n0": 1}
+
+        record = {"a_b": "x", "_to": "y", "a": {"b": 2}}
+        from_node = TargetNode(record_key="a_b", node_key="uid")
+        to_node = TargetNode(record_key="_to", node_key="uid")
+        query, params = relationship_elements(
+            "b0r", [record], from_node, to_node, exclude_keys=["a_b", "_to"], map_mode="flatten"
+        )
+        assert query == "[$a_b_b0r0, $_to_b0r0, {`a.b`:$_a_b_b0r0}]"
+        assert params == {"a_b_b0r0": "x", "_to_b0r0": "y", "_a_b_b0r0": 2}
+
+    def test_leading_null_has_no_separator(self):
+        from neo4j_uploader._queries import properties
+        query, _ = properties("0", {"a": None, "b": 1})
+        assert query == " {`b`:$b_0}"
+
+    def test_spec_map_mode(self):
+        from neo4j_uploader._queries import iter_chunked_query
+        config = Neo4jConfig(neo4j_uri="", neo4j_password="")
+        nodes = Nodes(records=[{"uid": "a", "meta": {"k": 1}}], labels=["Person"], key="uid", map_mode="flatten")
+        _, query, params, _ = next(iter_chunked_query(nodes, config))
+        assert "`meta.k`:$meta_k_b0n0" in query
+        assert params["meta_k_b0n0"] == 1
+
+
+class TestRecordSchema():
+    def test_columns(self):
+        from neo4j_uploader._queries import RecordSchema
+        schema = RecordSchema({"uid": 1, "name": "a", "_from": "x"}, ["_from"])
+        assert schema.columns == ("name", "uid")
+        assert schema.record_columns({"name": "b", "_from": "y", "uid": 2}) is schema.columns
+
+    def test_deviating_records(self):
+        from neo4j_uploader._queries import RecordSchema, properties
+        schema = RecordSchema(["uid", "name"], ["_from"])
+        record = {"uid": 1, "age": 3, "_from": "x"}
+        assert schema.record_columns(record) == ["age", "uid"]
+        assert properties("0", record, ["_from"], schema=schema) == properties("0", record, ["_from"])
+
+    def test_mixed_shapes(self):
+        records = [{"uid": "a", "name": "Ann"}, {"uid": "b", "age": 3}, {"uid": "c", "name": "Cy"}]
+        query, params = node_elements("b0n", records, "uid", dedupe=False)
+        assert query == "[$uid_b0n0,  {`name`:$name_b0n0, `uid`:$uid_b0n0}], [$uid_b0n1,  {`age`:$age_b0n1, `uid`:$uid_b0n1}], [$uid_b0n2,  {`name`:$name_b0n2, `uid`:$uid_b0n2}]"
+        assert params["age_b0n1"] == 3
+
+
+class TestCompiledSpecs():
+    def test_nodes(self):
+        from neo4j_uploader._queries import CompiledNodes
+        compiled = CompiledNodes("uid", ["Per`son", "User"], ["note"], operation="CREATE")
+        assert compiled.exclude_keys == frozenset(["note"])
+        assert compiled.dedupe is False
+        assert compiled.clauses == "\nUNWIND node_data AS node\nCREATE (n:`Per``son` { `uid`:node[0]} )\nSET n += node[1]\nSET n:`User`"
+        with pytest.raises(AttributeError):
+            compiled.labels = ["Other"]
+
+    def test_same_query(self):
+        from neo4j_uploader._queries import CompiledRelationships
+        from_node = TargetNode(node_label="Person", node_key="uid", record_key="_from")
+        to_node = TargetNode(node_key="uid", record_key="_to")
+        records = [{"_from": "a", "_to": "b", "since": 2020, "note": "x"}]
+        compiled = CompiledRelationships(from_node, to_node, "KNOWS", ["_from", "_to", "note"], fingerprint_property="_fp")
+        assert relationships_query("b0r", records, from_node, to_node, "KNOWS", compiled=compiled) == relationships_query(
+            "b0r", records, from_node, to_node, "KNOWS", ["_from", "_to", "note"], fingerprint_property="_fp"
+        )
+
+
+class TestSharedParams():
+    def test_properties_write_to_params(self):
+        from neo4j_uploader._queries import properties
+        params = {"a_0": 1}
+        query, result = properties("1", {"a": 2, "b": None}, params=params)
+        assert result is params
+        assert query == " {`a`:$a_1}"
+        assert params == {"a_0": 1, "a_1": 2}
+
+    def test_elements_params(self):
+        records = [{"uid": i, "name": f"n{i}"} for i in range(3)]
+        _, params = node_elements("b0n", records, "uid", dedupe=False)
+        assert params == {
+            "name_b0n0": "n0", "uid_b0n0": 0,
+            "name_b0n1": "n1", "uid_b0n1": 1,
+            "name_b0n2": "n2", "uid_b0n2": 2,
+        }
@@ -0,0 +1,99 @@
+import pytest
+from neo4j_uploader import batch_upload_sources
+from neo4j_uploader.fake_driver import FakeNeo4j
+from neo4j_uploader.models import NodesSource, RelationshipsSource, SourceData
+from neo4j_uploader._sources import iter_source_records, iter_source_spec_chunks
+
+CONFIG = {"neo4j_uri": "bolt://fake", "neo4j_password": "pw", "max_batch_size": 2}
+
+
+@pytest.fixture
+def people_csv(tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_text("person_id,name,age,active\n1,Ann,30,true\n2,Bob,,false\n3,Cy,41,yes\n")
+    return str(path)
+
+
+@pytest.fixture
+def knows_csv(tmp_path):
+    path = tmp_path / "knows.csv"
+    path.write_text("src;dst;since\n1;2;2020\n2;3;2021\n")
+    return str(path)
+
+
+class TestCSVSource:
+    def test_mapping_and_types(self, people_csv):
+        source = NodesSource(
+            path=people_csv,
+            labels=["Person"],
+            key="uid",
+            rename={"person_id": "uid"},
+            column_types={"person_id": "int", "age": "int", "active": "bool"},
+            columns=["person_id", "name", "age", "active"],
+        )
+        chunks = list(iter_source_records(source, 2))
+
+        assert [len(c) for c in chunks] == [2, 1]
+        assert chunks[0][0] == {"uid": 1, "name": "Ann", "age": 30, "active": True}
+        # Empty fields are left for null filtering
+        assert chunks[0][1]["age"] == ""
+        assert chunks[1][0]["active"] is True
+
+    def test_column_selection(self, people_csv):
+        source = NodesSource(path=people_csv, labels=["Person"], key="person_id", columns=["person_id"])
+        assert next(iter_source_records(source, 10))[0] == {"person_id": "1"}
+
+    def test_spec_chunks(self, people_csv, knows_csv):
+        sources = SourceData(
+            nodes=[NodesSource(path=people_csv, labels=["Person"], key="person_id")],
+            relationships=[
+                RelationshipsSource(
+                    path=knows_csv,
+                    delimiter=";",
+                    type="KNOWS",
+                    from_node={"record_key": "src", "node_key": "person_id", "node_label": "Person"},
+                    to_node={"record_key": "dst", "node_key": "person_id", "node_label": "Person"},
+                )
+            ],
+        )
+        chunks = list(iter_source_spec_chunks(sources, 2))
+
+        assert [spec_id for spec_id, _ in chunks] == [("nodes", 0), ("nodes", 0), ("relationships", 0)]
+        assert chunks[2][1].records[0] == {"src": "1", "dst": "2", "since": "2020"}
+
+
+class TestBatchUploadSources:
+    def test_upload(self, people_csv, knows_csv):
+        sources = {
+            "nodes": [{"path": people_csv, "labels": ["Person"], "key": "person_id"}],
+            "relationships": [
+                {
+                    "path": knows_csv,
+                    "delimiter": ";",
+                    "type": "KNOWS",
+                    "from_node": {"record_key": "src", "node_key": "person_id", "node_label": "Person"},
+                    "to_node": {"record_key": "dst", "node_key": "person_id", "node_label": "Person"},
+                }
+            ],
+        }
+        fake = FakeNeo4j(sleep=None)
+        with fake.patch():
+            result = batch_upload_sources(CONFIG, sources)
+
+        assert result.was_successful
+        assert result.nodes_created == 3
+        assert result.relationships_created == 2
+        assert [s.records_total for s in result.specs] == [3, 2]
+
+
+class TestParquetSource:
+    def test_record_batches(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        path = str(tmp_path / "people.parquet")
+        pq.write_table(pa.table({"id": [1, 2, 3], "name": ["a", "b", "c"]}), path)
+        source = NodesSource(path=path, labels=["Person"], key="uid", rename={"id": "uid"})
+
+        chunks = list(iter_source_records(source, 2))
+        assert chunks == [[{"uid": 1, "name": "a"}, {"uid": 2, "name": "b"}], [{"uid": 3, "name": "c"}]]
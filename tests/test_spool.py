@@ -0,0 +1,102 @@
+import datetime
+import pytest
+from neo4j_uploader import write_spool, upload_spool, batch_upload
+from neo4j_uploader.fake_driver import FakeNeo4j
+from neo4j_uploader._spool import iter_spool, read_spool_index
+
+CONFIG = {"neo4j_uri": "bolt://fake", "neo4j_password": "pw", "max_batch_size": 2}
+
+DATA = {
+    "nodes": [
+        {
+            "labels": ["Person"],
+            "key": "uid",
+            "records": [{"uid": "a", "age": 1}, {"uid": "b"}, {"uid": "c", "tags": ["x"]}],
+        }
+    ],
+    "relationships": [
+        {
+            "type": "KNOWS",
+            "from_node": {"record_key": "_from", "node_key": "uid"},
+            "to_node": {"record_key": "_to", "node_key": "uid"},
+            "records": [{"_from": "a", "_to": "b"}],
+        }
+    ],
+}
+
+
+class TestSpool:
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "upload.spool")
+        specs = write_spool(CONFIG, DATA, path)
+
+        assert [(s.name, s.batches_total, s.records_total) for s in specs] == [
+            ("Person", 2, 3),
+            ("KNOWS", 1, 1),
+        ]
+        batches = list(iter_spool(path))
+        assert [(b[0], b[1]) for b in batches] == [(0, 2), (0, 1), (1, 1)]
+        assert batches[0][2].startswith("WITH [")
+        assert batches[0][3]["age_b0n0"] == 1
+
+        index, create_only = read_spool_index(path)
+        assert index == specs
+        assert create_only is False
+
+    def test_upload_matches_direct_upload(self, tmp_path):
+        path = str(tmp_path / "upload.spool")
+        write_spool(CONFIG, DATA, path)
+
+        spooled, direct = FakeNeo4j(sleep=None), FakeNeo4j(sleep=None)
+        with spooled.patch():
+            result = upload_spool(CONFIG, path)
+        with direct.patch():
+            expected = batch_upload(CONFIG, DATA)
+
+        assert result.was_successful
+        assert result.records_total == 3
+        assert result.specs[0].records_completed == 3
+        assert (result.nodes_created, result.relationships_created, result.properties_set) == (
+            expected.nodes_created,
+            expected.relationships_created,
+            expected.properties_set,
+        )
+
+    def test_incomplete_spool(self, tmp_path):
+        path = tmp_path / "upload.spool"
+        write_spool(CONFIG, DATA, str(path))
+        path.write_bytes(path.read_bytes()[:-3])
+
+        with pytest.raises(ValueError):
+            read_spool_index(str(path))
+
+    def test_not_a_spool(self, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"something else")
+
+        with pytest.raises(ValueError):
+            list(iter_spool(str(path)))
+
+    def test_failed_write_removes_temporary_file(self, tmp_path):
+        path = tmp_path / "upload.spool"
+        data = {"nodes": [{"labels": ["Person"], "key": "uid", "records": [{"uid": "a", "blob": object()}]}]}
+
+        with pytest.raises(TypeError):
+            write_spool(CONFIG, data, str(path))
+        assert list(tmp_path.iterdir()) == []
+
+    def test_native_temporal_round_trip(self, tmp_path):
+        path = str(tmp_path / "upload.spool")
+        values = {
+            "born": datetime.date(2000, 1, 2),
+            "seen": datetime.datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=datetime.timezone.utc),
+            "opens": datetime.time(9, 30),
+            "wait": datetime.timedelta(days=1, seconds=2, microseconds=3),
+        }
+        data = {"nodes": [{"labels": ["Person"], "key": "uid", "records": [{"uid": "a", **values}]}]}
+        write_spool(CONFIG, data, path)
+
+        params = list(iter_spool(path))[0][3]
+        for key, value in values.items():
+            assert params[f"{key}_b0n0"] == value
+            assert type(params[f"{key}_b0n0"]) is type(value)
@@ -0,0 +1,129 @@
+import gzip
+import json
+import pytest
+from neo4j_uploader import batch_upload, batch_upload_file
+from neo4j_uploader.errors import InvalidPayloadError
+from neo4j_uploader.fake_driver import FakeNeo4j
+from neo4j_uploader.synthetic import SyntheticGraphConfig, write_ndjson
+from neo4j_uploader import _streaming
+from neo4j_uploader._streaming import iter_json_spec_chunks, iter_ndjson_spec_chunks
+
+SAMPLE = "samples/batch_upload_data.json"
+CONFIG = {"neo4j_uri": "bolt://fake", "neo4j_password": "pw", "max_batch_size": 2}
+
+
+def write_json(path, data):
+    path.write_text(json.dumps(data, indent=2))
+    return str(path)
+
+
+class TestJSONSpecChunks:
+    def test_chunks_sample_file(self, monkeypatch):
+        # Tiny reads so values span buffer refills
+        monkeypatch.setattr(_streaming, "_READ_SIZE", 7)
+        with open(SAMPLE) as f:
+            expected = json.load(f)
+
+        chunks = list(iter_json_spec_chunks(SAMPLE, 1))
+        first_id, first = chunks[0]
+        assert first_id == ("nodes", 0)
+        assert first.records == expected["nodes"][0]["records"][:1]
+        total = sum(len(s["records"]) for s in expected["nodes"] + expected["relationships"])
+        assert sum(len(spec.records) for _, spec in chunks) == total
+
+    def test_records_before_fields_are_held(self, tmp_path):
+        path = write_json(
+            tmp_path / "data.json",
+            {"nodes": [{"records": [{"uid": 1}, {"uid": 2}, {"uid": 3}], "labels": ["N"], "key": "uid"}]},
+        )
+        chunks = list(iter_json_spec_chunks(path, 2))
+        assert [len(spec.records) for _, spec in chunks] == [2, 1]
+
+    def test_field_after_streamed_records(self, tmp_path):
+        path = write_json(
+            tmp_path / "data.json",
+            {"nodes": [{"labels": ["N"], "key": "uid", "records": [{"uid": 1}], "dedupe": False}]},
+        )
+        with pytest.raises(InvalidPayloadError):
+            list(iter_json_spec_chunks(path, 2))
+
+    def test_truncated_file(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text('{"nodes": [{"labels": ["N"], "key": "uid", "records": [{"uid": 1}')
+        with pytest.raises(InvalidPayloadError):
+            list(iter_json_spec_chunks(str(path), 2))
+
+
+class TestNDJSONSpecChunks:
+    def test_nodes_flushed_before_relationships(self, tmp_path):
+        lines = [
+            {"spec": "N", "nodes": {"labels": ["N"], "key": "uid"}},
+            {"spec": "R", "relationships": {
+                "type": "R",
+                "from_node": {"record_key": "f", "node_key": "uid"},
+                "to_node": {"record_key": "t", "node_key": "uid"},
+            }},
+            {"spec": "N", "record": {"uid": 1}},
+            {"spec": "R", "record": {"f": 1, "t": 2}},
+            {"spec": "N", "record": {"uid": 2}},
+        ]
+        path = tmp_path / "data.ndjson"
+        path.write_text("\n".join(json.dumps(l) for l in lines))
+
+        chunks = list(iter_ndjson_spec_chunks(str(path), 10))
+        assert [name for name, _ in chunks] == ["N", "R"]
+        assert len(chunks[0][1].records) == 2
+
+    def test_undeclared_spec(self, tmp_path):
+        path = tmp_path / "data.ndjson"
+        path.write_text(json.dumps({"spec": "X", "record": {}}))
+        with pytest.raises(InvalidPayloadError):
+            list(iter_ndjson_spec_chunks(str(path), 10))
+
+
+class TestBatchUploadFile:
+    def test_matches_batch_upload(self, tmp_path):
+        with open(SAMPLE) as f:
+            data = json.load(f)
+        gz = tmp_path / "data.json.gz"
+        with gzip.open(gz, "wt") as f:
+            json.dump(data, f)
+
+        streamed, direct = FakeNeo4j(sleep=None), FakeNeo4j(sleep=None)
+        with streamed.patch():
+            result = batch_upload_file(CONFIG, str(gz))
+        with direct.patch():
+            expected = batch_upload(CONFIG, data)
+
+        assert result.was_successful
+        assert (result.nodes_created, result.relationships_created) == (
+            expected.nodes_created,
+            expected.relationships_created,
+        )
+        assert [s.records_total for s in result.specs] == [s.records_total for s in expected.specs]
+
+    def test_ndjson(self, tmp_path):
+        path = str(tmp_path / "graph.ndjson")
+        config = SyntheticGraphConfig(node_count=50, fan_out=1.0)
+        write_ndjson(config, path)
+
+        fake = FakeNeo4j(sleep=None)
+        with fake.patch():
+            result = batch_upload_file({**CONFIG, "max_batch_size": 10}, path)
+
+        assert result.was_successful
+        assert fake.node_count() == 50
+        assert result.specs[0].records_total == 50
+
+    def test_invalid_file_not_reset(self, tmp_path):
+        fake = FakeNeo4j(sleep=None)
+        with fake.patch():
+            batch_upload(CONFIG, {"nodes": [{"labels": ["N"], "key": "uid", "records": [{"uid": 1}]}]})
+            for data in ("{not json", json.dumps({"nodes": [{"labels": ["N"], "records": [{"uid": 2}]}]})):
+                path = tmp_path / "data.json"
+                path.write_text(data)
+                with pytest.raises(InvalidPayloadError):
+                    batch_upload_file({**CONFIG, "overwrite": True}, str(path))
+
+        # Parsing failed before the reset
+        assert fake.node_count() == 1
@@ -0,0 +1,100 @@
+import json
+import pytest
+from pydantic import ValidationError
+from neo4j_uploader.models import GraphData
+from neo4j_uploader.synthetic import (
+    SyntheticGraphConfig,
+    iter_node_records,
+    iter_relationship_records,
+    generate_graph_data,
+    write_ndjson,
+    write_json,
+)
+
+
+class TestSyntheticRecords:
+    def test_node_records_count_and_width(self):
+        config = SyntheticGraphConfig(node_count=10, property_width=3)
+        records = list(iter_node_records(config))
+        assert len(records) == 10
+        assert records[0]["uid"] == "Label0-0"
+        assert len(records[0]) == 4
+
+    def test_node_records_split_across_labels(self):
+        config = SyntheticGraphConfig(node_count=5, label_count=2)
+        assert len(list(iter_node_records(config, 0))) == 3
+        assert len(list(iter_node_records(config, 1))) == 2
+
+    def test_records_are_reproducible(self):
+        config = SyntheticGraphConfig(node_count=20, seed=7)
+        assert list(iter_node_records(config)) == list(iter_node_records(config))
+
+    def test_duplicate_ratio(self):
+        config = SyntheticGraphConfig(node_count=1000, duplicate_ratio=0.5)
+        records = list(iter_node_records(config))
+        unique = {r["uid"] for r in records}
+        # Duplicates are added, every node still exists
+        assert unique == {f"Label0-{i}" for i in range(1000)}
+        assert 1700 < len(records) < 2300
+
+    def test_duplicate_relationships_reference_nodes(self):
+        config = SyntheticGraphConfig(node_count=20, duplicate_ratio=0.5)
+        keys = {r["uid"] for r in iter_node_records(config)}
+        assert len(keys) == 20
+        for r in iter_relationship_records(config):
+            assert r["_from_uid"] in keys and r["_to_uid"] in keys
+
+    def test_property_types_required(self):
+        with pytest.raises(ValidationError):
+            SyntheticGraphConfig(property_types=[])
+
+    def test_relationship_fan_out(self):
+        config = SyntheticGraphConfig(node_count=100, fan_out=3)
+        records = list(iter_relationship_records(config))
+        assert len(records) == 300
+        assert records[0]["_from_uid"].startswith("Label0-")
+
+    def test_power_law_skews_endpoints(self):
+        config = SyntheticGraphConfig(node_count=1000, fan_out=5, property_width=0)
+        records = list(iter_relationship_records(config))
+        hits = sum(1 for r in records if r["_to_uid"] == "Label0-0")
+        assert hits > len(records) * 0.1
+
+    def test_uniform_endpoints(self):
+        config = SyntheticGraphConfig(
+            node_count=1000, fan_out=5, property_width=0, distribution="uniform"
+        )
+        records = list(iter_relationship_records(config))
+        hits = sum(1 for r in records if r["_to_uid"] == "Label0-0")
+        assert hits < len(records) * 0.01
+
+
+class TestSyntheticOutput:
+    def test_generate_graph_data(self):
+        config = SyntheticGraphConfig(node_count=10, label_count=2, relationship_type_count=2)
+        gd = generate_graph_data(config)
+        assert isinstance(gd, GraphData)
+        assert len(gd.nodes) == 2
+        assert len(gd.relationships) == 2
+        assert gd.relationships[1].from_node.node_label == "Label1"
+        assert gd.relationships[1].to_node.node_label == "Label0"
+
+    def test_write_ndjson(self, tmp_path):
+        config = SyntheticGraphConfig(node_count=4, fan_out=1)
+        path = str(tmp_path / "graph.ndjson")
+        assert write_ndjson(config, path) == 8
+        lines = [json.loads(l) for l in open(path)]
+        assert lines[0] == {"spec": "Label0", "nodes": {"labels": ["Label0"], "key": "uid"}}
+        assert lines[1]["spec"] == "Label0"
+        assert "record" in lines[1]
+        assert "relationships" in lines[5]
+
+    def test_write_json_matches_graph_data(self, tmp_path):
+        config = SyntheticGraphConfig(node_count=6, label_count=2, relationship_type_count=1)
+        path = str(tmp_path / "graph.json.gz")
+        write_json(config, path)
+        import gzip
+
+        with gzip.open(path, "rt") as f:
+            loaded = GraphData.model_validate(json.load(f))
+        assert loaded == generate_graph_data(config)
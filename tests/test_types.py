@@ -0,0 +1,137 @@
+from neo4j.spatial import WGS84Point
+from neo4j.time import Date, DateTime, Duration
+from neo4j_uploader import batch_upload, write_spool, upload_spool
+from neo4j_uploader.fake_driver import FakeNeo4j
+from neo4j_uploader.models import Neo4jConfig, Nodes, NullPolicy, Relationships
+from neo4j_uploader._property_types import (
+    converted_records,
+    infer_property_types,
+    property_converters,
+)
+from neo4j_uploader._queries import chunked_query
+
+CONFIG = {"neo4j_uri": "bolt://fake", "neo4j_password": "pw", "max_batch_size": 2}
+
+RECORDS = [
+    {
+        "uid": "2024-01-01",
+        "born": "1990-05-17",
+        "seen": "2024-01-02T03:04:05Z",
+        "tenure": "P1Y2M",
+        "home": {"lat": 59.9, "lon": 10.7},
+        "name": "Ann",
+    },
+    {
+        "uid": "2024-01-02",
+        "born": None,
+        "seen": "2024-01-03 10:00",
+        "tenure": "PT36H",
+        "home": {"latitude": 51.5, "longitude": -0.1},
+        "name": "2024-01-01",
+    },
+]
+
+
+def nodes(**kwargs) -> Nodes:
+    return Nodes(labels=["Person"], key="uid", records=RECORDS, **kwargs)
+
+
+class TestInference:
+    def test_infer(self):
+        assert infer_property_types(nodes(), NullPolicy()) == {
+            "born": "date",
+            "seen": "datetime",
+            "tenure": "duration",
+            "home": "point",
+        }
+
+    def test_relationship_references_skipped(self):
+        spec = Relationships(
+            type="MET",
+            from_node={"record_key": "a", "node_key": "day", "node_label": "Day"},
+            to_node={"record_key": "b", "node_key": "day", "node_label": "Day"},
+            records=[{"a": "2024-01-01", "b": "2024-01-02", "on": "2024-01-03"}],
+        )
+        assert infer_property_types(spec, NullPolicy()) == {"on": "date"}
+
+    def test_values_must_convert(self):
+        spec = Nodes(
+            labels=["Person"],
+            key="uid",
+            records=[
+                {"uid": 1, "born": "2024-02-30", "seen": "2024-01-02T03:04:05+0100"},
+                {"uid": 2, "born": "2024-02-28", "seen": "2024-01-02 03:04-05"},
+            ],
+        )
+        assert infer_property_types(spec, NullPolicy()) == {"seen": "datetime"}
+
+        spec.infer_types = True
+        records = converted_records(spec.records, property_converters(spec, NullPolicy()))
+        assert records[0]["seen"] == DateTime.from_iso_format("2024-01-02T03:04:05+01:00")
+        assert records[1]["seen"] == DateTime.from_iso_format("2024-01-02T03:04:00-05:00")
+
+    def test_explicit_types_override(self):
+        spec = nodes(infer_types=True, property_types={"seen": "string", "name": "date"})
+        assert set(property_converters(spec, NullPolicy())) == {
+            "born",
+            "tenure",
+            "home",
+            "name",
+        }
+        assert property_converters(nodes(), NullPolicy()) == {}
+
+
+class TestConversion:
+    def test_converted_records(self):
+        spec = nodes(infer_types=True)
+        records = converted_records(RECORDS, property_converters(spec, NullPolicy()))
+
+        assert records[0]["born"] == Date(1990, 5, 17)
+        assert records[1]["born"] is None
+        assert records[0]["seen"] == DateTime.from_iso_format("2024-01-02T03:04:05+00:00")
+        assert records[1]["seen"] == DateTime(2024, 1, 3, 10, 0)
+        assert records[0]["tenure"] == Duration(years=1, months=2)
+        assert records[1]["home"] == WGS84Point((-0.1, 51.5))
+        # Records are copied, keys untouched
+        assert RECORDS[0]["born"] == "1990-05-17"
+        assert records[0]["uid"] == "2024-01-01"
+
+    def test_invalid_values_unchanged(self):
+        spec = nodes(property_types={"name": "date"})
+        records = converted_records(RECORDS, property_converters(spec, NullPolicy()))
+        assert records[0]["name"] == "Ann"
+        assert records[1]["name"] == Date(2024, 1, 1)
+
+    def test_query_params(self):
+        config = Neo4jConfig(neo4j_uri="bolt://fake", neo4j_password="pw")
+        [(_, params)] = chunked_query(nodes(infer_types=True), config)
+        assert params["born_b0n0"] == Date(1990, 5, 17)
+        assert params["home_b0n1"] == WGS84Point((-0.1, 51.5))
+
+
+def test_spool_round_trip(tmp_path):
+    data = {"nodes": [{"labels": ["Person"], "key": "uid", "records": RECORDS, "infer_types": True}]}
+    path = str(tmp_path / "upload.spool")
+    write_spool(CONFIG, data, path)
+
+    fake = FakeNeo4j(sleep=None, record_queries=True)
+    with fake.patch():
+        result = upload_spool(CONFIG, path)
+    assert result.was_successful
+    assert result.nodes_created == 2
+
+    # Typed values are replayed as they were generated, not as plain lists or strings
+    params = fake.executed[0][1]
+    assert params["home_b0n0"] == WGS84Point((10.7, 59.9))
+    assert isinstance(params["home_b0n0"], WGS84Point)
+    assert params["born_b0n0"] == Date(1990, 5, 17)
+    assert isinstance(params["seen_b0n0"], DateTime)
+
+
+def test_upload():
+    data = {"nodes": [{"labels": ["Person"], "key": "uid", "records": RECORDS, "infer_types": True}]}
+    fake = FakeNeo4j(sleep=None)
+    with fake.patch():
+        result = batch_upload(CONFIG, data)
+    assert result.was_successful
+    assert result.nodes_created == 2
@@ -135,6 +135,12 @@ class TestPropSubquery:
         assert query == expected_query
         assert params == expected_params
 
+    def test_prop_subquery_null_policy(self):
+        from neo4j_uploader.models import NullPolicy
+        record = {"a": "N/A", "b": "null"}
+        query, params = prop_subquery(record, null_policy=NullPolicy(sentinels=["n/a"]))
+        assert params == {"b_": "null"}
+
 class TestUploadNodeRecordsQuery:
 
     def test_upload_node_records_query_with_no_nodes(self):
@@ -0,0 +1,74 @@
+import pytest
+from neo4j_uploader import batch_upload
+from neo4j_uploader.errors import InvalidPayloadError
+from neo4j_uploader.fake_driver import FakeNeo4j
+from neo4j_uploader._validation import _sampled, graph_data
+
+KNOWS = {
+    "type": "KNOWS",
+    "from_node": {"record_key": "src", "node_key": "uid", "node_label": "Person"},
+    "to_node": {"record_key": "dst", "node_key": "uid", "node_label": "Person"},
+}
+
+
+def payload():
+    return {
+        "nodes": [{"labels": ["Person"], "key": "uid", "records": [{"uid": i} for i in range(5)]}],
+        "relationships": [{**KNOWS, "records": [{"src": 0, "dst": 1}]}],
+    }
+
+
+class TestSpecOnly:
+    def test_records_not_copied(self):
+        data = payload()
+        gdata = graph_data(data, "spec-only")
+
+        assert gdata.nodes[0].records is data["nodes"][0]["records"]
+        assert gdata.relationships[0].records is data["relationships"][0]["records"]
+        assert gdata.relationships[0].from_node.node_key == "uid"
+        # Full validation copies each record
+        assert graph_data(data).nodes[0].records[0] is not data["nodes"][0]["records"][0]
+
+    def test_spec_fields_validated(self):
+        data = payload()
+        del data["nodes"][0]["key"]
+        with pytest.raises(Exception):
+            graph_data(data, "spec-only")
+
+    def test_missing_key(self):
+        data = payload()
+        data["nodes"][0]["records"][-1] = {"name": "a"}
+        with pytest.raises(ValueError, match="missing key 'uid'"):
+            graph_data(data, "spec-only")
+
+        data = payload()
+        data["relationships"][0]["records"] = [{"src": 0}]
+        with pytest.raises(ValueError, match="missing key 'dst'"):
+            graph_data(data, "spec-only")
+
+    def test_records_list(self):
+        data = payload()
+        data["nodes"][0]["records"] = ({"uid": 1},)
+        with pytest.raises(ValueError, match="must be a list"):
+            graph_data(data, "spec-only")
+
+    def test_sample(self):
+        records = list(range(1000))
+        sample = _sampled(records, 10)
+        assert len(sample) == 10
+        assert sample[0] == 0 and sample[-1] == 999
+        assert _sampled(records[:5], 10) == records[:5]
+
+
+def test_upload():
+    config = {"neo4j_uri": "bolt://fake", "neo4j_password": "pw", "validation": "spec-only"}
+    fake = FakeNeo4j(sleep=None)
+    with fake.patch():
+        result = batch_upload(config, payload())
+        assert result.nodes_created == 5
+        assert result.relationships_created == 1
+
+        data = payload()
+        data["nodes"][0]["records"].append({"name": "a"})
+        with pytest.raises(InvalidPayloadError):
+            batch_upload(config, data)
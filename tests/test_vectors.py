@@ -0,0 +1,75 @@
+import pytest
+from neo4j_uploader import batch_upload
+from neo4j_uploader.errors import InvalidPayloadError
+from neo4j_uploader.fake_driver import FakeNeo4j
+from neo4j_uploader.models import Neo4jConfig, Nodes
+from neo4j_uploader._queries import iter_chunked_query
+from neo4j_uploader._vectors import vector_index_query, vector_values
+
+CONFIG = {"neo4j_uri": "bolt://fake", "neo4j_password": "pw", "max_batch_size": 2, "vector_batch_size": 2}
+
+
+def docs_spec(count: int = 3) -> dict:
+    return {
+        "labels": ["Doc"],
+        "key": "id",
+        "vector_properties": [{"name": "embedding", "dimensions": 3}],
+        "records": [{"id": i, "title": f"t{i}", "embedding": [0.1 * i, 0.2, 0.3]} for i in range(count)],
+    }
+
+
+class TestVectorValues:
+    def test_lists(self):
+        assert vector_values([1, 2, 3], 3) == [1.0, 2.0, 3.0]
+        assert vector_values((0.5, 0.5), 2) == [0.5, 0.5]
+
+    def test_wrong_dimensions(self):
+        with pytest.raises(InvalidPayloadError, match="3 dimensions, got 2"):
+            vector_values([1.0, 2.0], 3)
+        with pytest.raises(InvalidPayloadError):
+            vector_values("abc", 3)
+
+    def test_numpy(self):
+        np = pytest.importorskip("numpy")
+        assert vector_values(np.array([1, 2], dtype=np.float32), 2) == [1.0, 2.0]
+
+    def test_index_query(self):
+        nodes = Nodes.model_validate(docs_spec())
+        query = vector_index_query("Doc", nodes.vector_properties[0])
+        assert query.startswith("CREATE VECTOR INDEX `Doc_embedding_vector` IF NOT EXISTS\nFOR (n:`Doc`) ON (n.`embedding`)")
+        assert "`vector.dimensions`: 3, `vector.similarity_function`: 'cosine'" in query
+
+
+class TestVectorBatches:
+    def test_separate_batches(self):
+        config = Neo4jConfig.model_validate(CONFIG)
+        batches = list(iter_chunked_query(Nodes.model_validate(docs_spec()), config))
+
+        # Two property batches, the index and two embedding batches
+        assert [len(chunk) for chunk, _, _, _ in batches] == [2, 1, 0, 0, 0]
+        # Rows written by each batch, including embedding rows
+        assert [rows for _, _, _, rows in batches] == [2, 1, 0, 2, 1]
+        assert "embedding" not in batches[0][1]
+        assert batches[2][1].startswith("CREATE VECTOR INDEX")
+        assert "db.create.setNodeVectorProperty(n, $property, row[1])" in batches[3][1]
+        assert batches[3][2] == {"rows": [[0, [0.0, 0.2, 0.3]], [1, [0.1, 0.2, 0.3]]], "property": "embedding"}
+        assert len(batches[4][2]["rows"]) == 1
+
+    def test_upload(self):
+        fake = FakeNeo4j(sleep=None)
+        with fake.patch():
+            result = batch_upload(CONFIG, {"nodes": [docs_spec()]})
+
+        assert result.was_successful
+        assert result.nodes_created == 3
+        # id and title per node, then one embedding each
+        assert result.properties_set == 9
+        assert result.specs[0].records_total == 3
+        assert "Doc_embedding_vector" in fake.indexes["neo4j"]
+
+    def test_invalid_embedding(self):
+        data = docs_spec()
+        data["records"][1]["embedding"] = [1.0]
+        with FakeNeo4j(sleep=None).patch():
+            with pytest.raises(InvalidPayloadError):
+                batch_upload(CONFIG, {"nodes": [data]})